@@ -2,6 +2,8 @@
 LLM API Package - Unified interface for multiple LLM providers
 """
 
+import importlib
+
 from .base import CallModel
 from .data_classes import (
     BaseRequest, BaseResponse,
@@ -17,21 +19,29 @@ from .exceptions import (
     LLMError, LLMAPIError, LLMValidationError,
     LLMRateLimitError, LLMAuthenticationError
 )
-# Provider imports are optional because some dependencies may not be installed
-try:  # pragma: no cover - optional dependency
-    from .providers.claude import ClaudeModel
-except ModuleNotFoundError:  # pragma: no cover - dependency not available
-    ClaudeModel = None  # type: ignore
+# Providers are resolved lazily: importing one pulls in its SDK (anthropic,
+# google-genai, openai/httpx), which should only happen when it is used.
+# A provider whose SDK is not installed resolves to None.
+_PROVIDERS = {
+    'ClaudeModel': 'claude',
+    'GeminiModel': 'gemini',
+    'OpenAIModel': 'openai',
+}
+
 
-try:  # pragma: no cover - optional dependency
-    from .providers.gemini import GeminiModel
-except ModuleNotFoundError:  # pragma: no cover - dependency not available
-    GeminiModel = None  # type: ignore
+def __getattr__(name):
+    module_name = _PROVIDERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(f'.providers.{module_name}', __name__)
+    except ModuleNotFoundError:  # pragma: no cover - dependency not available
+        value = None
+    else:
+        value = getattr(module, name)
+    globals()[name] = value
+    return value
 
-try:
-    from .providers.openai import OpenAIModel
-except ModuleNotFoundError:  # pragma: no cover - dependency not available
-    OpenAIModel = None  # type: ignore
 
 __version__ = "1.0.0"
 __all__ = [
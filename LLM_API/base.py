@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from .data_classes import (
     BaseRequest,
@@ -16,10 +18,75 @@ from .data_classes import (
     WebSearchRequest,
     WebSearchResponse,
 )
+from .tracing import annotate_response, span
+from .usage import extract_usage, record_call
+
+_INSTRUMENTED_METHODS = (
+    "generate_content",
+    "generate_structured_output",
+    "web_search",
+    "function_calling",
+)
+
+
+def _instrument(operation: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a provider API method with a span, usage normalisation and metering."""
+
+    @functools.wraps(method)
+    def wrapper(self, request, *args, **kwargs):
+        model = getattr(request, "model_name", None) or self.model_name
+        with span(
+            f"llm.{operation}",
+            provider=type(self).__name__,
+            model=model,
+            prompt_chars=len(getattr(request, "prompt", "") or ""),
+        ) as current:
+            started = time.perf_counter()
+            try:
+                response = method(self, request, *args, **kwargs)
+            except Exception as exc:
+                record_call(
+                    provider=type(self).__name__,
+                    model=model,
+                    usage=None,
+                    latency_ms=(time.perf_counter() - started) * 1000,
+                    error=str(exc),
+                )
+                raise
+            usage = extract_usage(getattr(response, "raw_response", None))
+            if usage is not None:
+                response.usage = usage
+            annotate_response(current, response)
+            record_call(
+                provider=type(self).__name__,
+                model=model,
+                usage=response.usage,
+                latency_ms=(time.perf_counter() - started) * 1000,
+                error=getattr(response, "error", None),
+            )
+        return response
+
+    wrapper.__llm_instrumented__ = True  # type: ignore[attr-defined]
+    return wrapper
 
 
 class CallModel(ABC):
-    """Abstract base class for all LLM providers."""
+    """Abstract base class for all LLM providers.
+
+    The API methods a subclass defines are wrapped automatically: each call
+    opens an ``llm.<method>`` tracing span (:mod:`LLM_API.tracing`), gets
+    its ``usage`` normalised from the raw SDK response and is recorded in the
+    usage meters (:mod:`LLM_API.usage`).
+    """
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        for name in _INSTRUMENTED_METHODS:
+            method = cls.__dict__.get(name)
+            if not callable(method) or getattr(method, "__isabstractmethod__", False):
+                continue
+            if not getattr(method, "__llm_instrumented__", False):
+                setattr(cls, name, _instrument(name, method))
 
     def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None):
         self.api_key = api_key
@@ -0,0 +1,103 @@
+"""Process-wide registry of provider SDK clients.
+
+SDK clients own an HTTP connection pool. Creating one per
+:class:`~LLM_API.base.CallModel` instance throws away keep-alive connections
+and TLS sessions, so providers obtain their client from :func:`get_client`,
+which returns one shared, thread-safe client per
+``(provider, api_key, base_url)``. :func:`pooled_http_client` builds the
+HTTP client handed to the OpenAI and Anthropic SDKs from their own
+``DefaultHttpxClient`` (keeping the SDK's timeouts and redirect handling),
+with connection-pool limits sized for many concurrent slide generations.
+The Gemini client is shared the same way but keeps the pool settings of
+the ``google-genai`` SDK.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+try:  # pragma: no cover - optional dependency
+    import httpx
+except ModuleNotFoundError:  # pragma: no cover - dependency not available
+    httpx = None  # type: ignore[assignment]
+
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+KEEPALIVE_EXPIRY_S = 90.0
+
+_lock = threading.Lock()
+_clients: Dict[Tuple[str, str, Optional[str]], Any] = {}
+_env_loaded = False
+
+
+def load_environment() -> None:
+    """Load ``.env`` once per process instead of on every client setup."""
+
+    global _env_loaded
+    if _env_loaded:
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    _env_loaded = True
+
+
+def _key(provider: str, api_key: str, base_url: Optional[str]) -> Tuple[str, str, Optional[str]]:
+    # Only a digest of the API key is kept in the registry.
+    return provider, hashlib.sha256(api_key.encode("utf-8")).hexdigest(), base_url
+
+
+def get_client(
+    provider: str,
+    api_key: str,
+    factory: Callable[[], Any],
+    *,
+    base_url: Optional[str] = None,
+) -> Any:
+    """Return the shared client for ``provider``, creating it with ``factory`` once."""
+
+    key = _key(provider, api_key, base_url)
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = factory()
+            _clients[key] = client
+    return client
+
+
+def pooled_http_client(client_class: Type[Any]) -> Any:
+    """Return ``client_class`` (an SDK's ``DefaultHttpxClient``) with the registry's pool limits.
+
+    Only the limits are overridden; timeouts and redirect handling keep the
+    SDK defaults. Returns ``None`` (letting the SDK build its own client)
+    when httpx is not installed.
+    """
+
+    if httpx is None:
+        return None
+    return client_class(
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY_S,
+        ),
+    )
+
+
+def client_count() -> int:
+    with _lock:
+        return len(_clients)
+
+
+def close_clients() -> None:
+    """Close and forget every registered client (e.g. at shutdown or in tests)."""
+
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        close = getattr(client, "close", None)
+        if callable(close):
+            close()
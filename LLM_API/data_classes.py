@@ -29,6 +29,8 @@ class BaseRequest:
     model_name: Optional[str] = None
     max_tokens: Optional[int] = None
     temperature: Optional[float] = None
+    # promptの先頭からこの文字数までは複数リクエストで共通（プロンプトキャッシュの対象）
+    cacheable_prefix_chars: Optional[int] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式に変換（APIリクエスト用）"""
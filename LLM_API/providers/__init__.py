@@ -1,9 +1,25 @@
 """
 LLM Provider Implementations
+
+Providers are imported on first access so that using one provider does not
+import the SDKs of the others.
 """
 
-from .claude import ClaudeModel
-from .gemini import GeminiModel
-from .openai import OpenAIModel
+import importlib
+
+_PROVIDERS = {
+    'ClaudeModel': 'claude',
+    'GeminiModel': 'gemini',
+    'OpenAIModel': 'openai',
+}
+
+__all__ = ['ClaudeModel', 'GeminiModel', 'OpenAIModel']
+
 
-__all__ = ['ClaudeModel', 'GeminiModel', 'OpenAIModel']
\ No newline at end of file
+def __getattr__(name):
+    module_name = _PROVIDERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
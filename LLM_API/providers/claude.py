@@ -3,7 +3,6 @@ from typing import Optional, Dict, Any, List
 import time
 import json
 import anthropic
-from dotenv import load_dotenv
 from ..data_classes import (
     BaseRequest, BaseResponse,
     WebSearchRequest, WebSearchResponse,
@@ -13,6 +12,7 @@ from ..data_classes import (
     ProviderConfig, ToolChoice, Citation, SearchResult
 )
 from ..base import CallModel
+from ..clients import get_client, load_environment, pooled_http_client
 
 
 class ClaudeModel(CallModel):
@@ -36,7 +36,7 @@ class ClaudeModel(CallModel):
     
     def setup_client(self):
         """Setup Anthropic client"""
-        load_dotenv()
+        load_environment()
         api_key = self.api_key or os.getenv('ANTHROPIC_API_KEY')
         
         if not api_key:
@@ -45,12 +45,41 @@ class ClaudeModel(CallModel):
                 "or pass it as api_key parameter to ClaudeModel constructor."
             )
         
-        self.client = anthropic.Anthropic(api_key=api_key)
+        base_url = os.getenv('ANTHROPIC_BASE_URL')
+        self.client = get_client(
+            'anthropic',
+            api_key,
+            lambda: anthropic.Anthropic(
+                api_key=api_key,
+                base_url=base_url,
+                http_client=pooled_http_client(anthropic.DefaultHttpxClient),
+            ),
+            base_url=base_url,
+        )
+    
+    def _user_content(self, request: BaseRequest) -> Any:
+        """Return the user message content, marking a shared prompt prefix as cacheable.
+
+        When ``request.cacheable_prefix_chars`` is set the prompt is split into
+        two text blocks and a ``cache_control`` breakpoint is placed after the
+        prefix, so later requests with the same prefix read it from the cache.
+        """
+        prefix_chars = request.cacheable_prefix_chars or 0
+        if not 0 < prefix_chars < len(request.prompt):
+            return request.prompt
+        return [
+            {
+                "type": "text",
+                "text": request.prompt[:prefix_chars],
+                "cache_control": {"type": "ephemeral"},
+            },
+            {"type": "text", "text": request.prompt[prefix_chars:]},
+        ]
     
     def generate_content(self, request: BaseRequest) -> BaseResponse:
         """Generate content using data classes"""
         try:
-            messages = [{"role": "user", "content": request.prompt}]
+            messages = [{"role": "user", "content": self._user_content(request)}]
             
             request_params: Dict[str, Any] = {
                 "model": request.model_name or self.model_name,
@@ -69,19 +98,10 @@ class ClaudeModel(CallModel):
                 if content.type == "text":
                     text_content += content.text
             
-            # Extract usage information
-            usage = None
-            if hasattr(response, 'usage'):
-                usage = {
-                    "prompt_tokens": getattr(response.usage, 'input_tokens', 0),
-                    "completion_tokens": getattr(response.usage, 'output_tokens', 0),
-                    "total_tokens": getattr(response.usage, 'input_tokens', 0) + getattr(response.usage, 'output_tokens', 0)
-                }
-            
+            # usage is filled from raw_response by CallModel (LLM_API.usage)
             return BaseResponse(
                 text=text_content,
                 model_used=request.model_name or self.model_name,
-                usage=usage,
                 raw_response=response
             )
             
@@ -101,7 +121,7 @@ class ClaudeModel(CallModel):
                 "input_schema": request.schema
             }]
             
-            messages = [{"role": "user", "content": request.prompt}]
+            messages = [{"role": "user", "content": self._user_content(request)}]
             
             response = self.client.messages.create(
                 model=request.model_name or self.model_name,
@@ -157,7 +177,7 @@ class ClaudeModel(CallModel):
             if request.user_location:
                 tool_config["user_location"] = request.user_location
             
-            messages = [{"role": "user", "content": request.prompt}]
+            messages = [{"role": "user", "content": self._user_content(request)}]
             
             response = self.client.messages.create(
                 model=request.model_name or self.model_name,
@@ -209,7 +229,7 @@ class ClaudeModel(CallModel):
                 }
                 tools.append(tool)
             
-            messages = [{"role": "user", "content": request.prompt}]
+            messages = [{"role": "user", "content": self._user_content(request)}]
             
             # Set tool choice based on request
             tool_choice: Dict[str, Any] = {"type": "auto"}
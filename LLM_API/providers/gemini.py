@@ -5,7 +5,6 @@ from google import genai
 from google.genai import types
 import httpx
 import json
-from dotenv import load_dotenv
 from ..data_classes import (
     BaseRequest, BaseResponse,
     WebSearchRequest, WebSearchResponse, Citation, SearchResult,
@@ -14,6 +13,7 @@ from ..data_classes import (
     ProviderConfig
 )
 from ..base import CallModel
+from ..clients import get_client, load_environment
 
 
 class GeminiModel(CallModel):
@@ -37,14 +37,14 @@ class GeminiModel(CallModel):
     
     def setup_client(self):
         """Setup Gemini client"""
-        load_dotenv()
+        load_environment()
         api_key = self.api_key or os.getenv('GEMINI_API_KEY')
         if not api_key:
             raise ValueError(
                 "Gemini API key is required. Please set GEMINI_API_KEY in your .env file "
                 "or pass it as api_key parameter to GeminiModel constructor."
             )
-        self.client = genai.Client(api_key=api_key)
+        self.client = get_client('gemini', api_key, lambda: genai.Client(api_key=api_key))
     
     def generate_content(self, request: BaseRequest) -> BaseResponse:
         """Generate content using data classes"""
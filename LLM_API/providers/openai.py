@@ -1,8 +1,7 @@
 import os
 from typing import Optional, Dict, Any, List
-from openai import OpenAI
+from openai import DefaultHttpxClient, OpenAI
 import json
-from dotenv import load_dotenv
 from ..data_classes import (
     BaseRequest, BaseResponse,
     WebSearchRequest, WebSearchResponse, Citation,
@@ -11,6 +10,7 @@ from ..data_classes import (
     ProviderConfig
 )
 from ..base import CallModel
+from ..clients import get_client, load_environment, pooled_http_client
 
 
 class OpenAIModel(CallModel):
@@ -32,14 +32,24 @@ class OpenAIModel(CallModel):
         )
     
     def setup_client(self):
-        load_dotenv()
+        load_environment()
         api_key = self.api_key or os.getenv('OPENAI_API_KEY')
         if not api_key:
             raise ValueError(
                 "OpenAI API key is required. Please set OPENAI_API_KEY in your .env file "
                 "or pass it as api_key parameter to OpenAIModel constructor."
             )
-        self.client = OpenAI(api_key=api_key)
+        base_url = os.getenv('OPENAI_BASE_URL')
+        self.client = get_client(
+            'openai',
+            api_key,
+            lambda: OpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                http_client=pooled_http_client(DefaultHttpxClient),
+            ),
+            base_url=base_url,
+        )
     
     def generate_content(self, request: BaseRequest) -> BaseResponse:
         try:
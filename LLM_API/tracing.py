@@ -0,0 +1,255 @@
+"""Lightweight tracing spans shared by the providers and the slide pipeline.
+
+``span()`` opens a timed, nestable span; nesting follows the current
+context, so spans opened inside another span become its children. Finished
+spans go to the configured exporter:
+
+* ``otel``: spans are mirrored into OpenTelemetry's global tracer (requires
+  the ``opentelemetry-api`` package; the SDK/exporter setup is left to the
+  application).
+* ``jsonl``: one JSON object per finished span is appended to a file.
+* ``none``: spans are only delivered to active :func:`collect_spans` blocks.
+
+The default (``LLM_TRACE_EXPORTER=auto``) uses OpenTelemetry when it is
+installed and otherwise writes JSONL to ``LLM_TRACE_FILE`` when that variable
+is set.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:  # pragma: no cover - optional dependency
+    from opentelemetry import trace as otel_trace
+except ModuleNotFoundError:  # pragma: no cover - dependency not available
+    otel_trace = None  # type: ignore[assignment]
+
+
+@dataclass
+class Span:
+    """A finished or in-flight unit of work."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    start_time: float = 0.0
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+    _start_ns: int = field(default=0, repr=False)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+            "attributes": dict(self.attributes),
+        }
+
+
+class JsonlSpanExporter:
+    """Append finished spans to a JSON Lines file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def on_start(self, span: Span) -> Any:
+        return None
+
+    def on_end(self, span: Span, handle: Any) -> None:
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as stream:
+                stream.write(line + "\n")
+
+
+class OpenTelemetrySpanExporter:
+    """Mirror spans into OpenTelemetry's global tracer provider."""
+
+    def __init__(self, instrumentation_name: str = "geotra_slide") -> None:
+        if otel_trace is None:
+            raise RuntimeError(
+                "opentelemetryのインポートに失敗しました。'opentelemetry-api' パッケージをインストールしてください。"
+            )
+        self._tracer = otel_trace.get_tracer(instrumentation_name)
+
+    def on_start(self, span: Span) -> Any:
+        manager = self._tracer.start_as_current_span(span.name, end_on_exit=True)
+        return manager, manager.__enter__()
+
+    def on_end(self, span: Span, handle: Any) -> None:
+        manager, otel_span = handle
+        for key, value in span.attributes.items():
+            if value is not None:
+                otel_span.set_attribute(key, value if isinstance(value, (bool, int, float, str)) else str(value))
+        if span.error:
+            otel_span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, span.error))
+        manager.__exit__(None, None, None)
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("llm_trace_current_span", default=None)
+_collectors: ContextVar[Tuple[List[Span], ...]] = ContextVar("llm_trace_collectors", default=())
+_exporter_lock = threading.Lock()
+_exporter: Any = None
+_exporter_configured = False
+
+
+def configure_tracing(exporter: Optional[str] = None, *, path: Optional[Path] = None) -> Any:
+    """Select the span exporter and return it.
+
+    ``exporter`` is ``"auto"``, ``"otel"``, ``"jsonl"`` or ``"none"``; when
+    omitted it is read from ``LLM_TRACE_EXPORTER``. ``path`` (or
+    ``LLM_TRACE_FILE``) is the JSONL destination.
+    """
+
+    global _exporter, _exporter_configured
+    mode = (exporter or os.getenv("LLM_TRACE_EXPORTER") or "auto").lower()
+    trace_file = path or os.getenv("LLM_TRACE_FILE")
+    if mode == "auto":
+        mode = "otel" if otel_trace is not None else ("jsonl" if trace_file else "none")
+
+    if mode == "otel":
+        selected: Any = OpenTelemetrySpanExporter()
+    elif mode == "jsonl":
+        selected = JsonlSpanExporter(Path(trace_file or "traces.jsonl"))
+    elif mode == "none":
+        selected = None
+    else:
+        raise ValueError(f"Unknown trace exporter: {mode}")
+
+    with _exporter_lock:
+        _exporter = selected
+        _exporter_configured = True
+    return selected
+
+
+def _get_exporter() -> Any:
+    # configure_tracing takes the lock itself; a racing first call at worst
+    # resolves the same environment-derived exporter twice.
+    if not _exporter_configured:
+        configure_tracing()
+    return _exporter
+
+
+def current_span() -> Optional[Span]:
+    """Return the innermost open span, if any."""
+
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """Time the enclosed block as a child of the current span."""
+
+    parent = _current_span.get()
+    item = Span(
+        name=name,
+        trace_id=parent.trace_id if parent else uuid.uuid4().hex,
+        span_id=uuid.uuid4().hex[:16],
+        parent_id=parent.span_id if parent else None,
+        attributes=attributes,
+        start_time=time.time(),
+        _start_ns=time.perf_counter_ns(),
+    )
+    exporter = _get_exporter()
+    handle = exporter.on_start(item) if exporter is not None else None
+    token = _current_span.set(item)
+    try:
+        yield item
+    except BaseException as exc:
+        item.error = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        _current_span.reset(token)
+        item.duration_ms = (time.perf_counter_ns() - item._start_ns) / 1e6
+        for collected in _collectors.get():
+            collected.append(item)
+        if exporter is not None:
+            exporter.on_end(item, handle)
+
+
+@contextmanager
+def collect_spans() -> Iterator[List[Span]]:
+    """Collect every span finished inside the block (in finishing order)."""
+
+    collected: List[Span] = []
+    token = _collectors.set(_collectors.get() + (collected,))
+    try:
+        yield collected
+    finally:
+        _collectors.reset(token)
+
+
+def timing_breakdown(root: Span, spans: Iterable[Span]) -> Dict[str, Any]:
+    """Summarise ``spans`` below ``root`` for storing alongside a document.
+
+    Returns the root duration, a ``count``/``total_ms`` entry per span name
+    and the duration of each direct child carrying a ``slide_id`` attribute.
+    """
+
+    by_name: Dict[str, Dict[str, float]] = {}
+    by_slide: Dict[str, float] = {}
+    for item in spans:
+        if item is root or item.duration_ms is None:
+            continue
+        entry = by_name.setdefault(item.name, {"count": 0, "total_ms": 0.0})
+        entry["count"] += 1
+        entry["total_ms"] = round(entry["total_ms"] + item.duration_ms, 3)
+        slide_id = item.attributes.get("slide_id")
+        if slide_id and item.parent_id == root.span_id:
+            by_slide[slide_id] = round(by_slide.get(slide_id, 0.0) + item.duration_ms, 3)
+    return {
+        "total_ms": round(root.duration_ms or 0.0, 3),
+        "spans": by_name,
+        "slides": by_slide,
+    }
+
+
+@contextmanager
+def traced_stage(metadata: Dict[str, Any], stage: str, name: str, **attributes: Any) -> Iterator[Span]:
+    """Open span ``name`` and store its breakdown in ``metadata["timings"][stage]``."""
+
+    with collect_spans() as spans:
+        with span(name, **attributes) as root:
+            yield root
+    metadata.setdefault("timings", {})[stage] = timing_breakdown(root, spans)
+
+
+# ----------------------------------------------------------------------
+# Provider instrumentation
+# ----------------------------------------------------------------------
+
+def annotate_response(item: Span, response: Any) -> None:
+    """Copy token usage and error details from a provider response."""
+
+    usage = getattr(response, "usage", None)
+    if isinstance(usage, dict):
+        for key, value in usage.items():
+            if isinstance(value, (int, float)):
+                item.set_attribute(f"tokens.{key}", value)
+        item.set_attribute("cache_hit", usage.get("cached_tokens", 0) > 0)
+    error = getattr(response, "error", None)
+    if error:
+        item.error = str(error)
@@ -0,0 +1,226 @@
+"""Provider-agnostic token usage, cost estimates and usage meters.
+
+Every provider SDK reports usage differently. :func:`extract_usage` maps the
+raw responses of Anthropic, OpenAI (Responses and Chat Completions) and
+Gemini onto one dictionary::
+
+    {"prompt_tokens", "completion_tokens", "total_tokens", "cached_tokens"}
+
+``prompt_tokens`` always includes cached input tokens. Calls made through a
+:class:`~LLM_API.base.CallModel` are recorded in the process-wide counters
+(:func:`process_usage`) and in every :class:`UsageMeter` opened with
+:func:`metered` in the calling context.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+USAGE_KEYS = ("prompt_tokens", "completion_tokens", "total_tokens", "cached_tokens")
+
+# USD per million tokens: (input, cached input, output). Longest prefix wins.
+# The figures are list prices used for estimates only.
+MODEL_PRICING: Dict[str, Tuple[float, float, float]] = {
+    "gpt-5-mini": (0.25, 0.025, 2.0),
+    "gpt-5": (1.25, 0.125, 10.0),
+    "gpt-4.1": (2.0, 0.5, 8.0),
+    "gpt-4o-mini": (0.15, 0.075, 0.6),
+    "gpt-4o": (2.5, 1.25, 10.0),
+    "claude-3-5-haiku": (0.8, 0.08, 4.0),
+    "claude-3-5-sonnet": (3.0, 0.3, 15.0),
+    "claude-sonnet-4": (3.0, 0.3, 15.0),
+    "claude-opus-4": (15.0, 1.5, 75.0),
+    "gemini-2.5-flash": (0.3, 0.075, 2.5),
+    "gemini-2.5-pro": (1.25, 0.31, 10.0),
+}
+
+
+def _field(source: Any, name: str) -> Any:
+    if isinstance(source, dict):
+        return source.get(name)
+    return getattr(source, name, None)
+
+
+def _int(value: Any) -> int:
+    return int(value) if isinstance(value, (int, float)) else 0
+
+
+def extract_usage(raw_response: Any) -> Optional[Dict[str, int]]:
+    """Return normalised token usage for a raw SDK response, if it has any."""
+
+    if raw_response is None:
+        return None
+
+    metadata = _field(raw_response, "usage_metadata")
+    if metadata is not None:  # Gemini
+        prompt = _int(_field(metadata, "prompt_token_count"))
+        completion = _int(_field(metadata, "candidates_token_count")) + _int(
+            _field(metadata, "thoughts_token_count")
+        )
+        cached = _int(_field(metadata, "cached_content_token_count"))
+        total = _int(_field(metadata, "total_token_count")) or prompt + completion
+        return _usage(prompt, completion, cached, total)
+
+    usage = _field(raw_response, "usage")
+    if usage is None:
+        return None
+
+    if _field(usage, "prompt_tokens") is not None:  # OpenAI Chat Completions
+        prompt = _int(_field(usage, "prompt_tokens"))
+        completion = _int(_field(usage, "completion_tokens"))
+        cached = _int(_field(_field(usage, "prompt_tokens_details") or {}, "cached_tokens"))
+        return _usage(prompt, completion, cached, _int(_field(usage, "total_tokens")))
+
+    input_tokens = _int(_field(usage, "input_tokens"))
+    completion = _int(_field(usage, "output_tokens"))
+    details = _field(usage, "input_tokens_details")
+    if details is not None:  # OpenAI Responses API: input_tokens includes cached
+        cached = _int(_field(details, "cached_tokens"))
+        return _usage(input_tokens, completion, cached, _int(_field(usage, "total_tokens")))
+
+    # Anthropic: input_tokens excludes cache reads and cache writes.
+    cached = _int(_field(usage, "cache_read_input_tokens"))
+    prompt = input_tokens + cached + _int(_field(usage, "cache_creation_input_tokens"))
+    return _usage(prompt, completion, cached)
+
+
+def _usage(prompt: int, completion: int, cached: int, total: int = 0) -> Dict[str, int]:
+    return {
+        "prompt_tokens": prompt,
+        "completion_tokens": completion,
+        "total_tokens": total or prompt + completion,
+        "cached_tokens": cached,
+    }
+
+
+def estimate_cost(model: Optional[str], usage: Optional[Dict[str, int]]) -> Optional[float]:
+    """Estimate the USD cost of ``usage`` for ``model`` (``None`` if unknown)."""
+
+    if not model or not usage:
+        return None
+    matches = [prefix for prefix in MODEL_PRICING if model.startswith(prefix)]
+    if not matches:
+        return None
+    input_price, cached_price, output_price = MODEL_PRICING[max(matches, key=len)]
+    cached = usage.get("cached_tokens", 0)
+    uncached = max(usage.get("prompt_tokens", 0) - cached, 0)
+    return (
+        uncached * input_price
+        + cached * cached_price
+        + usage.get("completion_tokens", 0) * output_price
+    ) / 1_000_000
+
+
+def _empty_totals() -> Dict[str, float]:
+    totals: Dict[str, float] = {key: 0 for key in USAGE_KEYS}
+    totals.update({"requests": 0, "errors": 0, "latency_ms": 0.0, "cost_usd": 0.0})
+    return totals
+
+
+def _add(totals: Dict[str, float], record: Dict[str, Any]) -> None:
+    for key in USAGE_KEYS:
+        totals[key] += (record.get("usage") or {}).get(key, 0)
+    totals["requests"] += 1
+    totals["errors"] += 1 if record.get("error") else 0
+    totals["latency_ms"] = round(totals["latency_ms"] + record.get("latency_ms", 0.0), 3)
+    totals["cost_usd"] = round(totals["cost_usd"] + (record.get("cost_usd") or 0.0), 6)
+
+
+class UsageMeter:
+    """Accumulate usage records, overall and per attribution key (e.g. slide id)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.total = _empty_totals()
+        self.by_key: Dict[str, Dict[str, float]] = {}
+
+    def record(self, record: Dict[str, Any], key: Optional[str] = None) -> None:
+        with self._lock:
+            _add(self.total, record)
+            if key is not None:
+                _add(self.by_key.setdefault(key, _empty_totals()), record)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "total": dict(self.total),
+                "by_key": {key: dict(value) for key, value in self.by_key.items()},
+            }
+
+
+_PROCESS_METER = UsageMeter()
+_meters: ContextVar[Tuple[UsageMeter, ...]] = ContextVar("llm_usage_meters", default=())
+_attribution: ContextVar[Optional[str]] = ContextVar("llm_usage_attribution", default=None)
+
+
+@contextmanager
+def metered() -> Iterator[UsageMeter]:
+    """Record every provider call made inside the block into a fresh meter."""
+
+    meter = UsageMeter()
+    token = _meters.set(_meters.get() + (meter,))
+    try:
+        yield meter
+    finally:
+        _meters.reset(token)
+
+
+@contextmanager
+def attribute_usage(key: str) -> Iterator[None]:
+    """Attribute provider calls inside the block to ``key`` (usually a slide id)."""
+
+    token = _attribution.set(key)
+    try:
+        yield
+    finally:
+        _attribution.reset(token)
+
+
+def store_usage(metadata: Dict[str, Any], stage: str, meter: UsageMeter) -> None:
+    """Store ``meter`` under ``metadata["usage"][stage]`` and refresh the deck total."""
+
+    snapshot = meter.snapshot()
+    usage = metadata.setdefault("usage", {})
+    usage[stage] = {"total": snapshot["total"], "slides": snapshot["by_key"]}
+    deck = _empty_totals()
+    for name, entry in usage.items():
+        if name == "deck":
+            continue
+        for key, value in entry["total"].items():
+            deck[key] = round(deck[key] + value, 6)
+    usage["deck"] = deck
+
+
+def record_call(
+    *,
+    provider: str,
+    model: Optional[str],
+    usage: Optional[Dict[str, int]],
+    latency_ms: float,
+    error: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Record one provider call in the process counters and active meters."""
+
+    record = {
+        "provider": provider,
+        "model": model,
+        "usage": usage,
+        "latency_ms": latency_ms,
+        "cost_usd": estimate_cost(model, usage),
+        "error": error,
+    }
+    _PROCESS_METER.record(record, provider)
+    key = _attribution.get()
+    for meter in _meters.get():
+        meter.record(record, key)
+    return record
+
+
+def process_usage() -> Dict[str, Any]:
+    """Return process-wide usage totals, overall and per provider."""
+
+    snapshot = _PROCESS_METER.snapshot()
+    return {"total": snapshot["total"], "providers": snapshot["by_key"]}
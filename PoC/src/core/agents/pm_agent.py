@@ -2,6 +2,8 @@
 
 import uuid
 import json
+import weakref
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 
@@ -13,27 +15,129 @@ from ..renderer import PPTXRenderer
 DECK_TEMPLATES_PATH = Path(__file__).parent.parent / "deck_templates.json"
 # --- ▲▲▲ 修正ここまで ▲▲▲ ---
 
+# --- ▼▼▼ キーワード転置インデックス（一度だけ構築して使い回す） ▼▼▼ ---
+TAG_WEIGHT = 5
+CATEGORY_WEIGHT = 3
+
+
+class _SubstringIndex:
+    """
+    登録テキストの全部分文字列 → 項目番号 の転置インデックス。
+    「キーワードがテキストに含まれるか」という従来の部分一致判定を、
+    辞書引き1回に置き換える。
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self.max_key_length = 0
+
+    def add_substrings(self, item: int, text: str) -> None:
+        """text の全部分文字列で item を引けるようにする（同一 item は1回だけ数える）。"""
+        text = text.lower()
+        for start in range(len(text)):
+            for end in range(start + 1, len(text) + 1):
+                self._postings.setdefault(text[start:end], {})[item] = 1
+        self.max_key_length = max(self.max_key_length, len(text))
+
+    def add_key(self, item: int, key: str) -> None:
+        """key そのものを登録する（同じ key の重複登録は件数として数える）。"""
+        key = key.lower()
+        postings = self._postings.setdefault(key, {})
+        postings[item] = postings.get(item, 0) + 1
+        self.max_key_length = max(self.max_key_length, len(key))
+
+    def lookup(self, key: str) -> Dict[int, int]:
+        return self._postings.get(key, {})
+
+    def keys_in(self, text: str) -> List[str]:
+        """text の部分文字列のうち登録済みの key を返す。"""
+        text = text.lower()
+        found = set()
+        for start in range(len(text)):
+            for end in range(start + 1, min(len(text), start + self.max_key_length) + 1):
+                if text[start:end] in self._postings:
+                    found.add(text[start:end])
+        return list(found)
+
+
+def _best_item(scores: Dict[int, int]) -> int | None:
+    """最高得点の項目番号を返す。同点なら登録順で先のものを優先する。"""
+    if not scores:
+        return None
+    best = min(scores, key=lambda item: (-scores[item], item))
+    return best if scores[best] > 0 else None
+
+
+class DeckTemplateIndex:
+    """デッキテンプレートのキーワード → テンプレート の転置インデックス。"""
+
+    def __init__(self, templates: List[Dict]):
+        self.templates = templates
+        self._keywords = _SubstringIndex()
+        for i, template in enumerate(templates):
+            for keyword in template.get("keywords", []):
+                self._keywords.add_key(i, keyword)
+
+    def best_match(self, user_request: str) -> Dict | None:
+        scores: Dict[int, int] = {}
+        for keyword in self._keywords.keys_in(user_request):
+            for i, count in self._keywords.lookup(keyword).items():
+                scores[i] = scores.get(i, 0) + count
+        best = _best_item(scores)
+        return self.templates[best] if best is not None else None
+
+
+class SlideAssetIndex:
+    """スライド資産のタグ／カテゴリの部分文字列 → 資産 の転置インデックス。"""
+
+    def __init__(self, slide_asset_map: Dict[str, dict]):
+        self.asset_ids = list(slide_asset_map)
+        self._tags = _SubstringIndex()
+        self._categories = _SubstringIndex()
+        for i, asset_info in enumerate(slide_asset_map.values()):
+            # 従来どおり空白区切りで連結したタグ列を対象にし、タグの境界をまたぐ一致も拾う
+            self._tags.add_substrings(i, " ".join(asset_info.get("tags", [])))
+            self._categories.add_substrings(i, asset_info.get("category", ""))
+
+    def best_match(self, search_query: str) -> str | None:
+        scores: Dict[int, int] = {}
+        for keyword in {keyword.strip().lower() for keyword in search_query.split(',')}:
+            if not keyword:
+                continue
+            for i in self._tags.lookup(keyword):
+                scores[i] = scores.get(i, 0) + TAG_WEIGHT
+            for i in self._categories.lookup(keyword):
+                scores[i] = scores.get(i, 0) + CATEGORY_WEIGHT
+        best = _best_item(scores)
+        return self.asset_ids[best] if best is not None else None
+
+
+_asset_indexes: "weakref.WeakKeyDictionary[PPTXRenderer, SlideAssetIndex]" = weakref.WeakKeyDictionary()
+
+
+def _asset_index_for(renderer: PPTXRenderer) -> SlideAssetIndex:
+    index = _asset_indexes.get(renderer)
+    if index is None:
+        index = _asset_indexes[renderer] = SlideAssetIndex(renderer.slide_asset_map)
+    return index
+
+
+@lru_cache(maxsize=1)
+def _deck_template_index() -> DeckTemplateIndex:
+    return DeckTemplateIndex(_load_deck_templates())
+# --- ▲▲▲ 転置インデックスここまで ▲▲▲ ---
+
+
 def _load_deck_templates() -> List[Dict]:
     """deck_templates.jsonを読み込む"""
     with open(DECK_TEMPLATES_PATH, 'r', encoding='utf-8') as f:
         return json.load(f)["deck_templates"]
 
-def _find_best_deck_template(user_request: str, templates: List[Dict]) -> Dict | None:
+def _find_best_deck_template(user_request: str, index: DeckTemplateIndex) -> Dict | None:
     """ユーザーリクエストに最も合致するデッキテンプレートを探す"""
     print(f"  ユーザーリクエスト '{user_request}' に最適なデッキテンプレートを検索中...")
-    best_template = None
-    max_score = 0
-    request_text = user_request.lower()
-
-    for template in templates:
-        score = 0
-        for keyword in template.get("keywords", []):
-            if keyword.lower() in request_text:
-                score += 1
-        if score > max_score:
-            max_score = score
-            best_template = template
-    
+    best_template = index.best_match(user_request)
+
     if best_template:
         print(f"  最適なテンプレートとして '{best_template['name']}' を選択しました。")
     else:
@@ -41,26 +145,8 @@ def _find_best_deck_template(user_request: str, templates: List[Dict]) -> Dict |
     return best_template
 
 def _select_slide_asset(search_query: str, renderer: PPTXRenderer) -> str | None:
-    """特定のトピック（検索クエリ）に最も合致するスライド資産を検索する"""
-    best_match_id = None
-    max_score = 0
-    keywords = {keyword.strip().lower() for keyword in search_query.split(',')}
-
-    for asset_id, asset_info in renderer.slide_asset_map.items():
-        score = 0
-        search_tags = " ".join(asset_info.get("tags", [])).lower()
-        search_category = asset_info.get("category", "").lower()
-        
-        for keyword in keywords:
-            if not keyword: continue
-            if keyword in search_tags: score += 5
-            if keyword in search_category: score += 3
-        
-        if score > max_score:
-            max_score = score
-            best_match_id = asset_id
-    
-    return best_match_id
+    """特定のトピック（検索クエリ）に最も合致するスライド資産を検索する（タグ一致 5点、カテゴリ一致 3点）"""
+    return _asset_index_for(renderer).best_match(search_query)
 
 def deck_planner_node(state: schemas.GraphState, renderer: PPTXRenderer) -> Dict:
     """
@@ -70,8 +156,7 @@ def deck_planner_node(state: schemas.GraphState, renderer: PPTXRenderer) -> Dict
     print("--- 🧠 デッキプランナーを実行中... ---")
     user_request = state["initial_user_request"]
     
-    deck_templates = _load_deck_templates()
-    selected_template = _find_best_deck_template(user_request, deck_templates)
+    selected_template = _find_best_deck_template(user_request, _deck_template_index())
     
     if not selected_template:
         # TODO: テンプレートが見つからない場合のフォールバック処理
@@ -1,12 +1,59 @@
 # src/core/agents/researcher.py
 
-from typing import List, Dict
+import os
 import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional
 from .. import schemas
 from ..tools.file_search import markdown_search_tool
+from ..tools.summarizer import summarize
 from ..tools.web_search import web_search_tool
 
-def research_agent_node(state: schemas.GraphState) -> Dict[str, schemas.ResearchReport]:
+# --- ▼▼▼ 並列リサーチの設定 ▼▼▼ ---
+# 情報源ごとのタイムアウト（秒）。超過した情報源は空の結果として扱う
+INTERNAL_SEARCH_TIMEOUT = float(os.getenv("INTERNAL_SEARCH_TIMEOUT", "30"))
+WEB_SEARCH_TIMEOUT = float(os.getenv("WEB_SEARCH_TIMEOUT", "15"))
+# タイムアウトした呼び出しでノードが止まらないよう、プール全体を共有する
+_research_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="research")
+# --- ▲▲▲ 設定ここまで ▲▲▲ ---
+
+
+def _result_or_default(future: Future, deadline: float, label: str, default: Any) -> Any:
+    """締め切りまでに完了した結果を返し、超過・失敗時は default を返す。"""
+    try:
+        return future.result(timeout=max(0.0, deadline - time.monotonic()))
+    except FutureTimeoutError:
+        # 未着手ならキューから外す。実行中の呼び出しは中断できないため、完了まで待たずに見切る
+        future.cancel()
+        print(f"  [警告] {label} がタイムアウトしました。部分的な結果で続行します。")
+    except Exception as e:
+        print(f"  [警告] {label} でエラーが発生しました: {e}")
+    return default
+
+def summarize_for_blueprint(bp: schemas.SlideBlueprint, query: str) -> str:
+    """
+    スライド設計図1枚分の内部文書要約を作成する。
+    設計図の search_query（無ければタイトル＋ユーザー要求）で内部文書を検索し、
+    TF-IDF で重要度の高い文を最大3文まとめる。
+    """
+    sq = getattr(bp, "search_query", None) or f"{bp.slide_title} {query}"
+    bp_findings = markdown_search_tool.search(sq, top_k=3)
+    if not bp_findings:
+        return "関連する要約は見つかりませんでした。"
+    # 簡易要約: TF-IDF で重要度の高い文を最大3文選び、再構成する
+    top = summarize([f.content for f in bp_findings], top_k=3)
+    if not top:
+        return "関連する要約は見つかりませんでした。"
+    # 2-3文で統合要約
+    y = []
+    for s in top:
+        s = re.sub(r"(といった|など).*", "などを整理。", s)
+        y.append(s)
+    return "。".join(y)[:300]
+
+
+def research_agent_node(state: schemas.GraphState, include_slide_summaries: bool = True) -> Dict[str, schemas.ResearchReport]:
     """
     リサーチャーエージェントとして機能するLangGraphのノード。
     ユーザーの要求に基づいて内部文書とウェブを検索し、結果を統合して
@@ -14,6 +61,7 @@ def research_agent_node(state: schemas.GraphState) -> Dict[str, schemas.Research
 
     Args:
         state: 現在のGraphState。'initial_user_request' を使用する。
+        include_slide_summaries: Falseの場合、スライドごとの要約は作成しない。
 
     Returns:
         更新されたStateの一部。'research_report' キーを含む辞書。
@@ -26,13 +74,35 @@ def research_agent_node(state: schemas.GraphState) -> Dict[str, schemas.Research
         print("  [警告] リサーチクエリが見つかりません。リサーチをスキップします。")
         return {}
 
-    # --- 責務の分離: 各ツールを独立して呼び出す ---
+    # --- 責務の分離: 各ツールを独立して、かつ並列に呼び出す ---
+    # ウェブ検索はモデルに依存しないため先に開始する
+    web_started = time.monotonic()
+    web_future = _research_executor.submit(web_search_tool.search, query)
+
+    # モデルとインデックスの読み込みは締め切りの計測に含めない
+    internal_future: Optional[Future] = None
+    summary_futures: Dict[str, Future] = {}
+    try:
+        markdown_search_tool.ensure_loaded()
+    except Exception as e:
+        print(f"  [警告] 内部文書の検索ツールを初期化できませんでした: {e}")
+    else:
+        internal_future = _research_executor.submit(markdown_search_tool.search, query)
+        if include_slide_summaries:
+            for bp in state.get("slide_blueprints", []):
+                summary_futures[bp.slide_id] = _research_executor.submit(summarize_for_blueprint, bp, query)
+    started = time.monotonic()
+
     # 1. 内部文書の検索（全体）
-    internal_findings = markdown_search_tool.search(query)
+    internal_findings = []
+    if internal_future is not None:
+        internal_findings = _result_or_default(
+            internal_future, started + INTERNAL_SEARCH_TIMEOUT, "内部文書の検索", []
+        )
     print(f"  内部文書から {len(internal_findings)} 件の情報を発見しました。")
 
     # 2. ウェブの検索
-    web_findings = web_search_tool.search(query)
+    web_findings = _result_or_default(web_future, web_started + WEB_SEARCH_TIMEOUT, "ウェブ検索", [])
     print(f"  ウェブから {len(web_findings)} 件の情報を発見しました。")
     
     # 3. 結果の統合
@@ -50,40 +120,14 @@ def research_agent_node(state: schemas.GraphState) -> Dict[str, schemas.Research
         )
         report = schemas.ResearchReport(findings=all_findings, summary=summary_text)
 
-    # 4. スライドごとの内部要約を作成
-    slide_summaries: Dict[str, str] = {}
-    blueprints = state.get("slide_blueprints", [])
-    for bp in blueprints:
-        sq = getattr(bp, "search_query", None) or f"{bp.slide_title} {query}"
-        bp_findings = markdown_search_tool.search(sq, top_k=3)
-        if not bp_findings:
-            slide_summaries[bp.slide_id] = "関連する要約は見つかりませんでした。"
-            continue
-        # 簡易要約: 連結→句点で分割→スコア付け→上位3文を再構成
-        joined = " ".join([f.content for f in bp_findings])
-        sentences = [s.strip() for s in re.split(r"[。\.]", joined) if len(s.strip()) > 10]
-        # スコア: 名詞らしきトークン頻度の合計
-        def tokenize(t: str) -> List[str]:
-            return [w for w in re.split(r"[\s、，,・:：;；()（）\-]+", t) if len(w) >= 2]
-        freq: Dict[str, int] = {}
-        for s in sentences:
-            for w in tokenize(s):
-                freq[w] = freq.get(w, 0) + 1
-        scored = []
-        for s in sentences:
-            score = sum(freq.get(w, 0) for w in tokenize(s))
-            scored.append((score, s))
-        scored.sort(reverse=True)
-        top = [s for _, s in scored[:3]]
-        if not top:
-            slide_summaries[bp.slide_id] = "関連する要約は見つかりませんでした。"
-        else:
-            # 2-3文で統合要約
-            y = []
-            for s in top:
-                s = re.sub(r"(といった|など).*", "などを整理。", s)
-                y.append(s)
-            slide_summaries[bp.slide_id] = "。".join(y)[:300]
+    # 4. スライドごとの内部要約を作成（グラフではスライド単位のワーカーが担当する）
+    slide_summaries: Dict[str, str] = {
+        slide_id: _result_or_default(
+            future, started + INTERNAL_SEARCH_TIMEOUT, f"スライド '{slide_id}' の要約",
+            "関連する要約は見つかりませんでした。",
+        )
+        for slide_id, future in summary_futures.items()
+    }
 
     print("--- ✅ リサーチレポートが完成しました ---")
     return {"research_report": report, "slide_summaries": slide_summaries}
@@ -3,9 +3,10 @@
 import json
 import re
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from .. import schemas
 from ..tools.file_search import markdown_search_tool
+from ..tools.summarizer import drop_redundant, summarize, term_index
 
 # ( _create_writer_prompt, _parse_llm_output は変更なし)
 def _create_writer_prompt(report: schemas.ResearchReport, blueprint: schemas.SlideBlueprint, asset_info: dict) -> str:
@@ -89,27 +90,11 @@ def _generate_populate_text(description: str, user_request: Optional[str]) -> st
     return _generate_fixed_text(text)
 
 
-def _tokenize(text: str) -> List[str]:
-    # 日本語・英数混在の簡易トークナイズ
-    if not text:
-        return []
-    # 句読点や記号で分割
-    parts = re.split(r"[\s\n、。,.；;:：()（）\-\[\]{}]+", text)
-    # 短すぎる語を除外
-    return [p for p in parts if len(p) >= 2]
-
-
 def _select_relevant_findings(report: schemas.ResearchReport, name: str, description: str, top_k: int = 3) -> List[Tuple[schemas.ResearchFinding, int]]:
-    query_terms = set(_tokenize((name or "") + " " + (description or "")))
-    if not query_terms:
-        return [(f, 0) for f in report.findings[:top_k]]
-    scored: List[Tuple[schemas.ResearchFinding, int]] = []
-    for f in report.findings:
-        text = f.content
-        score = sum(text.count(term) for term in query_terms)
-        scored.append((f, score))
-    scored.sort(key=lambda x: x[1], reverse=True)
-    return scored[:top_k]
+    # ファインディングの特徴量はレポート単位で一度だけ作り、プレースホルダー間で共有する
+    index = term_index(tuple(f.content for f in report.findings))
+    ranked = index.rank((name or "") + " " + (description or ""), top_k=top_k)
+    return [(report.findings[i], score) for i, score in ranked]
 
 
 def _decide_style(description: str) -> dict:
@@ -150,7 +135,7 @@ def _build_placeholder_query(slide_title: str, asset_info: dict, description: st
     return base[:500]
 
 
-def _summarize_for_placeholder(report: schemas.ResearchReport, placeholder_name: str, description: str) -> str:
+def _summarize_for_placeholder(report: schemas.ResearchReport, placeholder_name: str, description: str, avoid: Sequence[str] = ()) -> str:
     # タイトル系は短く
     if re.search(r"title|タイトル", placeholder_name, re.IGNORECASE):
         base = description or (report.summary or "")
@@ -160,25 +145,14 @@ def _summarize_for_placeholder(report: schemas.ResearchReport, placeholder_name:
 
     # 関連度の高い finding から要約
     picked = _select_relevant_findings(report, placeholder_name, description, top_k=5)
-    # picked から抽象度の高い統合要約を作る
-    raw = " ".join([f.content for f, _ in picked])
-    # 文に分割
-    sents = [s.strip() for s in re.split(r"[。\.]+", raw) if len(s.strip()) > 12]
-    # キーフレーズ抽出（頻出語）
-    tokens = _tokenize(raw)
-    freq: Dict[str, int] = {}
-    for t in tokens:
-        freq[t] = freq.get(t, 0) + 1
-    # スコアリングして上位文を選択
-    scored: List[Tuple[int, str]] = []
-    for s in sents:
-        score = sum(freq.get(w, 0) for w in _tokenize(s))
-        # 口語・不要語を抑制
-        if re.search(r"(えー|あの|えっと|ですね|ですか|はい|ええ)", s):
-            continue
-        scored.append((score, s))
-    scored.sort(reverse=True)
-    top = [s for _, s in scored[:3]]
+    # picked から TF-IDF で重要文を選ぶ（同じスライドで既に使った内容と似た文は MMR で避ける）
+    top = summarize(
+        [f.content for f, _ in picked],
+        top_k=3,
+        query=f"{placeholder_name} {description}",
+        avoid=avoid,
+        min_sentence_len=12,
+    )
     if top:
         # 抽象化: 箇条書きではなく一文に寄せる
         abstract = " / ".join([re.sub(r"(といった|など).*", "など。", s) for s in top])
@@ -190,7 +164,7 @@ def _summarize_for_placeholder(report: schemas.ResearchReport, placeholder_name:
     return base[:100]
 
 
-def _generate_from_report(report: schemas.ResearchReport, placeholder_name: str, description: str) -> str:
+def _generate_from_report(report: schemas.ResearchReport, placeholder_name: str, description: str, avoid: Sequence[str] = ()) -> str:
     # タイトル系: 説明→要約→短文化
     if re.search(r"title|タイトル", placeholder_name, re.IGNORECASE):
         base = description or (report.summary or "")
@@ -200,7 +174,7 @@ def _generate_from_report(report: schemas.ResearchReport, placeholder_name: str,
         return (base[:24] + "…") if len(base) > 24 else base
 
     # 本文系: プレースホルダー固有の関連情報から要約
-    return _summarize_for_placeholder(report, placeholder_name, description)
+    return _summarize_for_placeholder(report, placeholder_name, description, avoid)
 
 
 def writer_agent_node(state: schemas.GraphState, renderer) -> Dict[str, List[schemas.SlideBlueprint]]:
@@ -217,6 +191,24 @@ def writer_agent_node(state: schemas.GraphState, renderer) -> Dict[str, List[sch
     content_write_log: List[Dict] = []
     user_request = state.get("initial_user_request")
 
+    # --- ▼▼▼ 検索クエリを先に集め、一括で埋め込み・検索する ▼▼▼ ---
+    placeholder_queries: Dict[Tuple[str, int], str] = {}
+    for blueprint in current_blueprints:
+        asset_info = renderer.slide_asset_map.get(blueprint.asset_id)
+        if not asset_info:
+            continue
+        slide_summary = slide_summaries.get(blueprint.slide_id)
+        for ph_index, ph in enumerate(asset_info.get("placeholders", [])):
+            if ph.get("edit_policy", "generate") in ("fixed", "populate"):
+                continue
+            placeholder_queries[(blueprint.slide_id, ph_index)] = _build_placeholder_query(
+                blueprint.slide_title, asset_info, ph.get("description", ""), user_request or "", slide_summary
+            )
+    unique_queries = list(dict.fromkeys(placeholder_queries.values()))
+    batched_results = markdown_search_tool.search_many(unique_queries, top_k=5) if unique_queries else []
+    findings_by_query: Dict[str, List[schemas.ResearchFinding]] = dict(zip(unique_queries, batched_results))
+    # --- ▲▲▲ 一括検索ここまで ▲▲▲ ---
+
     for blueprint in current_blueprints:
         asset_info = renderer.slide_asset_map.get(blueprint.asset_id)
         if not asset_info:
@@ -230,9 +222,10 @@ def writer_agent_node(state: schemas.GraphState, renderer) -> Dict[str, List[sch
             item.placeholder_name: item for item in blueprint.content_map
         }
 
-        used_sentences: set[str] = set()
+        # 同じスライド内で既に書いた内容（冗長除去に使う）
+        slide_written: List[str] = []
         # 各プレースホルダーの policy に沿って内容決定
-        for ph in manifest_placeholders:
+        for ph_index, ph in enumerate(manifest_placeholders):
             ph_name = ph.get("name", "")
             edit_policy = ph.get("edit_policy", "generate")
             description = ph.get("description", "")
@@ -242,16 +235,16 @@ def writer_agent_node(state: schemas.GraphState, renderer) -> Dict[str, List[sch
             elif edit_policy == "populate":
                 content_text = _generate_populate_text(description, user_request)
             else:  # generate
-                # スライド固有の要約＋プレースホルダー由来の検索クエリで再検索
+                # スライド固有の要約＋プレースホルダー由来のクエリで一括検索した結果を参照
                 slide_summary = slide_summaries.get(blueprint.slide_id)
-                query = _build_placeholder_query(blueprint.slide_title, asset_info, description, user_request or "", slide_summary)
-                local_findings = markdown_search_tool.search(query, top_k=5) or []
+                query = placeholder_queries[(blueprint.slide_id, ph_index)]
+                local_findings = findings_by_query.get(query) or []
                 # ローカルファインディングがあればそれを主に使い、なければ全体レポート
                 if local_findings:
                     temp_report = schemas.ResearchReport(findings=local_findings, summary=slide_summary or report.summary)
-                    content_text = _generate_from_report(temp_report, ph_name, description)
+                    content_text = _generate_from_report(temp_report, ph_name, description, slide_written)
                 else:
-                    content_text = _generate_from_report(report, ph_name, description)
+                    content_text = _generate_from_report(report, ph_name, description, slide_written)
 
                 # スタイル適用と重複抑止
                 style = _decide_style(description)
@@ -261,19 +254,13 @@ def writer_agent_node(state: schemas.GraphState, renderer) -> Dict[str, List[sch
                         content_text = content_text[: style["max_len"]] + "…"
                 elif style["mode"] == "bullets":
                     lines = [ln.strip() for ln in content_text.splitlines() if ln.strip()]
-                    uniq = []
-                    for ln in lines:
-                        if ln in used_sentences:
-                            continue
-                        used_sentences.add(ln)
-                        uniq.append(ln)
-                        if len(uniq) >= style["bullet_count"]:
-                            break
+                    uniq = drop_redundant(lines, slide_written)[: style["bullet_count"]]
                     content_text = "\n".join(uniq)
                 else:  # paragraph
                     content_text = re.sub(r"\s+", " ", content_text).strip()
                     if len(content_text) > style["max_len"]:
                         content_text = content_text[: style["max_len"]] + "…"
+                slide_written.extend(ln for ln in content_text.splitlines() if ln.strip())
 
             content_item = schemas.PlaceholderContent(
                 placeholder_name=ph_name,
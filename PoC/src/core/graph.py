@@ -1,19 +1,87 @@
 # src/core/graph.py
 
+import os
+from typing import Dict, List
+
 from langgraph.graph import StateGraph, END
+from langgraph.types import Send
 from . import schemas
 from .agents.pm_agent import deck_planner_node
-from .agents.researcher import research_agent_node
+from .agents.researcher import research_agent_node, summarize_for_blueprint
 from .agents.writer import writer_agent_node
 from .renderer import PPTXRenderer
+from .tools.file_search import markdown_search_tool
+
+# スライド単位ワーカーの同時実行数の上限
+MAX_SLIDE_CONCURRENCY = int(os.getenv("SLIDE_WORKER_CONCURRENCY", "4"))
+
+
+# --- ▼▼▼ スライド単位の fan-out / fan-in ▼▼▼ ---
+def dispatch_slides(state: schemas.GraphState):
+    """設計図1枚ごとにリサーチ＋執筆のサブタスクを Send で並列に起動する。"""
+    blueprints = state.get("slide_blueprints") or []
+    if not blueprints:
+        return "merge_slides"
+    return [
+        Send("slide_worker", {**state, "slide_blueprints": [bp], "active_slide_index": index})
+        for index, bp in enumerate(blueprints)
+    ]
+
+
+def slide_worker_node(state: schemas.GraphState, renderer) -> Dict[str, dict]:
+    """1枚のスライドについて内部文書の要約を作り、その要約を使って執筆する。"""
+    blueprint = state["slide_blueprints"][0]
+    summary = summarize_for_blueprint(blueprint, state.get("initial_user_request") or "")
+    written = writer_agent_node({**state, "slide_summaries": {blueprint.slide_id: summary}}, renderer)
+    updated = (written.get("slide_blueprints") or [blueprint])[0]
+    return {
+        "slide_results": {
+            blueprint.slide_id: {
+                "index": state.get("active_slide_index", 0),
+                "blueprint": updated,
+                "summary": summary,
+                "content_write_log": written.get("content_write_log", []),
+            }
+        }
+    }
+
+
+def merge_slides_node(state: schemas.GraphState) -> Dict[str, object]:
+    """ワーカーの結果を元の設計図の順序で統合する（完了順には依存しない）。"""
+    results = state.get("slide_results") or {}
+    blueprints: List[schemas.SlideBlueprint] = []
+    slide_summaries: Dict[str, str] = {}
+    content_write_log: List[Dict] = []
+    for bp in state.get("slide_blueprints") or []:
+        result = results.get(bp.slide_id)
+        if result is None:
+            blueprints.append(bp)
+            continue
+        blueprints.append(result["blueprint"])
+        slide_summaries[bp.slide_id] = result["summary"]
+        content_write_log.extend(result["content_write_log"])
+
+    # 検索ツールが未生成ならモデルを読み込んでまで統計を出さない
+    cache_stats = markdown_search_tool.cache_stats() if markdown_search_tool.is_loaded() else {}
+    for cache_name, stats in cache_stats.items():
+        print(f"  [キャッシュ] {cache_name}: ヒット率 {stats['hit_rate']:.0%} ({stats['hits']}/{stats['hits'] + stats['misses']})")
+    return {
+        "slide_blueprints": blueprints,
+        "slide_summaries": slide_summaries,
+        "content_write_log": content_write_log,
+    }
+# --- ▲▲▲ fan-out / fan-in ここまで ▲▲▲ ---
+
 
-def create_graph():
+def create_graph(max_concurrency: int = MAX_SLIDE_CONCURRENCY):
     renderer = PPTXRenderer()
     builder = StateGraph(schemas.GraphState)
 
     builder.add_node("deck_planner", lambda state: deck_planner_node(state, renderer))
-    builder.add_node("research", research_agent_node)
-    builder.add_node("writer", lambda state: writer_agent_node(state, renderer))
+    # デッキ全体のリサーチのみ行い、スライドごとの要約はワーカーに任せる
+    builder.add_node("research", lambda state: research_agent_node(state, include_slide_summaries=False))
+    builder.add_node("slide_worker", lambda state: slide_worker_node(state, renderer))
+    builder.add_node("merge_slides", merge_slides_node)
 
     builder.set_entry_point("deck_planner")
     
@@ -31,8 +99,10 @@ def create_graph():
     )
     # --- ▲▲▲ 変更ここまで ▲▲▲ ---
 
-    builder.add_edge("research", "writer")
-    builder.add_edge("writer", END)
+    builder.add_conditional_edges("research", dispatch_slides, ["slide_worker", "merge_slides"])
+    builder.add_edge("slide_worker", "merge_slides")
+    builder.add_edge("merge_slides", END)
 
     graph = builder.compile()
-    return graph
+    # 並列ワーカーの同時実行数を制限する
+    return graph.with_config({"max_concurrency": max_concurrency})
@@ -4,10 +4,12 @@ import json
 import io
 import os
 import glob
+import logging
 import tempfile
 import subprocess
+import time
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from pptx import Presentation
 from pptx.shapes.placeholder import SlidePlaceholder
@@ -22,6 +24,24 @@ ASSETS_DIR = ROOT_DIR / "assets"
 SLIDE_LIBRARY_DIR = ASSETS_DIR / "slide_library"
 TEMPLATE_DIR = ASSETS_DIR / "templates"
 
+LOGGER = logging.getLogger(__name__)
+
+
+def _new_render_record(blueprint: schemas.SlideBlueprint) -> Dict:
+    """スライド1枚分の構造化サマリー（ログの extra と last_render_records に使う）。"""
+    return {
+        "slide_id": blueprint.slide_id,
+        "asset_id": blueprint.asset_id,
+        "status": "ok",
+        "layout": None,
+        "written": 0,
+        "warnings": [],
+        "missing_idx": [],
+        "copy_ms": 0.0,
+        "fill_ms": 0.0,
+        "total_ms": 0.0,
+    }
+
 class PPTXRenderer:
     def __init__(self):
         master_manifest_path = TEMPLATE_DIR / "master_manifest.json"
@@ -40,6 +60,8 @@ class PPTXRenderer:
             }
         
         self.master_template_path = TEMPLATE_DIR / self.master_manifest['master_template_file']
+        # 直近の render_presentation で生成したスライドごとのサマリー
+        self.last_render_records: List[Dict] = []
 
     def render_presentation(self, blueprints: List[schemas.SlideBlueprint]) -> io.BytesIO:
         prs = Presentation(self.master_template_path)
@@ -50,13 +72,26 @@ class PPTXRenderer:
                 prs.part.drop_rel(rId)
                 del prs.slides._sldIdLst[i]
 
+        records: List[Dict] = []
         for blueprint in blueprints:
+            record = _new_render_record(blueprint)
+            started = time.perf_counter()
             try:
-                print(f"\n--- Blueprint '{blueprint.asset_id}' のスライドを生成中... ---")
-                self._create_slide_from_blueprint(prs, blueprint)
-                print(f"--- Blueprint '{blueprint.asset_id}' の生成完了 ---")
+                self._create_slide_from_blueprint(prs, blueprint, record)
             except Exception as e:
+                record["status"] = "error"
+                record["warnings"].append(str(e))
                 self._add_error_slide(prs, blueprint, e)
+            record["total_ms"] = (time.perf_counter() - started) * 1000
+            records.append(record)
+            LOGGER.log(
+                logging.WARNING if record["warnings"] else logging.INFO,
+                "スライド生成 %s (asset=%s, status=%s): %d件書き込み, 警告%d件, %.1fms",
+                record["slide_id"], record["asset_id"], record["status"],
+                record["written"], len(record["warnings"]), record["total_ms"],
+                extra={"slide_render": record},
+            )
+        self.last_render_records = records
         
         pptx_io = io.BytesIO()
         prs.save(pptx_io)
@@ -100,7 +135,7 @@ class PPTXRenderer:
                 with open(png_files[idx], "rb") as imgf:
                     return imgf.read()
         except Exception as e:
-            print(f"[情報] スライドプレビュー画像の生成に失敗: {e}")
+            LOGGER.info("スライドプレビュー画像の生成に失敗: %s", e)
             return None
 
 
@@ -113,7 +148,9 @@ def _is_executable(path: str) -> bool:
 
 class PPTXRenderer(PPTXRenderer):
     # Reattach helper methods that were accidentally outdented
-    def _create_slide_from_blueprint(self, prs: Presentation, blueprint: schemas.SlideBlueprint):
+    def _create_slide_from_blueprint(self, prs: Presentation, blueprint: schemas.SlideBlueprint, record: Optional[Dict] = None):
+        if record is None:
+            record = _new_render_record(blueprint)
         asset_info = self.slide_asset_map.get(blueprint.asset_id)
         if not asset_info:
             raise ValueError(f"アセットID '{blueprint.asset_id}' がマニフェストに見つかりません。")
@@ -121,7 +158,10 @@ class PPTXRenderer(PPTXRenderer):
         source_pptx_path = SLIDE_LIBRARY_DIR / asset_info['file_name']
         source_prs = Presentation(source_pptx_path)
         
-        new_slide = self._copy_slide(source_prs, prs, 0)
+        started = time.perf_counter()
+        new_slide = self._copy_slide(source_prs, prs, 0, record)
+        record["copy_ms"] = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
 
         manifest_placeholders_by_name: Dict[str, dict] = {
             ph['name']: ph for ph in asset_info.get('placeholders', [])
@@ -130,42 +170,49 @@ class PPTXRenderer(PPTXRenderer):
             shape.placeholder_format.idx: shape for shape in new_slide.shapes if shape.is_placeholder
         }
         
-        print(f"コンテンツをプレースホルダーに書き込み中...")
+        warnings = record["warnings"]
         for content_item in blueprint.content_map:
             placeholder_name = content_item.placeholder_name
             ph_def = manifest_placeholders_by_name.get(placeholder_name)
             
             if not ph_def:
-                print(f"  [警告] マニフェストに '{placeholder_name}' の定義が見つかりません。")
+                warnings.append(f"マニフェストに '{placeholder_name}' の定義が見つかりません。")
                 continue
             
             placeholder_idx = ph_def.get('idx')
             if placeholder_idx is None:
-                print(f"  [警告] マニフェストの '{placeholder_name}' に 'idx' がありません。")
+                warnings.append(f"マニフェストの '{placeholder_name}' に 'idx' がありません。")
                 continue
 
             if placeholder_idx in placeholders_on_slide_by_idx:
                 shape = placeholders_on_slide_by_idx[placeholder_idx]
                 if shape.has_text_frame:
                     shape.text_frame.text = content_item.content
-                    print(f"  ✓ idx:{placeholder_idx} ('{placeholder_name}') にコンテンツを書き込みました。")
+                    record["written"] += 1
+                    LOGGER.debug("idx:%s ('%s') にコンテンツを書き込みました。", placeholder_idx, placeholder_name)
                 else:
-                    print(f"  [警告] プレースホルダー (idx: {placeholder_idx}) にテキストフレームがありません。")
+                    warnings.append(f"プレースホルダー (idx: {placeholder_idx}) にテキストフレームがありません。")
             else:
                 # この警告が根本原因を示唆
-                print(f"  [警告] 生成されたスライドにインデックス {placeholder_idx} ('{placeholder_name}') のプレースホルダーが見つかりませんでした。")
+                record["missing_idx"].append(placeholder_idx)
+                warnings.append(f"生成されたスライドにインデックス {placeholder_idx} ('{placeholder_name}') のプレースホルダーが見つかりませんでした。")
+        record["fill_ms"] = (time.perf_counter() - started) * 1000
 
     # --- ▼▼▼ デバッグ機能強化箇所 ▼▼▼ ---
-    def _copy_slide(self, prs_from: Presentation, prs_to: Presentation, slide_index: int):
+    def _copy_slide(self, prs_from: Presentation, prs_to: Presentation, slide_index: int, record: Optional[Dict] = None):
         source_slide = prs_from.slides[slide_index]
         source_layout_name = source_slide.slide_layout.name
-        print(f"コピー元スライドのレイアウト名: '{source_layout_name}'")
+        if record is not None:
+            record["layout"] = source_layout_name
 
-        try:
-            slide_layout = prs_to.slide_layouts.get_by_name(source_layout_name)
-            print(f"マスターテンプレートから対応レイアウト '{source_layout_name}' を発見しました。")
-        except KeyError:
-            print(f"!!! [重大な警告] レイアウト '{source_layout_name}' がマスターに見つかりません。デフォルトレイアウトを使用します。")
+        # python-pptx の get_by_name は見つからない場合 default を返す
+        slide_layout = prs_to.slide_layouts.get_by_name(source_layout_name)
+        if slide_layout is None:
+            message = f"レイアウト '{source_layout_name}' がマスターに見つかりません。デフォルトレイアウトを使用します。"
+            if record is not None:
+                record["warnings"].append(message)
+            else:
+                LOGGER.warning(message)
             slide_layout = prs_to.slide_layouts[1] 
         
         new_slide = prs_to.slides.add_slide(slide_layout)
@@ -174,8 +221,11 @@ class PPTXRenderer(PPTXRenderer):
         source_ph_indices = {shape.placeholder_format.idx for shape in source_slide.shapes if shape.is_placeholder}
         new_slide_ph_indices = {shape.placeholder_format.idx for shape in new_slide.shapes if shape.is_placeholder}
         
-        print(f"コピー元スライドのプレースホルダーidx: {sorted(list(source_ph_indices))}")
-        print(f"生成スライドのプレースホルダーidx:   {sorted(list(new_slide_ph_indices))}")
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "レイアウト '%s': コピー元idx %s / 生成スライドidx %s",
+                source_layout_name, sorted(source_ph_indices), sorted(new_slide_ph_indices),
+            )
 
         missing_indices = source_ph_indices - new_slide_ph_indices
         if missing_indices:
@@ -235,6 +285,6 @@ class PPTXRenderer(PPTXRenderer):
                 p.text = str(error)
                 p.font.size = Pt(12)
                 p.font.color.rgb = RGBColor(255, 0, 0)
-        except Exception as e_final:
-            print(f"!!! 重大なエラー: エラースライドの生成に失敗しました: {e_final}")
+        except Exception:
+            LOGGER.exception("エラースライドの生成に失敗しました (slide_id=%s)", blueprint.slide_id)
 
@@ -1,7 +1,7 @@
 # src/core/schemas.py
 
 from pydantic import BaseModel, Field
-from typing import List, Literal, Optional, TypedDict
+from typing import Annotated, List, Literal, Optional, TypedDict
 from enum import Enum
 
 # --- Enum定義 ---
@@ -36,6 +36,15 @@ class SlideBlueprint(BaseModel):
     search_query: Optional[str] = Field(default=None, description="内部文書検索に使うこのスライド固有のクエリ。")
 
 # --- LangGraph State ---
+def merge_slide_results(left: Optional[dict], right: Optional[dict]) -> dict:
+    """
+    並列に実行されるスライド単位ワーカーの結果を slide_id をキーに統合するリデューサー。
+    各ワーカーは自分のスライドのキーだけを書き込むため、統合順序に依存しない。
+    """
+    merged = dict(left or {})
+    merged.update(right or {})
+    return merged
+
 class GraphState(TypedDict):
     """
     LangGraphのStateオブジェクト。
@@ -58,3 +67,5 @@ class GraphState(TypedDict):
     content_write_log: Optional[list]
     # 追加: スライドごとの内部文書要約
     slide_summaries: Optional[dict]
+    # 追加: スライド単位ワーカーの結果（slide_id -> 結果）。合流ノードで上記キーへ反映する
+    slide_results: Annotated[dict, merge_slide_results]
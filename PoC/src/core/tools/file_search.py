@@ -1,11 +1,19 @@
 # src/core/tools/file_search.py
 
+import hashlib
+import json
+import pickle
+import threading
+import unicodedata
+from collections import OrderedDict
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
+import numpy as np
 from langchain_community.document_loaders import UnstructuredMarkdownLoader
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import FAISS
+from langchain_core.embeddings import Embeddings
 from langchain_huggingface import HuggingFaceEmbeddings
 
 from .. import schemas
@@ -15,35 +23,146 @@ DATA_DIR = ROOT_DIR / "data"
 MD_DOCUMENT_PATH = DATA_DIR / "internal_report.md"
 EMBEDDING_MODEL_NAME = "intfloat/multilingual-e5-small"
 
+# --- ▼▼▼ ベクトルインデックスの永続化設定 ▼▼▼ ---
+INDEX_DIR = ROOT_DIR / ".index_cache" / "internal_report"
+INDEX_MANIFEST_NAME = "manifest.json"
+INDEX_FORMAT_VERSION = 1
+CHUNK_SIZE = 500
+CHUNK_OVERLAP = 50
+SPLIT_SEPARATORS = ["\n\n", "\n", "。", "、", ""]
+# --- ▲▲▲ 設定ここまで ▲▲▲ ---
+
+# --- ▼▼▼ クエリ埋め込み・検索結果のキャッシュ設定 ▼▼▼ ---
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+SEARCH_RESULT_CACHE_SIZE = 512
+# --- ▲▲▲ 設定ここまで ▲▲▲ ---
+
+
+def normalize_query(query: str) -> str:
+    """キャッシュキー用にクエリを正規化する（全角半角の統一と空白の圧縮）。"""
+    return " ".join(unicodedata.normalize("NFKC", query).split())
+
+
+class _LRUCache:
+    """ヒット率を記録するスレッドセーフな LRU キャッシュ。"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._data),
+            }
+
+
+class CachedQueryEmbeddings(Embeddings):
+    """
+    クエリ埋め込みを正規化済みテキストをキーに LRU キャッシュするラッパー。
+    文書チャンクの埋め込み（インデックス構築時）はキャッシュせずにそのまま委譲する。
+    """
+
+    def __init__(self, embeddings: Embeddings, maxsize: int = QUERY_EMBEDDING_CACHE_SIZE):
+        self.embeddings = embeddings
+        self.cache = _LRUCache(maxsize)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_queries([text])[0]
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """複数クエリを埋め込む。キャッシュに無いものだけを1回の順伝播でまとめて計算する。"""
+        keys = [normalize_query(text) for text in texts]
+        vectors: Dict[str, List[float]] = {}
+        missing: List[str] = []
+        for key in keys:
+            if key in vectors or key in missing:
+                continue
+            cached = self.cache.get(key)
+            if cached is None:
+                missing.append(key)
+            else:
+                vectors[key] = cached
+        if missing:
+            for key, vector in zip(missing, self.embeddings.embed_documents(missing)):
+                vector = list(vector)
+                self.cache.put(key, vector)
+                vectors[key] = vector
+        return [vectors[key] for key in keys]
+
 class MarkdownSearchTool:
     """
     ローカルのMarkdownファイルを対象としたセマンティック検索ツール。
     RAGパイプラインをカプセル化する。
+
+    構築したFAISSインデックスは INDEX_DIR に保存し、元文書のハッシュ・
+    埋め込みモデル名・分割パラメータが一致する場合は再埋め込みせずに読み込む。
+    クエリ埋め込みと検索結果は LRU キャッシュし、検索結果のキーには
+    インデックスのバージョン（マニフェストのハッシュ）を含める。
     """
-    def __init__(self):
+    index_version: Optional[str] = None
+    _result_cache: Optional[_LRUCache] = None
+
+    def __init__(self, document_path: Path = MD_DOCUMENT_PATH, index_dir: Path = INDEX_DIR):
         """
-        初期化時に、ドキュメントを読み込み、ベクトルストアを構築する。
+        初期化時に、保存済みインデックスを読み込むか、ドキュメントからベクトルストアを構築する。
         """
         print("--- MarkdownSearchToolを初期化中 ---")
-        if not MD_DOCUMENT_PATH.exists():
-            raise FileNotFoundError(f"リサーチ対象ドキュメント '{MD_DOCUMENT_PATH}' が見つかりません。")
+        self.document_path = Path(document_path)
+        self.index_dir = Path(index_dir)
+        if not self.document_path.exists():
+            raise FileNotFoundError(f"リサーチ対象ドキュメント '{self.document_path}' が見つかりません。")
 
         try:
-            loader = UnstructuredMarkdownLoader(MD_DOCUMENT_PATH)
-            docs = loader.load()
+            print(f"埋め込みモデル '{EMBEDDING_MODEL_NAME}' をロード中...")
+            self.embeddings = CachedQueryEmbeddings(HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL_NAME))
+            self._result_cache = _LRUCache(SEARCH_RESULT_CACHE_SIZE)
 
-            text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=500,
-                chunk_overlap=50,
-                separators=["\n\n", "\n", "。", "、", ""]
-            )
-            chunks = text_splitter.split_documents(docs)
+            manifest = self._build_manifest()
+            self.index_version = hashlib.sha256(
+                json.dumps(manifest, sort_keys=True).encode("utf-8")
+            ).hexdigest()[:16]
+            self.vector_store = self._load_cached_index(manifest)
+            if self.vector_store is None:
+                loader = UnstructuredMarkdownLoader(self.document_path)
+                docs = loader.load()
 
-            print(f"埋め込みモデル '{EMBEDDING_MODEL_NAME}' をロード中...")
-            self.embeddings = HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL_NAME)
+                text_splitter = RecursiveCharacterTextSplitter(
+                    chunk_size=CHUNK_SIZE,
+                    chunk_overlap=CHUNK_OVERLAP,
+                    separators=SPLIT_SEPARATORS
+                )
+                chunks = text_splitter.split_documents(docs)
 
-            print("ベクトルストアを構築中...")
-            self.vector_store = FAISS.from_documents(chunks, self.embeddings)
+                print("ベクトルストアを構築中...")
+                self.vector_store = FAISS.from_documents(chunks, self.embeddings)
+                self._save_index(manifest)
             print("--- MarkdownSearchToolの初期化完了 ---")
 
         except Exception as e:
@@ -57,11 +176,16 @@ class MarkdownSearchTool:
         if self.vector_store is None:
             print("エラー: ベクトルストアが初期化されていません。検索を実行できません。")
             return []
-            
+
+        cache_key = self._result_cache_key(query, top_k)
+        cached = self._cached_results(cache_key)
+        if cached is not None:
+            return cached
+
         print(f"'{query}' でドキュメント内を検索中...")
         try:
             relevant_docs = self.vector_store.similarity_search(query, k=top_k)
-            
+
             findings = []
             for doc in relevant_docs:
                 finding = schemas.ResearchFinding(
@@ -69,10 +193,196 @@ class MarkdownSearchTool:
                     source=f"{MD_DOCUMENT_PATH.name} (関連箇所)"
                 )
                 findings.append(finding)
-            
+
+            self._store_results(cache_key, findings)
             return findings
         except Exception as e:
             print(f"!!! ドキュメント内検索中にエラーが発生しました: {e}")
             return []
 
-markdown_search_tool = MarkdownSearchTool()
+    def search_many(self, queries: List[str], top_k: int = 3) -> List[List[schemas.ResearchFinding]]:
+        """
+        複数クエリをまとめて検索する。クエリは1回の順伝播でまとめて埋め込み、
+        FAISSにも行列として1回だけ問い合わせる。戻り値は queries と同じ順序。
+        """
+        if not queries:
+            return []
+        if self.vector_store is None:
+            print("エラー: ベクトルストアが初期化されていません。検索を実行できません。")
+            return [[] for _ in queries]
+
+        cache_keys = [self._result_cache_key(query, top_k) for query in queries]
+        results: List[Optional[List[schemas.ResearchFinding]]] = [
+            self._cached_results(key) for key in cache_keys
+        ]
+        pending = [i for i, found in enumerate(results) if found is None]
+        if not pending:
+            return results
+
+        print(f"{len(pending)} 件のクエリでドキュメント内を一括検索中...")
+        try:
+            vectors = np.asarray(
+                _embed_queries(self.embeddings, [queries[i] for i in pending]), dtype=np.float32
+            )
+            if getattr(self.vector_store, "_normalize_L2", False):
+                import faiss
+
+                faiss.normalize_L2(vectors)
+            _, indices = self.vector_store.index.search(vectors, top_k)
+
+            for position, row in zip(pending, indices):
+                findings = []
+                for i in row:
+                    if i == -1:
+                        continue
+                    doc_id = self.vector_store.index_to_docstore_id[int(i)]
+                    doc = self.vector_store.docstore.search(doc_id)
+                    findings.append(schemas.ResearchFinding(
+                        content=doc.page_content,
+                        source=f"{MD_DOCUMENT_PATH.name} (関連箇所)"
+                    ))
+                self._store_results(cache_keys[position], findings)
+                results[position] = findings
+            return results
+        except Exception as e:
+            print(f"!!! ドキュメント内の一括検索中にエラーが発生しました: {e}")
+            return [[] for _ in queries]
+
+    def cache_stats(self) -> Dict[str, Dict[str, float]]:
+        """クエリ埋め込みキャッシュと検索結果キャッシュのヒット率を返す。"""
+        stats: Dict[str, Dict[str, float]] = {}
+        embedding_cache = getattr(self.embeddings, "cache", None)
+        if isinstance(embedding_cache, _LRUCache):
+            stats["query_embedding"] = embedding_cache.stats()
+        if self._result_cache is not None:
+            stats["search_result"] = self._result_cache.stats()
+        return stats
+
+    # --- ▼▼▼ 検索結果のキャッシュ処理 ▼▼▼ ---
+    def _result_cache_key(self, query: str, top_k: int) -> Tuple[str, int, Optional[str]]:
+        return (normalize_query(query), top_k, self.index_version)
+
+    def _cached_results(self, key: Tuple[str, int, Optional[str]]) -> Optional[List[schemas.ResearchFinding]]:
+        if self._result_cache is None:
+            return None
+        cached = self._result_cache.get(key)
+        return list(cached) if cached is not None else None
+
+    def _store_results(self, key: Tuple[str, int, Optional[str]], findings: List[schemas.ResearchFinding]) -> None:
+        if self._result_cache is not None:
+            self._result_cache.put(key, tuple(findings))
+    # --- ▲▲▲ 検索結果のキャッシュ処理ここまで ▲▲▲ ---
+
+    # --- ▼▼▼ インデックスのキャッシュ処理 ▼▼▼ ---
+    def _build_manifest(self) -> dict:
+        """インデックスの再利用可否を判定するためのマニフェストを作る。"""
+        return {
+            "format_version": INDEX_FORMAT_VERSION,
+            "source_file": self.document_path.name,
+            "source_sha256": hashlib.sha256(self.document_path.read_bytes()).hexdigest(),
+            "embedding_model": EMBEDDING_MODEL_NAME,
+            "chunk_size": CHUNK_SIZE,
+            "chunk_overlap": CHUNK_OVERLAP,
+            "separators": SPLIT_SEPARATORS,
+        }
+
+    def _load_cached_index(self, manifest: dict) -> Optional[FAISS]:
+        """マニフェストが一致すれば保存済みインデックスを読み込む。"""
+        manifest_path = self.index_dir / INDEX_MANIFEST_NAME
+        if not manifest_path.exists():
+            return None
+        try:
+            cached_manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if cached_manifest != manifest:
+            print("  保存済みインデックスが古いため再構築します。")
+            return None
+
+        print(f"保存済みインデックス '{self.index_dir}' を読み込み中...")
+        try:
+            return _load_faiss_mmap(self.index_dir, self.embeddings)
+        except Exception:
+            # mmap に対応していないインデックス種別は通常の読み込みにフォールバック
+            pass
+        try:
+            return FAISS.load_local(
+                str(self.index_dir), self.embeddings, allow_dangerous_deserialization=True
+            )
+        except Exception as e:
+            # 破損・欠損したインデックスは呼び出し側で再構築させる
+            print(f"  [警告] 保存済みインデックスを読み込めないため再構築します: {e}")
+            return None
+
+    def _save_index(self, manifest: dict) -> None:
+        """インデックスを保存し、最後にマニフェストを書き込む。"""
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            manifest_path = self.index_dir / INDEX_MANIFEST_NAME
+            manifest_path.unlink(missing_ok=True)
+            self.vector_store.save_local(str(self.index_dir))
+            manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+        except Exception as e:
+            print(f"  [警告] インデックスの保存に失敗しました: {e}")
+    # --- ▲▲▲ キャッシュ処理ここまで ▲▲▲ ---
+
+
+def _embed_queries(embeddings, queries: List[str]) -> List[List[float]]:
+    """キャッシュ付きの埋め込みならキャッシュ経由で、そうでなければ一括で埋め込む。"""
+    if isinstance(embeddings, CachedQueryEmbeddings):
+        return embeddings.embed_queries(queries)
+    return embeddings.embed_documents(queries)
+
+
+def _load_faiss_mmap(index_dir: Path, embeddings) -> FAISS:
+    """FAISSインデックス本体をメモリマップで開き、LangChainのFAISSとして復元する。"""
+    import faiss
+
+    index = faiss.read_index(str(index_dir / "index.faiss"), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+    with open(index_dir / "index.pkl", "rb") as f:
+        docstore, index_to_docstore_id = pickle.load(f)
+    return FAISS(
+        embedding_function=embeddings,
+        index=index,
+        docstore=docstore,
+        index_to_docstore_id=index_to_docstore_id,
+    )
+
+
+# --- ▼▼▼ 遅延初期化: 最初の検索時にツールを生成する ▼▼▼ ---
+_tool_instance: Optional[MarkdownSearchTool] = None
+_tool_lock = threading.Lock()
+
+
+def get_markdown_search_tool() -> MarkdownSearchTool:
+    """プロセス内で共有する MarkdownSearchTool を必要になった時点で生成して返す。"""
+    global _tool_instance
+    if _tool_instance is None:
+        with _tool_lock:
+            if _tool_instance is None:
+                _tool_instance = MarkdownSearchTool()
+    return _tool_instance
+
+
+class _LazyMarkdownSearchTool:
+    """import 時にモデルを読み込まないための薄いプロキシ。"""
+
+    def ensure_loaded(self) -> None:
+        """モデルとインデックスを読み込む（検索の締め切り計測前に呼ぶ）。"""
+        get_markdown_search_tool()
+
+    def is_loaded(self) -> bool:
+        return _tool_instance is not None
+
+    def search(self, query: str, top_k: int = 3) -> List[schemas.ResearchFinding]:
+        return get_markdown_search_tool().search(query, top_k=top_k)
+
+    def search_many(self, queries: List[str], top_k: int = 3) -> List[List[schemas.ResearchFinding]]:
+        return get_markdown_search_tool().search_many(queries, top_k=top_k)
+
+    def cache_stats(self) -> Dict[str, Dict[str, float]]:
+        return get_markdown_search_tool().cache_stats()
+
+
+markdown_search_tool = _LazyMarkdownSearchTool()
+# --- ▲▲▲ 遅延初期化ここまで ▲▲▲ ---
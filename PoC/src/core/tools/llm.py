@@ -1,7 +1,8 @@
 # src/core/tools/llm.py
 
 import os
-from typing import List, Optional
+import threading
+from typing import Dict, List, Optional
 
 try:
     from langchain_google_genai import ChatGoogleGenerativeAI
@@ -10,20 +11,63 @@ except Exception:
     ChatGoogleGenerativeAI = None  # type: ignore
     HumanMessage = None  # type: ignore
 
+# --- ▼▼▼ map-reduce 要約の設定 ▼▼▼ ---
+# map / 中間 reduce フェーズで同時に投げるリクエスト数の上限
+MAP_CONCURRENCY = int(os.getenv("SUMMARY_MAP_CONCURRENCY", "8"))
+# 1回の reduce に渡す要点群の最大文字数（コンテキストウィンドウに対する安全側の目安）
+REDUCE_INPUT_MAX_CHARS = int(os.getenv("SUMMARY_REDUCE_MAX_CHARS", "12000"))
+# --- ▲▲▲ 設定ここまで ▲▲▲ ---
+
+# APIキーごとにクライアントを使い回す
+_llm_cache: Dict[str, "ChatGoogleGenerativeAI"] = {}
+_llm_lock = threading.Lock()
+
 
 def _get_llm() -> Optional["ChatGoogleGenerativeAI"]:
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key or ChatGoogleGenerativeAI is None:
         return None
-    try:
-        llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-flash",
-            temperature=0.2,
-            max_output_tokens=512,
-        )
+    llm = _llm_cache.get(api_key)
+    if llm is not None:
         return llm
-    except Exception:
-        return None
+    with _llm_lock:
+        llm = _llm_cache.get(api_key)
+        if llm is None:
+            try:
+                llm = ChatGoogleGenerativeAI(
+                    model="gemini-1.5-flash",
+                    temperature=0.2,
+                    max_output_tokens=512,
+                )
+            except Exception:
+                return None
+            _llm_cache[api_key] = llm
+    return llm
+
+
+def _invoke_many(llm, prompts: List[str]) -> List[str]:
+    """複数プロンプトを batch でまとめて並列に投げ、応答テキストを同じ順序で返す。"""
+    responses = llm.batch(
+        [[HumanMessage(content=prompt)] for prompt in prompts],
+        config={"max_concurrency": MAP_CONCURRENCY},
+    )
+    return [str(resp.content).strip() for resp in responses]
+
+
+def _group_by_length(texts: List[str], max_chars: int) -> List[List[str]]:
+    """連結長が max_chars を超えないように順序を保ったままグループ化する。"""
+    groups: List[List[str]] = []
+    current: List[str] = []
+    size = 0
+    for text in texts:
+        if current and size + len(text) + 1 > max_chars:
+            groups.append(current)
+            current, size = [], 0
+        current.append(text)
+        size += len(text) + 1
+    if current:
+        groups.append(current)
+    return groups
 
 
 def summarize_map_reduce(chunks: List[str], instruction: str) -> Optional[str]:
@@ -35,16 +79,22 @@ def summarize_map_reduce(chunks: List[str], instruction: str) -> Optional[str]:
     if llm is None or not chunks:
         return None
     try:
-        # map: 各チャンクを短く要約
-        mapped: List[str] = []
-        for chunk in chunks:
-            msg = HumanMessage(
-                content=(
-                    "以下の内容を日本語で2文以内に要約してください。重要語を残し、口語は排除:\n\n" + chunk
-                )
-            )
-            resp = llm.invoke([msg])
-            mapped.append(str(resp.content).strip())
+        # map: 各チャンクを短く要約（batch で並列実行）
+        mapped = _invoke_many(llm, [
+            "以下の内容を日本語で2文以内に要約してください。重要語を残し、口語は排除:\n\n" + chunk
+            for chunk in chunks
+        ])
+
+        # 中間 reduce: 1回のコンテキストに収まるまで、グループごとに並列で統合する
+        while len(mapped) > 1 and sum(len(m) + 1 for m in mapped) > REDUCE_INPUT_MAX_CHARS:
+            groups = _group_by_length(mapped, REDUCE_INPUT_MAX_CHARS)
+            if len(groups) == len(mapped):
+                # 1件ずつでも上限を超える場合はこれ以上縮まないため打ち切る
+                break
+            mapped = _invoke_many(llm, [
+                "以下の要点群を、重要語を残したまま日本語で3文以内に統合してください:\n\n" + "\n".join(group)
+                for group in groups
+            ])
 
         # reduce: 全体統合
         joined = "\n".join(mapped)
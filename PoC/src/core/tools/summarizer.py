@@ -0,0 +1,210 @@
+# src/core/tools/summarizer.py
+
+import re
+from collections import Counter
+from functools import cached_property, lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+# 句読点・記号で分割する簡易トークナイザ（日本語・英数混在）
+_TOKEN_SPLIT = re.compile(r"[\s\n、。,.；;:：()（）\-\[\]{}・，]+")
+_SENTENCE_SPLIT = re.compile(r"[。\.]+")
+# 口語・フィラーを含む文は要約候補から外す
+_COLLOQUIAL = re.compile(r"(えー|あの|えっと|ですね|ですか|はい|ええ)")
+
+
+def tokenize(text: str) -> List[str]:
+    if not text:
+        return []
+    return [p for p in _TOKEN_SPLIT.split(text) if len(p) >= 2]
+
+
+def features(text: str) -> List[str]:
+    """
+    TF-IDF 用の特徴量。分かち書きされない日本語は区切り単位が長すぎるため、
+    ASCII の語はそのまま、それ以外は文字 bigram に分解する。
+    """
+    result: List[str] = []
+    for token in tokenize(text):
+        if token.isascii():
+            result.append(token.lower())
+        else:
+            result.extend(token[i:i + 2] for i in range(len(token) - 1))
+    return result
+
+
+class TermIndex:
+    """
+    ファインディング群を一度だけ特徴量に分解し、クエリとの一致回数で順位付けする。
+    プレースホルダーごとに本文を走査し直さずに済む。
+    """
+
+    def __init__(self, texts: Sequence[str]):
+        self.counts = [Counter(features(text)) for text in texts]
+
+    def rank(self, query: str, top_k: int = 3) -> List[Tuple[int, int]]:
+        """(テキスト番号, 一致回数) を一致回数の降順で返す。同点は元の順序を保つ。"""
+        terms = set(features(query))
+        if not terms:
+            return [(i, 0) for i in range(min(top_k, len(self.counts)))]
+        scored = [(i, sum(counts[t] for t in terms)) for i, counts in enumerate(self.counts)]
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:top_k]
+
+
+@lru_cache(maxsize=256)
+def term_index(texts: Tuple[str, ...]) -> TermIndex:
+    """同じファインディング群の特徴量分解を使い回す。"""
+    return TermIndex(texts)
+
+
+class SentenceIndex:
+    """
+    ファインディング群を一度だけ文分割・トークン化し、文×語の TF-IDF 疎行列を保持する。
+    文のスコアリングと MMR による冗長除去は行列演算で行う。
+    """
+
+    def __init__(self, texts: Sequence[str], min_sentence_len: int = 10, skip_colloquial: bool = True):
+        sentences: List[str] = []
+        seen = set()
+        for sentence in _SENTENCE_SPLIT.split(" ".join(texts)):
+            sentence = sentence.strip()
+            if len(sentence) <= min_sentence_len or sentence in seen:
+                continue
+            if skip_colloquial and _COLLOQUIAL.search(sentence):
+                continue
+            seen.add(sentence)
+            sentences.append(sentence)
+        self.sentences = sentences
+
+        self.vocabulary: Dict[str, int] = {}
+        rows: List[int] = []
+        cols: List[int] = []
+        for row, sentence in enumerate(sentences):
+            for token in features(sentence):
+                rows.append(row)
+                cols.append(self.vocabulary.setdefault(token, len(self.vocabulary)))
+        counts = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+            shape=(len(sentences), len(self.vocabulary)),
+        )
+        counts.sum_duplicates()
+        document_frequency = np.bincount(counts.indices, minlength=len(self.vocabulary))
+        self.idf = (np.log((1 + len(sentences)) / (1 + document_frequency)) + 1).astype(np.float32)
+        self.matrix = _l2_normalize_rows(counts.multiply(self.idf).tocsr())
+
+    def dense_vectors(self, texts: Sequence[str]) -> np.ndarray:
+        """vectorize の密行列版。少数のクエリでは疎行列を組むより速い。"""
+        vectors = np.zeros((len(texts), len(self.vocabulary)), dtype=np.float32)
+        for row, text in enumerate(texts):
+            cols = [self.vocabulary[t] for t in features(text) if t in self.vocabulary]
+            if cols:
+                vectors[row] = np.bincount(cols, minlength=len(self.vocabulary)) * self.idf
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    @cached_property
+    def centrality(self) -> np.ndarray:
+        """各文と全体の重心との類似度（クエリに依存しない重要度）。"""
+        return self.matrix @ np.asarray(self.matrix.mean(axis=0)).ravel()
+
+    @cached_property
+    def similarity(self) -> np.ndarray:
+        """文同士のコサイン類似度（密行列）。"""
+        return (self.matrix @ self.matrix.T).toarray()
+
+    def vectorize(self, texts: Sequence[str]) -> sparse.csr_matrix:
+        """既存の語彙で任意のテキストを TF-IDF ベクトルにする（未知語は無視）。"""
+        rows: List[int] = []
+        cols: List[int] = []
+        for row, text in enumerate(texts):
+            for token in features(text):
+                col = self.vocabulary.get(token)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+        counts = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+            shape=(len(texts), len(self.vocabulary)),
+        )
+        counts.sum_duplicates()
+        return _l2_normalize_rows(counts.multiply(self.idf).tocsr())
+
+    def select(
+        self,
+        top_k: int = 3,
+        query: Optional[str] = None,
+        avoid: Sequence[str] = (),
+        diversity: float = 0.3,
+    ) -> List[str]:
+        """
+        重要度（重心との類似度、query があればその類似度も加味）で文を選ぶ。
+        選択済みの文や avoid と似た文は MMR で減点する。戻り値は元の出現順。
+        """
+        if not self.sentences or top_k <= 0:
+            return []
+        relevance = self.centrality
+        if query:
+            relevance = relevance + self.matrix @ self.dense_vectors([query])[0]
+        similarity = self.similarity
+        redundancy = np.zeros(len(self.sentences), dtype=np.float32)
+        if avoid:
+            redundancy = np.asarray(self.matrix @ self.dense_vectors(avoid).T).max(axis=1)
+
+        chosen: List[int] = []
+        available = np.ones(len(self.sentences), dtype=bool)
+        for _ in range(min(top_k, len(self.sentences))):
+            mmr = (1 - diversity) * relevance - diversity * redundancy
+            mmr[~available] = -np.inf
+            best = int(np.argmax(mmr))
+            chosen.append(best)
+            available[best] = False
+            redundancy = np.maximum(redundancy, similarity[best])
+        return [self.sentences[i] for i in sorted(chosen)]
+
+
+@lru_cache(maxsize=256)
+def sentence_index(texts: Tuple[str, ...], min_sentence_len: int = 10) -> SentenceIndex:
+    """同じファインディング群に対する分割・行列構築を使い回す。"""
+    return SentenceIndex(texts, min_sentence_len=min_sentence_len)
+
+
+def summarize(
+    texts: Sequence[str],
+    top_k: int = 3,
+    query: Optional[str] = None,
+    avoid: Sequence[str] = (),
+    min_sentence_len: int = 10,
+) -> List[str]:
+    """texts から重要文を最大 top_k 文抽出する。"""
+    index = sentence_index(tuple(texts), min_sentence_len)
+    return index.select(top_k=top_k, query=query, avoid=tuple(avoid))
+
+
+def drop_redundant(candidates: Sequence[str], previous: Sequence[str], threshold: float = 0.8) -> List[str]:
+    """previous や先行する候補と TF-IDF コサイン類似度が threshold 以上の候補を除く。"""
+    if not candidates:
+        return []
+    index = SentenceIndex(list(previous) + list(candidates), min_sentence_len=0, skip_colloquial=False)
+    vectors = index.vectorize(list(previous) + list(candidates))
+    similarity = (vectors @ vectors.T).toarray()
+    kept: List[str] = []
+    kept_rows = list(range(len(previous)))
+    for offset, candidate in enumerate(candidates):
+        row = len(previous) + offset
+        is_duplicate = candidate in previous or candidate in kept
+        if not is_duplicate and kept_rows and similarity[row, kept_rows].max() >= threshold:
+            is_duplicate = True
+        if not is_duplicate:
+            kept.append(candidate)
+            kept_rows.append(row)
+    return kept
+
+
+def _l2_normalize_rows(matrix: sparse.csr_matrix) -> sparse.csr_matrix:
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1.0 / norms).dot(matrix).tocsr()
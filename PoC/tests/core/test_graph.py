@@ -56,6 +56,119 @@ class TestAIGraph(unittest.TestCase):
         import pprint
         pprint.pprint(blueprint.model_dump())
 
+
+class TestPlannerIndexes(unittest.TestCase):
+
+    def test_asset_index_keeps_weights_and_first_match_on_ties(self):
+        from src.core.agents.pm_agent import SlideAssetIndex
+
+        index = SlideAssetIndex({
+            "agenda_a": {"tags": ["アジェンダ", "目次"], "category": "構成"},
+            "agenda_b": {"tags": ["アジェンダ"], "category": "構成"},
+            "schedule": {"tags": ["日程"], "category": "スケジュール"},
+        })
+
+        self.assertEqual(index.best_match("アジェンダ"), "agenda_a")
+        self.assertEqual(index.best_match("目次, スケジュール"), "agenda_a")  # タグ5点 > カテゴリ3点
+        self.assertEqual(index.best_match("スケジュール, 日程"), "schedule")
+        self.assertEqual(index.best_match("ジェン"), "agenda_a")  # 部分一致
+        self.assertEqual(index.best_match("ダ 目"), "agenda_a")  # タグの境界をまたぐ一致
+        self.assertIsNone(index.best_match("存在しない, "))
+
+    def test_deck_templates_are_loaded_once(self):
+        from src.core.agents import pm_agent
+
+        pm_agent._deck_template_index.cache_clear()
+        with patch('src.core.agents.pm_agent._load_deck_templates', wraps=pm_agent._load_deck_templates) as mock_load:
+            first = pm_agent._deck_template_index().best_match("定例報告の資料")
+            second = pm_agent._deck_template_index().best_match("定例報告の資料")
+        self.assertEqual(mock_load.call_count, 1)
+        self.assertIs(first, second)
+        self.assertIsNotNone(first)
+        pm_agent._deck_template_index.cache_clear()
+
+
+class TestResearchAgentConcurrency(unittest.TestCase):
+
+    @patch('src.core.agents.researcher.WEB_SEARCH_TIMEOUT', 0.2)
+    @patch('src.core.agents.researcher.markdown_search_tool.ensure_loaded')
+    @patch('src.core.agents.researcher.markdown_search_tool.search')
+    @patch('src.core.agents.researcher.web_search_tool.search')
+    def test_slow_web_search_degrades_to_internal_results(self, mock_web_search, mock_md_search, mock_ensure_loaded):
+        import threading
+        from src.core.agents.researcher import research_agent_node
+
+        # ウェブ検索はノードが戻るまで解放されない（＝締め切りで見切られなければテストが止まる）
+        release_web = threading.Event()
+        web_finished = threading.Event()
+
+        def blocked_web(query):
+            release_web.wait()
+            web_finished.set()
+            return [schemas.ResearchFinding(content="遅い結果", source="https://example.com")]
+
+        mock_md_search.return_value = [
+            schemas.ResearchFinding(content="内部文書によると、AIは重要です。", source="internal_report.md")
+        ]
+        mock_web_search.side_effect = blocked_web
+        blueprints = [
+            schemas.SlideBlueprint(slide_id=f"s{i}", slide_title="体制図", asset_id="org_chart_001", content_map=[])
+            for i in range(3)
+        ]
+
+        try:
+            result = research_agent_node({"initial_user_request": "AIの活用", "slide_blueprints": blueprints})
+            self.assertFalse(web_finished.is_set())
+        finally:
+            release_web.set()
+
+        mock_ensure_loaded.assert_called_once_with()
+        self.assertEqual([f.source for f in result["research_report"].findings], ["internal_report.md"])
+        self.assertEqual(list(result["slide_summaries"]), ["s0", "s1", "s2"])
+        self.assertTrue(web_finished.wait(timeout=5))
+
+
+class TestSlideFanOut(unittest.TestCase):
+
+    def _blueprint(self, slide_id: str) -> schemas.SlideBlueprint:
+        return schemas.SlideBlueprint(
+            slide_id=slide_id, slide_title=slide_id, asset_id="org_chart_001", content_map=[]
+        )
+
+    def test_dispatch_sends_one_worker_per_blueprint(self):
+        from src.core.graph import dispatch_slides
+
+        state = {"slide_blueprints": [self._blueprint("s1"), self._blueprint("s2")]}
+        sends = dispatch_slides(state)
+
+        self.assertEqual([send.node for send in sends], ["slide_worker", "slide_worker"])
+        self.assertEqual([send.arg["active_slide_index"] for send in sends], [0, 1])
+        self.assertEqual(dispatch_slides({"slide_blueprints": []}), "merge_slides")
+
+    def test_merge_follows_blueprint_order_not_completion_order(self):
+        from src.core.graph import merge_slides_node
+
+        blueprints = [self._blueprint("s1"), self._blueprint("s2")]
+        # s2 のワーカーが先に完了したケース
+        results = schemas.merge_slide_results({}, {
+            "s2": {"index": 1, "blueprint": blueprints[1], "summary": "要約2",
+                   "content_write_log": [{"slide_id": "s2"}]},
+        })
+        results = schemas.merge_slide_results(results, {
+            "s1": {"index": 0, "blueprint": blueprints[0], "summary": "要約1",
+                   "content_write_log": [{"slide_id": "s1"}]},
+        })
+
+        with patch('src.core.graph.markdown_search_tool.is_loaded', return_value=False), \
+                patch('src.core.graph.markdown_search_tool.cache_stats') as mock_cache_stats:
+            merged = merge_slides_node({"slide_blueprints": blueprints, "slide_results": results})
+
+        mock_cache_stats.assert_not_called()  # 未生成の検索ツールを統計のためだけに読み込まない
+
+        self.assertEqual([bp.slide_id for bp in merged["slide_blueprints"]], ["s1", "s2"])
+        self.assertEqual(list(merged["slide_summaries"]), ["s1", "s2"])
+        self.assertEqual([log["slide_id"] for log in merged["content_write_log"]], ["s1", "s2"])
+
 if __name__ == '__main__':
     unittest.main()
 
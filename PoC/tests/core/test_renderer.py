@@ -74,5 +74,29 @@ class TestPPTXRenderer(unittest.TestCase):
         except Exception as e:
             self.fail(f"生成されたPPTXファイルの検証中にエラーが発生しました: {e}")
 
+    def test_render_emits_one_structured_record_per_slide(self):
+        asset_info = next(asset for asset in self.slide_library_manifest['slide_assets'] if asset['id'] == "org_chart_001")
+        blueprint = schemas.SlideBlueprint(
+            slide_id="test_slide_01",
+            slide_title="テスト用組織図",
+            asset_id="org_chart_001",
+            content_map=[
+                schemas.PlaceholderContent(placeholder_name=asset_info['placeholders'][0]['name'], content="代表取締役社長"),
+                schemas.PlaceholderContent(placeholder_name="存在しないプレースホルダー", content="x"),
+            ]
+        )
+
+        with self.assertLogs('src.core.renderer', level='INFO') as logs:
+            self.renderer.render_presentation([blueprint])
+
+        self.assertEqual(len(logs.records), 1)
+        record = logs.records[0].slide_render
+        self.assertIs(record, self.renderer.last_render_records[0])
+        self.assertEqual(record["status"], "ok")
+        self.assertEqual(record["written"], 1)
+        self.assertEqual(len(record["warnings"]), 1)
+        self.assertGreater(record["total_ms"], 0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,54 @@
+# tests/core/test_summarizer.py
+
+import unittest
+
+from src.core.tools.summarizer import SentenceIndex, drop_redundant, summarize, term_index
+
+
+class TestExtractiveSummarizer(unittest.TestCase):
+
+    TEXTS = [
+        "生成AIは提案資料の作成時間を大幅に短縮する。生成AIは提案資料の品質を平準化する。",
+        "えー、そのあたりはですね、まだ検討中です。市場規模は年率二割で拡大している。",
+        "生成AIは提案資料の作成時間を大幅に短縮できる。",
+    ]
+
+    def test_sentences_are_tokenized_once_into_a_tfidf_matrix(self):
+        index = SentenceIndex(self.TEXTS)
+
+        self.assertEqual(index.matrix.shape, (len(index.sentences), len(index.vocabulary)))
+        self.assertFalse(any("ですね" in s for s in index.sentences))
+
+    def test_mmr_avoids_near_duplicate_sentences(self):
+        top = summarize(self.TEXTS, top_k=2)
+
+        self.assertEqual(len(top), 2)
+        self.assertFalse(
+            "生成AIは提案資料の作成時間を大幅に短縮する" in top
+            and "生成AIは提案資料の作成時間を大幅に短縮できる" in top
+        )
+
+    def test_query_and_avoid_steer_the_selection(self):
+        top = summarize(self.TEXTS, top_k=1, query="市場規模 拡大")
+        self.assertEqual(top, ["市場規模は年率二割で拡大している"])
+
+        avoided = summarize(self.TEXTS, top_k=1, avoid=["生成AIは提案資料の作成時間を大幅に短縮する"])
+        self.assertNotIn("作成時間", avoided[0])
+
+    def test_term_index_ranks_by_query_overlap_and_is_shared(self):
+        index = term_index(tuple(self.TEXTS))
+
+        self.assertIs(term_index(tuple(self.TEXTS)), index)
+        self.assertEqual(index.rank("市場規模", top_k=1), [(1, 3)])  # 市場・場規・規模
+        self.assertEqual(index.rank("、", top_k=2), [(0, 0), (1, 0)])
+
+    def test_drop_redundant_keeps_order_and_filters_repeats(self):
+        kept = drop_redundant(
+            ["AIで資料作成を効率化", "市場は拡大傾向", "AIで資料作成を効率化"],
+            previous=["市場は拡大傾向"],
+        )
+        self.assertEqual(kept, ["AIで資料作成を効率化"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -34,6 +34,129 @@ class TestMarkdownSearchTool(unittest.TestCase):
         
         mock_vector_store.similarity_search.assert_called_once_with(query, k=3)
 
+    @patch('src.core.tools.file_search.MarkdownSearchTool.__init__', return_value=None)
+    def test_search_many_embeds_queries_in_one_batch(self, mock_init):
+        import numpy as np
+        from src.core.tools.file_search import MarkdownSearchTool
+        tool = MarkdownSearchTool()
+
+        docs = {
+            "a": Document(page_content="AIはプレゼンテーション作成を支援します。"),
+            "b": Document(page_content="市場は拡大しています。"),
+        }
+        tool.embeddings = MagicMock()
+        tool.embeddings.embed_documents.return_value = [[0.1, 0.2], [0.3, 0.4]]
+        mock_vector_store = MagicMock()
+        mock_vector_store._normalize_L2 = False
+        mock_vector_store.index.search.return_value = (
+            np.zeros((2, 2), dtype=np.float32),
+            np.array([[0, 1], [1, -1]]),
+        )
+        mock_vector_store.index_to_docstore_id = {0: "a", 1: "b"}
+        mock_vector_store.docstore.search.side_effect = docs.get
+        tool.vector_store = mock_vector_store
+
+        results = tool.search_many(["AIの役割", "市場動向"], top_k=2)
+
+        tool.embeddings.embed_documents.assert_called_once_with(["AIの役割", "市場動向"])
+        mock_vector_store.index.search.assert_called_once()
+        self.assertEqual([len(r) for r in results], [2, 1])
+        self.assertEqual(results[1][0].content, "市場は拡大しています。")
+
+
+class TestQueryCaches(unittest.TestCase):
+    def test_query_embeddings_are_cached_by_normalized_text(self):
+        from src.core.tools.file_search import CachedQueryEmbeddings
+
+        base = MagicMock()
+        base.embed_documents.side_effect = lambda texts: [[float(len(t))] for t in texts]
+        embeddings = CachedQueryEmbeddings(base, maxsize=2)
+
+        first = embeddings.embed_queries(["AIの役割", "市場　動向", "AIの役割"])
+        second = embeddings.embed_query(" AIの役割 ")
+
+        base.embed_documents.assert_called_once_with(["AIの役割", "市場 動向"])
+        self.assertEqual(first[0], second)
+        self.assertEqual(embeddings.cache.stats()["hits"], 1)
+
+        # 上限を超えると最も古いクエリから追い出される
+        embeddings.embed_queries(["新規クエリ"])
+        embeddings.embed_query("AIの役割")
+        self.assertEqual(base.embed_documents.call_count, 2)
+        embeddings.embed_query("市場 動向")
+        self.assertEqual(base.embed_documents.call_count, 3)
+
+    @patch('src.core.tools.file_search.MarkdownSearchTool.__init__', return_value=None)
+    def test_search_results_are_cached_per_index_version(self, mock_init):
+        from src.core.tools.file_search import MarkdownSearchTool, _LRUCache
+
+        tool = MarkdownSearchTool()
+        tool.vector_store = MagicMock()
+        tool.vector_store.similarity_search.return_value = [
+            Document(page_content="AIはプレゼンテーション作成を支援します。")
+        ]
+        tool.embeddings = MagicMock()
+        tool.index_version = "v1"
+        tool._result_cache = _LRUCache(8)
+
+        tool.search("AIの役割", top_k=3)
+        results = tool.search("AIの役割 ", top_k=3)
+        self.assertEqual(tool.vector_store.similarity_search.call_count, 1)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(tool.cache_stats()["search_result"]["hits"], 1)
+
+        tool.index_version = "v2"
+        tool.search("AIの役割", top_k=3)
+        self.assertEqual(tool.vector_store.similarity_search.call_count, 2)
+
+
+class TestSummarizeMapReduce(unittest.TestCase):
+    def _fake_llm(self):
+        llm = MagicMock()
+        llm.batch.side_effect = lambda batches, config=None: [MagicMock(content="要点" * 10) for _ in batches]
+        llm.invoke.return_value = MagicMock(content="最終要約")
+        return llm
+
+    @patch('src.core.tools.llm._get_llm')
+    def test_map_phase_is_batched(self, mock_get_llm):
+        from src.core.tools import llm as llm_tool
+
+        fake = self._fake_llm()
+        mock_get_llm.return_value = fake
+
+        result = llm_tool.summarize_map_reduce(["本文1", "本文2", "本文3"], "簡潔に。")
+
+        self.assertEqual(result, "最終要約")
+        self.assertEqual(fake.batch.call_count, 1)
+        self.assertEqual(len(fake.batch.call_args.args[0]), 3)
+        self.assertEqual(fake.batch.call_args.kwargs["config"], {"max_concurrency": llm_tool.MAP_CONCURRENCY})
+        fake.invoke.assert_called_once()
+
+    @patch('src.core.tools.llm.REDUCE_INPUT_MAX_CHARS', 50)
+    @patch('src.core.tools.llm._get_llm')
+    def test_oversized_input_is_reduced_hierarchically(self, mock_get_llm):
+        from src.core.tools import llm as llm_tool
+
+        fake = self._fake_llm()
+        mock_get_llm.return_value = fake
+
+        llm_tool.summarize_map_reduce([f"本文{i}" for i in range(6)], "簡潔に。")
+
+        # map(6件) → 中間reduce(2件ずつ3グループ) → 中間reduce(…) → 最終reduce
+        self.assertGreaterEqual(fake.batch.call_count, 2)
+        self.assertEqual(len(fake.batch.call_args_list[1].args[0]), 3)
+        fake.invoke.assert_called_once()
+
+    @patch('src.core.tools.llm.ChatGoogleGenerativeAI')
+    def test_client_is_reused(self, mock_client):
+        from src.core.tools import llm as llm_tool
+
+        llm_tool._llm_cache.clear()
+        with patch.dict('os.environ', {"GOOGLE_API_KEY": "dummy"}):
+            self.assertIs(llm_tool._get_llm(), llm_tool._get_llm())
+        mock_client.assert_called_once()
+        llm_tool._llm_cache.clear()
+
 
 class TestWebSearchTool(unittest.TestCase):
     # --- ★★★ 修正箇所 ★★★ ---
@@ -55,3 +178,68 @@ class TestWebSearchTool(unittest.TestCase):
         self.assertEqual(results[0].source, "https://example.com/ai-trends")
         
         mock_tavily.return_value.invoke.assert_called_once_with(query)
+
+
+class TestMarkdownIndexCache(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+        from pathlib import Path
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        self.document_path = root / "internal_report.md"
+        self.document_path.write_text("# 社内レポート\nAIはプレゼンテーション作成を支援します。", encoding="utf-8")
+        self.index_dir = root / "index"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @patch('src.core.tools.file_search._load_faiss_mmap')
+    @patch('src.core.tools.file_search.FAISS')
+    @patch('src.core.tools.file_search.RecursiveCharacterTextSplitter')
+    @patch('src.core.tools.file_search.UnstructuredMarkdownLoader')
+    @patch('src.core.tools.file_search.HuggingFaceEmbeddings')
+    def test_index_is_reused_until_source_changes(self, mock_embeddings, mock_loader, mock_splitter, mock_faiss, mock_load_mmap):
+        from src.core.tools.file_search import MarkdownSearchTool
+
+        MarkdownSearchTool(self.document_path, self.index_dir)
+        self.assertEqual(mock_faiss.from_documents.call_count, 1)
+        self.assertTrue((self.index_dir / "manifest.json").exists())
+
+        # 同じ内容なら再埋め込みせずに保存済みインデックスを読み込む
+        tool = MarkdownSearchTool(self.document_path, self.index_dir)
+        self.assertEqual(mock_faiss.from_documents.call_count, 1)
+        self.assertIs(tool.vector_store, mock_load_mmap.return_value)
+
+        # 元文書が変わればインデックスを再構築する
+        self.document_path.write_text("# 更新版\n内容が変わりました。", encoding="utf-8")
+        MarkdownSearchTool(self.document_path, self.index_dir)
+        self.assertEqual(mock_faiss.from_documents.call_count, 2)
+
+    @patch('src.core.tools.file_search._load_faiss_mmap')
+    @patch('src.core.tools.file_search.FAISS')
+    @patch('src.core.tools.file_search.RecursiveCharacterTextSplitter')
+    @patch('src.core.tools.file_search.UnstructuredMarkdownLoader')
+    @patch('src.core.tools.file_search.HuggingFaceEmbeddings')
+    def test_unreadable_index_is_rebuilt(self, mock_embeddings, mock_loader, mock_splitter, mock_faiss, mock_load_mmap):
+        from src.core.tools.file_search import MarkdownSearchTool
+
+        MarkdownSearchTool(self.document_path, self.index_dir)
+        mock_load_mmap.side_effect = RuntimeError("mmap 非対応")
+        mock_faiss.load_local.side_effect = RuntimeError("破損したインデックス")
+
+        tool = MarkdownSearchTool(self.document_path, self.index_dir)
+        self.assertEqual(mock_faiss.from_documents.call_count, 2)
+        self.assertIs(tool.vector_store, mock_faiss.from_documents.return_value)
+
+    def test_module_import_does_not_build_the_index(self):
+        from src.core.tools import file_search
+
+        with patch.object(file_search, 'MarkdownSearchTool') as mock_tool:
+            file_search._tool_instance = None
+            self.assertFalse(mock_tool.called)
+            file_search.markdown_search_tool.search("AIの役割", top_k=2)
+            file_search.markdown_search_tool.search("AIの役割", top_k=2)
+            mock_tool.assert_called_once_with()
+            mock_tool.return_value.search.assert_called_with("AIの役割", top_k=2)
+        file_search._tool_instance = None
@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import json
-import textwrap
+import uuid
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Optional, Tuple
 
 try:  # pragma: no cover - exercised indirectly in import-time checks
     import streamlit as st
@@ -31,14 +30,8 @@ except ModuleNotFoundError as exc:  # pragma: no cover - depends on optional dep
 else:  # pragma: no cover - import branch depends on optional dependency
     STREAMLIT_IMPORT_ERROR = None
 
-from LLM_API.data_classes import (
-    BaseResponse,
-    StructuredOutputRequest,
-    StructuredOutputResponse,
-    WebSearchResponse,
-)
-
-from geotra_slide.slide_document import SlideDocumentStore
+from geotra_slide.slide_codecs import decode_document, encode_document
+from geotra_slide.slide_sqlite import SqliteSlideDocumentStore
 from geotra_slide.slide_generation import (
     GenerationContext,
     PlanningContext,
@@ -49,136 +42,11 @@ from geotra_slide.slide_generation import (
 from geotra_slide.slide_library import SlideLibrary
 from geotra_slide.slide_models import SlideDocument
 from geotra_slide.pptx_renderer import SlideDeckRenderer
+from geotra_slide.stub_llm import StubStructuredOutputLLM, extract_request_excerpt
 
 
-def _extract_request_excerpt(prompt: str, *, max_width: int = 80) -> str:
-    """Return a concise summary of the user request embedded in ``prompt``."""
-
-    if not prompt:
-        return "ユーザー入力なし"
-
-    marker = "[ユーザーからのリクエスト]"
-    if marker in prompt:
-        section = prompt.split(marker, 1)[1]
-        section = section.split("[", 1)[0]
-    else:
-        section = prompt
-    section = section.strip().replace("\n", " ")
-    if not section:
-        return "ユーザー入力なし"
-    return textwrap.shorten(section, width=max_width, placeholder="…")
-
-
-class StubStructuredOutputLLM:
-    """Simple stub that mimics structured output generation for demos/tests."""
-
-    def __init__(
-        self,
-        *,
-        summary: str = "スタブ生成によるスライド概要",
-        slide_library: Optional[SlideLibrary] = None,
-    ) -> None:
-        self.summary = summary
-        self.slide_library = slide_library
-
-    # ------------------------------------------------------------------
-    # LLM compatible interface
-    # ------------------------------------------------------------------
-    def generate_content(self, request) -> BaseResponse:
-        excerpt = _extract_request_excerpt(getattr(request, "prompt", ""))
-        structure = (
-            f"{excerpt}を整理した2枚構成案です。"
-            " 表紙で目的を示し、続いて要点をまとめます。"
-        )
-        return BaseResponse(text=structure, model_used="stub-text")
-
-    def generate_structured_output(
-        self, request: StructuredOutputRequest
-    ) -> StructuredOutputResponse:
-        schema_props = request.schema.get("properties", {})
-        if "slides" in schema_props:
-            return self._generate_outline_response(request)
-        return self._generate_placeholder_response(request)
-
-    def web_search(self, request) -> WebSearchResponse:  # noqa: D401 - simple stub
-        return WebSearchResponse(
-            text="スタブによる簡易Web検索サマリー",
-            model_used="stub-web",
-            citations=[],
-        )
-
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
-    def _generate_outline_response(
-        self, request: StructuredOutputRequest
-    ) -> StructuredOutputResponse:
-        assets = list(self.slide_library.list_assets()) if self.slide_library else []
-        excerpt = _extract_request_excerpt(request.prompt)
-        slides: List[Dict[str, Any]] = []
-        if assets:
-            for idx, asset in enumerate(assets[:2], start=1):
-                slides.append(
-                    {
-                        "slide_id": f"slide_{idx:02d}",
-                        "page_number": idx,
-                        "asset_id": asset.asset_id,
-                        "title": f"{excerpt} - {asset.description[:12]}",
-                        "notes": f"スタブで選定: {asset.asset_id}",
-                    }
-                )
-        else:
-            slides.append(
-                {
-                    "slide_id": "slide_01",
-                    "page_number": 1,
-                    "asset_id": "stub_asset",
-                    "title": f"{excerpt} - 概要",
-                    "notes": "スタブで生成",
-                }
-            )
-
-        payload = {"slides": slides}
-        return StructuredOutputResponse(
-            text=json.dumps(payload, ensure_ascii=False),
-            parsed_output=payload,
-            model_used="stub-structured",
-        )
-
-    def _generate_placeholder_response(
-        self, request: StructuredOutputRequest
-    ) -> StructuredOutputResponse:
-        placeholder_names: Iterable[str] = (
-            request.schema
-            .get("properties", {})
-            .get("placeholders", {})
-            .get("items", {})
-            .get("properties", {})
-            .get("placeholder_name", {})
-            .get("enum", [])
-        )
-        user_excerpt = _extract_request_excerpt(request.prompt)
-        placeholders: List[Dict[str, object]] = []
-        for name in placeholder_names:
-            text = f"{user_excerpt}に基づき、{name}の内容を整理したドラフトです。"
-            placeholders.append(
-                {
-                    "placeholder_name": name,
-                    "text": text[:200],
-                    "references": ["internal_report.md"],
-                }
-            )
-
-        parsed = {
-            "slide_summary": self.summary,
-            "citations": ["internal_report.md"],
-            "placeholders": placeholders,
-        }
-        return StructuredOutputResponse(
-            text=json.dumps(parsed, ensure_ascii=False),
-            parsed_output=parsed,
-            model_used="stub-structured",
-        )
+# The helper used to live in this module; keep the old name importable.
+_extract_request_excerpt = extract_request_excerpt
 
 
 @st.cache_resource(show_spinner=False)
@@ -208,13 +76,18 @@ def _instantiate_llm(choice: str, slide_library: SlideLibrary):
 def _load_document_from_upload(upload) -> Optional[SlideDocument]:
     if upload is None:
         return None
-    data = json.load(upload)
-    return SlideDocument.from_dict(data)
+    return decode_document(upload.getvalue())
+
+
+@st.cache_resource(show_spinner=False)
+def _document_store(path: Path, document_id: str) -> SqliteSlideDocumentStore:
+    """Return one store per document so reruns reuse its SQLite connection."""
+
+    return SqliteSlideDocumentStore(path, document_id)
 
 
-def _save_document(document: SlideDocument, path: Path) -> None:
-    store = SlideDocumentStore(path)
-    store.save(document)
+def _save_document(document: SlideDocument, path: Path, document_id: str) -> int:
+    return _document_store(path, document_id).save(document)
 
 
 def main() -> None:
@@ -236,6 +109,7 @@ def main() -> None:
     st.session_state.setdefault("document", None)
     st.session_state.setdefault("slide_structure_editor", st.session_state["slide_structure"])
     st.session_state.setdefault("preview_index", 1)
+    st.session_state.setdefault("document_id", uuid.uuid4().hex)
 
     with st.sidebar:
         st.header("ジェネレーション設定")
@@ -254,7 +128,7 @@ def main() -> None:
         loaded_document = _load_document_from_upload(uploaded)
         if loaded_document:
             st.success("slide.jsonを読み込みました。構成と内容を下部に表示します。")
-            st.session_state["document"] = loaded_document.to_dict()
+            st.session_state["document"] = loaded_document
             structure_meta = loaded_document.metadata.get("slide_structure")
             if structure_meta:
                 st.session_state["slide_structure"] = structure_meta
@@ -382,7 +256,7 @@ def main() -> None:
                         slide_structure=structure_text,
                         context=outline_context,
                     )
-                    st.session_state["document"] = document.to_dict()
+                    st.session_state["document"] = document
                     st.session_state["preview_index"] = 1
                     st.success("スライドアウトラインを生成しました。")
                 except Exception as exc:
@@ -391,8 +265,8 @@ def main() -> None:
 
     with step_cols[2]:
         if st.button("3. プレースホルダーを埋める", type="secondary"):
-            document_data = st.session_state.get("document")
-            if not document_data:
+            document = st.session_state.get("document")
+            if not document:
                 st.error("先にスライドアウトラインを生成してください。")
             else:
                 llm_client = _instantiate_llm(llm_option, library)
@@ -404,7 +278,6 @@ def main() -> None:
                     llm_client=llm_client,
                     internal_document_path=Path("data/internal_report.md"),
                 )
-                document = SlideDocument.from_dict(document_data)
                 generation_context = GenerationContext(
                     user_request=goal_input or st.session_state.get("slide_structure", ""),
                     target_company=target_company or None,
@@ -415,12 +288,31 @@ def main() -> None:
                     ),
                     perform_web_search=perform_web_search,
                 )
+                progress_bar = st.progress(0.0, text="プレースホルダーを生成しています…")
+                completed_slides = st.container()
+
+                def show_progress(event) -> None:
+                    if event.kind == "slide_started":
+                        progress_bar.progress(
+                            (event.index - 1) / event.total,
+                            text=f"スライド {event.index}/{event.total} を生成しています…",
+                        )
+                    elif event.kind == "slide_done" and event.slide is not None:
+                        progress_bar.progress(event.index / event.total)
+                        completed_slides.markdown(
+                            f"✅ **{event.index}. {event.slide.title or event.slide.asset_id}**"
+                            f" ({event.elapsed_ms / 1000:.1f}秒)"
+                        )
+                    elif event.kind == "error":
+                        completed_slides.warning(f"スライド {event.index}: {event.error}")
+
                 try:
                     updated_document = content_generator.generate_for_document(
                         document,
                         context=generation_context,
+                        progress=show_progress,
                     )
-                    st.session_state["document"] = updated_document.to_dict()
+                    st.session_state["document"] = updated_document
                     st.session_state["preview_index"] = 1
                     st.success("プレースホルダーを更新しました。")
                 except Exception as exc:
@@ -429,9 +321,8 @@ def main() -> None:
 
     st.divider()
 
-    document_data = st.session_state.get("document")
-    if document_data:
-        document = SlideDocument.from_dict(document_data)
+    document = st.session_state.get("document")
+    if document:
         if not document.slides:
             st.info("スライドアウトラインが空です。構成の再生成を試してください。")
         else:
@@ -470,10 +361,9 @@ def main() -> None:
                 for ref in citations:
                     st.markdown(f"- {ref}")
 
-            json_payload = json.dumps(document.to_dict(), ensure_ascii=False, indent=2)
             st.download_button(
                 "slide.jsonをダウンロード",
-                data=json_payload.encode("utf-8"),
+                data=encode_document(document, "json"),
                 file_name="slide.json",
                 mime="application/json",
             )
@@ -523,12 +413,13 @@ def main() -> None:
                     mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
                 )
 
-            save_to_disk = st.checkbox("slide.jsonをプロジェクト内に保存", value=False)
-            if save_to_disk:
-                output_path = Path("output/slide.json")
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                _save_document(document, output_path)
-                st.success(f"{output_path} に保存しました。")
+            if st.button("スライドドキュメントをプロジェクト内に保存"):
+                output_path = Path("output/slides.sqlite3")
+                document_id = st.session_state["document_id"]
+                revision = _save_document(document, output_path, document_id)
+                st.success(
+                    f"{output_path} にドキュメントID {document_id} (revision {revision}) として保存しました。"
+                )
 
     st.caption("各ステップは独立して実行できます。必要に応じて構成を編集した上で再生成してください。")
 
@@ -0,0 +1,10 @@
+"""Performance benchmarks for the slide generation pipeline.
+
+Run from the repository root::
+
+    python -m benchmarks --quick
+    python -m benchmarks -o output/bench.json --baseline output/baseline.json
+
+Results are written as JSON; with ``--baseline`` the command exits with
+status 1 when any benchmark's median slows down beyond ``--max-regression``.
+"""
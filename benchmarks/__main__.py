@@ -0,0 +1,72 @@
+"""Command line entry point: ``python -m benchmarks``."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from geotra_slide.synthetic import generate_library
+
+from .cases import ASSETS_ROOT, default_cases
+from .harness import compare, load_report, run_cases, write_report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run slide pipeline benchmarks.")
+    parser.add_argument("-o", "--output", type=Path, default=Path("output/benchmarks.json"))
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=None, help="override the per-case repeat count")
+    parser.add_argument("--quick", action="store_true", help="skip the large deck sizes")
+    parser.add_argument("--llm-latency", type=float, default=0.01, help="artificial stub LLM latency in seconds")
+    parser.add_argument(
+        "--synthetic-assets",
+        type=int,
+        default=0,
+        help="benchmark against a generated library of this many assets instead of assets/",
+    )
+    parser.add_argument("--sizes", default="", help="comma separated render deck sizes, e.g. 10,100,500")
+    parser.add_argument("--baseline", type=Path, help="compare against a stored report")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="allowed slowdown ratio (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assets_root = ASSETS_ROOT
+        if args.synthetic_assets:
+            assets_root = Path(tmpdir)
+            generate_library(assets_root, args.synthetic_assets)
+        render_sizes = (1, 10) if args.quick else (1, 10, 50, 200)
+        if args.sizes:
+            render_sizes = tuple(int(size) for size in args.sizes.split(","))
+        cases = default_cases(
+            render_sizes=render_sizes,
+            codec_sizes=(10,) if args.quick else (10, 200),
+            llm_latency_s=args.llm_latency,
+            assets_root=assets_root,
+        )
+        cases = [case for case in cases if args.filter in case.name]
+        report = run_cases(cases, repeat=args.repeat, progress=_print_progress)
+
+    report["meta"]["synthetic_assets"] = args.synthetic_assets
+    write_report(report, args.output)
+    print(f"wrote {args.output}")
+
+    if args.baseline is None:
+        return 0
+    regressions = compare(report, load_report(args.baseline), max_regression=args.max_regression)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.name}: {regression.baseline_s * 1000:.2f} ms"
+            f" -> {regression.current_s * 1000:.2f} ms (x{regression.ratio:.2f})"
+        )
+    return 1 if regressions else 0
+
+
+def _print_progress(name: str, stats: Dict[str, float]) -> None:
+    print(f"{name:<28} median {stats['median'] * 1000:9.2f} ms  (min {stats['min'] * 1000:.2f} ms, n={stats['runs']})")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""Benchmark cases for library loading, rendering, generation and codecs."""
+
+from __future__ import annotations
+
+import itertools
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+from geotra_slide.pptx_renderer import SlideDeckRenderer
+from geotra_slide.slide_codecs import decode_document, encode_document
+from geotra_slide.slide_generation import GenerationContext, SlideContentGenerator
+from geotra_slide.slide_library import SlideLibrary
+from geotra_slide.slide_models import SlideDocument, SlidePage, SlidePlaceholderContent
+from geotra_slide.stub_llm import MultiStageStubLLM
+
+from .harness import BenchmarkCase
+
+ASSETS_ROOT = Path("assets")
+RENDER_SIZES = (1, 10, 50, 200)
+GENERATE_SIZES = (1, 10)
+CODEC_SIZES = (10, 200)
+
+
+class LatencyStubLLM(MultiStageStubLLM):
+    """Stub LLM that sleeps before each structured-output call to mimic network latency."""
+
+    def __init__(self, *, latency_s: float, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.latency_s = latency_s
+
+    def generate_structured_output(self, request: Any):
+        time.sleep(self.latency_s)
+        return super().generate_structured_output(request)
+
+
+def build_document(library: SlideLibrary, slide_count: int) -> SlideDocument:
+    """Build a deck of ``slide_count`` slides cycling through the real assets."""
+
+    assets = sorted(library.list_assets(), key=lambda asset: asset.asset_id)
+    slides: List[SlidePage] = []
+    for index, asset in zip(range(slide_count), itertools.cycle(assets)):
+        slides.append(
+            SlidePage(
+                slide_id=f"slide_{index + 1:03d}",
+                page_number=index + 1,
+                asset_id=asset.asset_id,
+                asset_file=asset.file_name,
+                title=f"ベンチマーク {index + 1}",
+                placeholders=[
+                    SlidePlaceholderContent(
+                        name=spec.name,
+                        text=f"{spec.name}: 進捗と課題を整理した本文テキスト",
+                        policy=spec.edit_policy,
+                        references=["internal_report.md"],
+                    )
+                    for spec in asset.placeholders
+                ],
+                notes={"summary": "ベンチマーク用スライド", "citations": ["internal_report.md"]},
+            )
+        )
+    return SlideDocument(slides=slides, metadata={"slide_structure": "ベンチマーク"})
+
+
+def _placeholder_payload(page: SlidePage) -> Dict[str, Any]:
+    return {
+        "placeholders": [
+            {"placeholder_name": ph.name, "text": "生成テキスト", "references": ["internal_report.md"]}
+            for ph in page.placeholders
+            if ph.policy.lower() == "generate"
+        ],
+        "slide_summary": "要約",
+        "citations": ["internal_report.md"],
+    }
+
+
+def default_cases(
+    *,
+    render_sizes: Sequence[int] = RENDER_SIZES,
+    generate_sizes: Sequence[int] = GENERATE_SIZES,
+    codec_sizes: Sequence[int] = CODEC_SIZES,
+    llm_latency_s: float = 0.01,
+    assets_root: Path = ASSETS_ROOT,
+) -> List[BenchmarkCase]:
+    library = SlideLibrary(assets_root)
+    cases = [
+        BenchmarkCase(
+            name="library.load",
+            func=lambda _: SlideLibrary(assets_root),
+            repeat=20,
+            group="library",
+        )
+    ]
+
+    renderer = SlideDeckRenderer(library)
+    for size in render_sizes:
+        cases.append(
+            BenchmarkCase(
+                name=f"render.{size}",
+                setup=lambda size=size: build_document(library, size),
+                func=renderer.render_document,
+                repeat=3 if size >= 50 else 5,
+                group="render",
+            )
+        )
+
+    for size in generate_sizes:
+
+        def setup(size=size):
+            template = build_document(library, size)
+            generator = SlideContentGenerator(
+                library, internal_document_path=Path("data/internal_report.md")
+            )
+            return template, generator
+
+        def generate(state):
+            template, generator = state
+            document = SlideDocument.from_dict(template.to_dict())
+            generator.llm_client = LatencyStubLLM(
+                latency_s=llm_latency_s,
+                outline_payload={"slides": []},
+                placeholder_payloads=[_placeholder_payload(page) for page in document.slides],
+            )
+            generator.generate_for_document(
+                document, context=GenerationContext(user_request="定例報告資料を作成")
+            )
+
+        cases.append(
+            BenchmarkCase(
+                name=f"generate.{size}",
+                setup=setup,
+                func=generate,
+                repeat=3,
+                group="generate",
+            )
+        )
+
+    for size in codec_sizes:
+        for codec in ("json", "compact-json", "msgpack"):
+            cases.append(
+                BenchmarkCase(
+                    name=f"codec.{codec}.{size}",
+                    setup=lambda size=size: build_document(library, size),
+                    func=lambda document, codec=codec: decode_document(
+                        encode_document(document, codec), codec
+                    ),
+                    repeat=10,
+                    group="codec",
+                )
+            )
+    return cases
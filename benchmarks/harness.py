@@ -0,0 +1,146 @@
+"""Minimal timing harness with JSON reports and baseline comparison."""
+
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+REPORT_VERSION = 1
+
+
+@dataclass(slots=True)
+class BenchmarkCase:
+    """A named benchmark.
+
+    ``setup`` runs once, outside the timed region, and its return value is
+    passed to ``func``.
+    """
+
+    name: str
+    func: Callable[[Any], Any]
+    setup: Optional[Callable[[], Any]] = None
+    repeat: int = 5
+    warmup: int = 1
+    group: str = "default"
+
+
+@dataclass(slots=True)
+class Regression:
+    name: str
+    baseline_s: float
+    current_s: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_s / self.baseline_s if self.baseline_s else float("inf")
+
+
+def measure(case: BenchmarkCase, *, repeat: Optional[int] = None) -> Dict[str, float]:
+    """Time ``case`` and return summary statistics in seconds."""
+
+    state = case.setup() if case.setup is not None else None
+    for _ in range(case.warmup):
+        case.func(state)
+
+    timings: List[float] = []
+    gc_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat or case.repeat):
+            started = time.perf_counter()
+            case.func(state)
+            timings.append(time.perf_counter() - started)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    timings.sort()
+    return {
+        "runs": len(timings),
+        "min": timings[0],
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "max": timings[-1],
+        "p95": timings[min(len(timings) - 1, round(0.95 * (len(timings) - 1)))],
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    }
+
+
+def run_cases(
+    cases: List[BenchmarkCase],
+    *,
+    repeat: Optional[int] = None,
+    progress: Optional[Callable[[str, Dict[str, float]], None]] = None,
+) -> Dict[str, Any]:
+    """Run ``cases`` and return a JSON-serialisable report."""
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for case in cases:
+        stats = measure(case, repeat=repeat)
+        results[case.name] = {"group": case.group, **stats}
+        if progress is not None:
+            progress(case.name, stats)
+    return {"version": REPORT_VERSION, "meta": _environment(), "results": results}
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    *,
+    max_regression: float = 0.2,
+    metric: str = "median",
+) -> List[Regression]:
+    """Return benchmarks slower than ``baseline`` by more than ``max_regression``.
+
+    Benchmarks missing from either report are ignored, as are baselines of
+    zero (below the timer resolution), which no ratio can be taken against.
+    """
+
+    regressions: List[Regression] = []
+    baseline_results = baseline.get("results", {})
+    for name, stats in current.get("results", {}).items():
+        previous = baseline_results.get(name)
+        if previous is None or float(previous[metric]) <= 0:
+            continue
+        regression = Regression(name, float(previous[metric]), float(stats[metric]))
+        if regression.ratio > 1 + max_regression:
+            regressions.append(regression)
+    return regressions
+
+
+def load_report(path: Path) -> Dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def write_report(report: Dict[str, Any], path: Path) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def _environment() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "commit": commit,
+    }
@@ -1,38 +1,75 @@
-"""High-level interfaces for slide generation workflows."""
-
-from .slide_library import SlideLibrary, SlideAsset, PlaceholderSpec
-from .slide_models import (
-    SlideDocument,
-    SlidePage,
-    SlidePlaceholderContent,
-)
-from .slide_generation import (
-    GenerationContext,
-    PlanningContext,
-    SlideContentGenerator,
-    SlideOutlineGenerator,
-    SlideStructurePlanner,
-)
-from .pptx_renderer import SlideDeckRenderer
-from .slide_document import SlideDocumentStore
-from . import test_runner as test_runner
-from .test_runner import run_default, run_tests
-
-__all__ = [
-    "SlideLibrary",
-    "SlideAsset",
-    "PlaceholderSpec",
-    "SlideDocument",
-    "SlidePage",
-    "SlidePlaceholderContent",
-    "PlanningContext",
-    "GenerationContext",
-    "SlideStructurePlanner",
-    "SlideOutlineGenerator",
-    "SlideContentGenerator",
-    "SlideDeckRenderer",
-    "SlideDocumentStore",
-    "test_runner",
-    "run_tests",
-    "run_default",
-]
+"""High-level interfaces for slide generation workflows.
+
+Exports are resolved lazily on first attribute access, so ``import
+geotra_slide`` (and the CLI entry point) does not pull in python-pptx,
+numpy or pytest until the corresponding class is actually used.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict
+
+_EXPORTS: Dict[str, str] = {
+    "SlideLibrary": "slide_library",
+    "SlideAsset": "slide_library",
+    "PlaceholderSpec": "slide_library",
+    "SlideDocument": "slide_models",
+    "SlidePage": "slide_models",
+    "SlidePlaceholderContent": "slide_models",
+    "PlanningContext": "slide_generation",
+    "GenerationContext": "slide_generation",
+    "ProgressEvent": "slide_generation",
+    "SlideStructurePlanner": "slide_generation",
+    "SlideOutlineGenerator": "slide_generation",
+    "SlideContentGenerator": "slide_generation",
+    "SlideDeckRenderer": "pptx_renderer",
+    "ChunkStore": "chunk_store",
+    "SlideDocumentStore": "slide_document",
+    "SlideDocumentConflictError": "slide_document",
+    "JournaledSlideDocumentStore": "slide_journal",
+    "SqliteSlideDocumentStore": "slide_sqlite",
+    "encode_document": "slide_codecs",
+    "decode_document": "slide_codecs",
+    "get_codec": "slide_codecs",
+    "run_tests": "test_runner",
+    "run_default": "test_runner",
+}
+
+__all__ = [*_EXPORTS, "test_runner"]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "test_runner":
+        return importlib.import_module(".test_runner", __name__)
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:  # pragma: no cover - static analysers only
+    from . import test_runner
+    from .chunk_store import ChunkStore
+    from .pptx_renderer import SlideDeckRenderer
+    from .slide_codecs import decode_document, encode_document, get_codec
+    from .slide_document import SlideDocumentConflictError, SlideDocumentStore
+    from .slide_generation import (
+        GenerationContext,
+        PlanningContext,
+        ProgressEvent,
+        SlideContentGenerator,
+        SlideOutlineGenerator,
+        SlideStructurePlanner,
+    )
+    from .slide_journal import JournaledSlideDocumentStore
+    from .slide_library import PlaceholderSpec, SlideAsset, SlideLibrary
+    from .slide_models import SlideDocument, SlidePage, SlidePlaceholderContent
+    from .slide_sqlite import SqliteSlideDocumentStore
+    from .test_runner import run_default, run_tests
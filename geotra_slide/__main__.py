@@ -0,0 +1,95 @@
+"""Command line entry point: ``python -m geotra_slide <command>``."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+
+def _batch(args: argparse.Namespace) -> int:
+    from .batch import BatchSettings, load_jobs, run_batch
+
+    jobs = load_jobs(args.jobs)
+    settings = BatchSettings(
+        output_dir=args.output,
+        assets_root=args.assets,
+        provider=args.provider,
+        model_name=args.model,
+        internal_document_path=args.internal_document,
+        llm_concurrency=args.llm_concurrency,
+    )
+
+    def progress(result):
+        status = result["status"]
+        detail = f"{result.get('slides', 0)} slides" if status == "done" else result.get("error")
+        print(f"[{status}] {result['job_id']} {result['elapsed_s']:.1f}s {detail}", flush=True)
+
+    summary = run_batch(
+        jobs, settings, workers=args.workers, force=args.force, progress=progress
+    )
+    print(
+        f"{summary['completed']} completed, {summary['failed']} failed, {summary['skipped']} skipped"
+        f" in {summary['wall_s']:.1f}s ({summary['jobs_per_min']} jobs/min,"
+        f" {summary['slides_per_s']} slides/s, {summary['cached_tokens']}/{summary['prompt_tokens']}"
+        f" prompt tokens cached, ${summary['cost_usd']:.4f})"
+    )
+    return 1 if summary["failed"] else 0
+
+
+def _serve(args: argparse.Namespace) -> int:
+    try:
+        import uvicorn
+    except ModuleNotFoundError as exc:  # pragma: no cover - depends on environment
+        raise RuntimeError(
+            "uvicornのインポートに失敗しました。HTTPサービスを起動するには"
+            " 'uvicorn' パッケージをインストールしてください。"
+        ) from exc
+    from .service import create_app
+
+    app = create_app(
+        assets_root=args.assets,
+        provider=args.provider,
+        workers=args.workers,
+        max_queue=args.max_queue,
+    )
+    uvicorn.run(app, host=args.host, port=args.port)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m geotra_slide")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser("batch", help="generate decks for every job in a JSON Lines file")
+    batch.add_argument("jobs", type=Path)
+    batch.add_argument("-o", "--output", type=Path, default=Path("output/batch"))
+    batch.add_argument("--workers", type=int, default=1, help="worker processes")
+    batch.add_argument(
+        "--llm-concurrency", type=int, default=4, help="LLM calls in flight across all workers"
+    )
+    batch.add_argument("--provider", choices=("stub", "openai", "claude", "gemini"), default="stub")
+    batch.add_argument("--model", default=None)
+    batch.add_argument("--assets", type=Path, default=Path("assets"))
+    batch.add_argument("--internal-document", type=Path, default=None)
+    batch.add_argument("--force", action="store_true", help="rerun jobs that already completed")
+    batch.set_defaults(handler=_batch)
+
+    serve = commands.add_parser("serve", help="run the HTTP generation service")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8000)
+    serve.add_argument("--workers", type=int, default=2, help="jobs generated concurrently")
+    serve.add_argument("--max-queue", type=int, default=16, help="jobs waiting before 429")
+    serve.add_argument("--provider", choices=("stub", "openai", "claude", "gemini"), default="stub")
+    serve.add_argument("--assets", type=Path, default=Path("assets"))
+    serve.set_defaults(handler=_serve)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""Generate many decks from a JSON Lines job file with a pool of worker processes.
+
+Each line of the job file is a :class:`~geotra_slide.pipeline.JobSpec`
+(``job_id``, ``goal``, ``conversation``, ``target_company``, ``notes``, ...).
+Every job writes ``<output>/<job_id>/slide.pptx`` and ``slide.json``, then
+``result.json`` last; jobs whose ``result.json`` exists are skipped, so an
+interrupted run can simply be restarted.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath, PureWindowsPath
+from typing import Any, Callable, Dict, List, Optional
+
+from .pipeline import ConcurrencyLimitedLLM, JobSpec, create_llm_client, run_job
+from .pptx_renderer import SlideDeckRenderer
+from .slide_codecs import encode_document
+from .slide_library import SlideLibrary
+
+LOGGER = logging.getLogger(__name__)
+
+RESULT_FILE = "result.json"
+
+
+@dataclass(slots=True)
+class BatchSettings:
+    output_dir: Path
+    assets_root: Path = Path("assets")
+    provider: str = "stub"
+    model_name: Optional[str] = None
+    internal_document_path: Optional[Path] = None
+    llm_concurrency: int = 4
+
+
+def load_jobs(path: Path) -> List[JobSpec]:
+    jobs: List[JobSpec] = []
+    seen = set()
+    with Path(path).open(encoding="utf-8") as stream:
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                job = JobSpec.from_dict(json.loads(line))
+            except (json.JSONDecodeError, ValueError) as exc:
+                raise ValueError(f"{path}:{line_number}: invalid job spec: {exc}") from exc
+            if not _is_safe_job_id(job.job_id):
+                raise ValueError(
+                    f"{path}:{line_number}: job_id '{job.job_id}' must be a single path component"
+                )
+            if job.job_id in seen:
+                raise ValueError(f"{path}:{line_number}: duplicate job_id '{job.job_id}'")
+            seen.add(job.job_id)
+            jobs.append(job)
+    return jobs
+
+
+def _is_safe_job_id(job_id: str) -> bool:
+    """Whether ``job_id`` names one directory directly under the output directory."""
+
+    if job_id in ("", ".", "..") or "\0" in job_id:
+        return False
+    return PurePosixPath(job_id).name == job_id and PureWindowsPath(job_id).name == job_id
+
+
+def is_completed(settings: BatchSettings, job_id: str) -> bool:
+    return (settings.output_dir / job_id / RESULT_FILE).exists()
+
+
+# ----------------------------------------------------------------------
+# Worker side
+# ----------------------------------------------------------------------
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(settings: BatchSettings, semaphore: Any) -> None:
+    """Load the library, renderer and LLM client once per worker process."""
+
+    library = SlideLibrary(settings.assets_root)
+    client = create_llm_client(settings.provider, library, model_name=settings.model_name)
+    _worker.update(
+        settings=settings,
+        library=library,
+        renderer=SlideDeckRenderer(library),
+        llm_client=ConcurrencyLimitedLLM(client, semaphore),
+    )
+
+
+def _run_in_worker(job: JobSpec) -> Dict[str, Any]:
+    settings: BatchSettings = _worker["settings"]
+    job_dir = settings.output_dir / job.job_id
+    job_dir.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    try:
+        result = run_job(
+            job,
+            slide_library=_worker["library"],
+            renderer=_worker["renderer"],
+            llm_client=_worker["llm_client"],
+            internal_document_path=settings.internal_document_path,
+        )
+    except Exception as exc:  # pragma: no cover - depends on provider/runtime
+        LOGGER.exception("Job %s failed", job.job_id)
+        return {
+            "job_id": job.job_id,
+            "status": "failed",
+            "error": f"{type(exc).__name__}: {exc}",
+            "elapsed_s": time.perf_counter() - started,
+        }
+
+    (job_dir / "slide.pptx").write_bytes(result.pptx)
+    (job_dir / "slide.json").write_bytes(encode_document(result.document, "json"))
+    summary = {
+        "job_id": job.job_id,
+        "status": "done",
+        "slides": len(result.document.slides),
+        "elapsed_s": result.elapsed_s,
+        "usage": result.document.metadata.get("usage", {}).get("deck"),
+    }
+    partial = job_dir / (RESULT_FILE + ".tmp")
+    partial.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(partial, job_dir / RESULT_FILE)
+    return summary
+
+
+# ----------------------------------------------------------------------
+# Driver
+# ----------------------------------------------------------------------
+
+def run_batch(
+    jobs: List[JobSpec],
+    settings: BatchSettings,
+    *,
+    workers: int = 1,
+    force: bool = False,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Run ``jobs`` and return a throughput summary.
+
+    ``workers`` processes share one semaphore of ``settings.llm_concurrency``
+    slots around LLM calls. With ``workers <= 1`` jobs run in this process.
+    """
+
+    settings.output_dir.mkdir(parents=True, exist_ok=True)
+    pending = [job for job in jobs if force or not is_completed(settings, job.job_id)]
+    skipped = len(jobs) - len(pending)
+    results: List[Dict[str, Any]] = []
+    started = time.perf_counter()
+
+    def finished(result: Dict[str, Any]) -> None:
+        results.append(result)
+        if progress is not None:
+            progress(result)
+
+    if workers <= 1:
+        _init_worker(settings, multiprocessing.BoundedSemaphore(max(1, settings.llm_concurrency)))
+        for job in pending:
+            finished(_run_in_worker(job))
+    elif pending:
+        semaphore = multiprocessing.BoundedSemaphore(max(1, settings.llm_concurrency))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(settings, semaphore)
+        ) as pool:
+            futures = [pool.submit(_run_in_worker, job) for job in pending]
+            for future in as_completed(futures):
+                finished(future.result())
+
+    wall_s = time.perf_counter() - started
+    done = [result for result in results if result["status"] == "done"]
+    slides = sum(result["slides"] for result in done)
+    summary = {
+        "jobs": len(jobs),
+        "completed": len(done),
+        "failed": len(results) - len(done),
+        "skipped": skipped,
+        "slides": slides,
+        "wall_s": round(wall_s, 3),
+        "jobs_per_min": round(len(done) / wall_s * 60, 2) if wall_s and done else 0.0,
+        "slides_per_s": round(slides / wall_s, 3) if wall_s else 0.0,
+        "mean_job_s": round(sum(r["elapsed_s"] for r in done) / len(done), 3) if done else 0.0,
+        "prompt_tokens": sum((r.get("usage") or {}).get("prompt_tokens", 0) for r in done),
+        "cached_tokens": sum((r.get("usage") or {}).get("cached_tokens", 0) for r in done),
+        "cost_usd": round(sum((r.get("usage") or {}).get("cost_usd", 0.0) for r in done), 6),
+        "failures": {r["job_id"]: r["error"] for r in results if r["status"] != "done"},
+    }
+    (settings.output_dir / "summary.json").write_text(
+        json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+    return summary
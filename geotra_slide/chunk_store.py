@@ -0,0 +1,450 @@
+"""Incrementally updated chunk store for internal reference documents."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:  # pragma: no cover - import guard for optional dependency
+    from pypdf import PdfReader
+except ModuleNotFoundError as exc:  # pragma: no cover - depends on environment
+    PYPDF_IMPORT_ERROR = exc
+    PdfReader = None  # type: ignore[assignment]
+else:  # pragma: no cover - normal runtime branch
+    PYPDF_IMPORT_ERROR = None
+
+try:  # pragma: no cover - import guard for optional dependency
+    from pptx import Presentation
+except ModuleNotFoundError as exc:  # pragma: no cover - depends on environment
+    PPTX_IMPORT_ERROR = exc
+    Presentation = None  # type: ignore[assignment]
+else:  # pragma: no cover - normal runtime branch
+    PPTX_IMPORT_ERROR = None
+
+LOGGER = logging.getLogger(__name__)
+
+Embedder = Callable[[List[str]], Sequence[Sequence[float]]]
+
+DEFAULT_SEPARATORS: Tuple[str, ...] = ("\n\n", "\n", "。", "、", "")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    source TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    ingested_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    chunk_id TEXT PRIMARY KEY,
+    source TEXT NOT NULL REFERENCES files(source) ON DELETE CASCADE,
+    ordinal INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    embedding BLOB
+);
+CREATE INDEX IF NOT EXISTS chunks_by_source ON chunks (source, ordinal);
+"""
+
+
+@dataclass(slots=True)
+class DocumentChunk:
+    """A chunk of an internal document with a content-derived identifier."""
+
+    chunk_id: str
+    source: str
+    ordinal: int
+    text: str
+
+
+@dataclass(slots=True)
+class IngestReport:
+    """Summary of what :meth:`ChunkStore.ingest` changed."""
+
+    added: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    embedded_chunks: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+
+class ChunkStore:
+    """Persist chunked internal documents and their embeddings in SQLite.
+
+    :meth:`ingest` walks a directory of Markdown, PDF and PPTX sources.
+    Files whose size, mtime and SHA-256 are unchanged are skipped. Chunk ids
+    hash the source path and chunk text, so unchanged passages in an edited
+    file keep their id and embedding. Only new chunks are sent to
+    ``embedder``. Changing the chunking parameters or ``embedding_model``
+    invalidates the stored chunks.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        embedder: Optional[Embedder] = None,
+        embedding_model: str = "",
+        chunk_size: int = 500,
+        chunk_overlap: int = 50,
+        separators: Sequence[str] = DEFAULT_SEPARATORS,
+    ) -> None:
+        self.path = Path(path)
+        self.embedder = embedder
+        self.embedding_model = embedding_model
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.separators = tuple(separators)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._matrix: Optional[Tuple[List[str], np.ndarray]] = None
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+    def ingest(self, directory: Path) -> IngestReport:
+        """Bring the store in sync with the supported files under ``directory``."""
+
+        directory = Path(directory)
+        report = IngestReport()
+        connection = self._connect()
+        known = {
+            row[0]: row[1:]
+            for row in connection.execute("SELECT source, sha256, size, mtime_ns FROM files")
+        }
+
+        seen = set()
+        for file_path in sorted(p for p in directory.rglob("*") if p.is_file()):
+            loader = LOADERS.get(file_path.suffix.lower())
+            if loader is None:
+                continue
+            source = file_path.relative_to(directory).as_posix()
+            seen.add(source)
+            stat = file_path.stat()
+            previous = known.get(source)
+            if previous is not None and previous[1:] == (stat.st_size, stat.st_mtime_ns):
+                report.unchanged.append(source)
+                continue
+
+            data = file_path.read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            if previous is not None and previous[0] == digest:
+                with connection:
+                    connection.execute(
+                        "UPDATE files SET size = ?, mtime_ns = ? WHERE source = ?",
+                        (stat.st_size, stat.st_mtime_ns, source),
+                    )
+                report.unchanged.append(source)
+                continue
+
+            try:
+                text = loader(file_path)
+            except Exception as exc:  # pragma: no cover - depends on file contents
+                LOGGER.warning("Skipping %s: %s", source, exc)
+                report.skipped.append(source)
+                continue
+            chunks = self._chunk(source, text)
+            report.embedded_chunks += self._replace_file(
+                connection, source, digest, stat, chunks
+            )
+            (report.updated if previous is not None else report.added).append(source)
+
+        for source in sorted(set(known) - seen):
+            with connection:
+                connection.execute("DELETE FROM files WHERE source = ?", (source,))
+            report.removed.append(source)
+
+        backfilled = self._backfill_embeddings(connection)
+        report.embedded_chunks += backfilled
+        if report.changed or backfilled:
+            self._matrix = None
+        return report
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def chunks(self, source: Optional[str] = None) -> List[DocumentChunk]:
+        """Return stored chunks in source and reading order."""
+
+        query = "SELECT chunk_id, source, ordinal, text FROM chunks"
+        params: Tuple[str, ...] = ()
+        if source is not None:
+            query += " WHERE source = ?"
+            params = (source,)
+        rows = self._connect().execute(query + " ORDER BY source, ordinal", params)
+        return [DocumentChunk(*row) for row in rows]
+
+    def sources(self) -> List[str]:
+        rows = self._connect().execute("SELECT source FROM files ORDER BY source")
+        return [row[0] for row in rows]
+
+    def embedding_matrix(self) -> Tuple[List[str], np.ndarray]:
+        """Return chunk ids and an L2-normalised embedding matrix (cached)."""
+
+        if self._matrix is None:
+            ids: List[str] = []
+            vectors: List[np.ndarray] = []
+            for chunk_id, blob in self._connect().execute(
+                "SELECT chunk_id, embedding FROM chunks"
+                " WHERE embedding IS NOT NULL ORDER BY source, ordinal"
+            ):
+                ids.append(chunk_id)
+                vectors.append(np.frombuffer(blob, dtype=np.float32))
+            matrix = np.vstack(vectors) if vectors else np.zeros((0, 0), dtype=np.float32)
+            if len(matrix):
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                norms[norms == 0] = 1.0
+                matrix = matrix / norms
+            self._matrix = (ids, matrix)
+        return self._matrix
+
+    def search(self, query: str, top_k: int = 5) -> List[DocumentChunk]:
+        """Return the ``top_k`` chunks most similar to ``query``."""
+
+        if self.embedder is None:
+            raise RuntimeError("ChunkStore.search requires an embedder")
+        ids, matrix = self.embedding_matrix()
+        if not ids:
+            return []
+        vector = np.asarray(self.embedder([query])[0], dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        scores = matrix @ (vector / norm if norm else vector)
+        top_k = min(top_k, len(ids))
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        best = best[np.argsort(-scores[best])]
+        by_id = {chunk.chunk_id: chunk for chunk in self._chunks_by_id([ids[i] for i in best])}
+        return [by_id[ids[i]] for i in best]
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path)
+            connection.execute("PRAGMA foreign_keys=ON")
+            connection.executescript(_SCHEMA)
+            settings = json.dumps(
+                {
+                    "chunk_size": self.chunk_size,
+                    "chunk_overlap": self.chunk_overlap,
+                    "separators": list(self.separators),
+                    "embedding_model": self.embedding_model,
+                },
+                sort_keys=True,
+            )
+            row = connection.execute(
+                "SELECT value FROM settings WHERE key = 'chunking'"
+            ).fetchone()
+            if row is None or row[0] != settings:
+                with connection:
+                    connection.execute("DELETE FROM files")
+                    connection.execute(
+                        "INSERT OR REPLACE INTO settings (key, value) VALUES ('chunking', ?)",
+                        (settings,),
+                    )
+            self._connection = connection
+        return self._connection
+
+    def _chunk(self, source: str, text: str) -> List[DocumentChunk]:
+        chunks: List[DocumentChunk] = []
+        occurrences: Dict[str, int] = {}
+        for ordinal, piece in enumerate(
+            split_text(text, self.chunk_size, self.chunk_overlap, self.separators)
+        ):
+            occurrence = occurrences.get(piece, 0)
+            occurrences[piece] = occurrence + 1
+            chunks.append(
+                DocumentChunk(
+                    chunk_id=chunk_id_for(source, piece, occurrence),
+                    source=source,
+                    ordinal=ordinal,
+                    text=piece,
+                )
+            )
+        return chunks
+
+    def _replace_file(
+        self,
+        connection: sqlite3.Connection,
+        source: str,
+        digest: str,
+        stat: os.stat_result,
+        chunks: List[DocumentChunk],
+    ) -> int:
+        reusable: Dict[str, Optional[bytes]] = dict(
+            connection.execute(
+                "SELECT chunk_id, embedding FROM chunks WHERE source = ?", (source,)
+            )
+        )
+        embeddings = {chunk_id: blob for chunk_id, blob in reusable.items() if blob is not None}
+        pending = [chunk for chunk in chunks if chunk.chunk_id not in embeddings]
+        if self.embedder is not None and pending:
+            vectors = self.embedder([chunk.text for chunk in pending])
+            for chunk, vector in zip(pending, vectors):
+                embeddings[chunk.chunk_id] = np.asarray(vector, dtype=np.float32).tobytes()
+        embedded = len(pending) if self.embedder is not None else 0
+
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO files (source, sha256, size, mtime_ns, ingested_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (source, digest, stat.st_size, stat.st_mtime_ns, time.time()),
+            )
+            connection.execute("DELETE FROM chunks WHERE source = ?", (source,))
+            connection.executemany(
+                "INSERT INTO chunks (chunk_id, source, ordinal, text, embedding)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [
+                    (chunk.chunk_id, source, chunk.ordinal, chunk.text, embeddings.get(chunk.chunk_id))
+                    for chunk in chunks
+                ],
+            )
+        return embedded
+
+    def _backfill_embeddings(self, connection: sqlite3.Connection) -> int:
+        """Embed chunks stored before an embedder was configured."""
+
+        if self.embedder is None:
+            return 0
+        rows = connection.execute(
+            "SELECT chunk_id, text FROM chunks WHERE embedding IS NULL"
+        ).fetchall()
+        if not rows:
+            return 0
+        vectors = self.embedder([text for _, text in rows])
+        with connection:
+            connection.executemany(
+                "UPDATE chunks SET embedding = ? WHERE chunk_id = ?",
+                [
+                    (np.asarray(vector, dtype=np.float32).tobytes(), chunk_id)
+                    for (chunk_id, _), vector in zip(rows, vectors)
+                ],
+            )
+        return len(rows)
+
+    def _chunks_by_id(self, chunk_ids: Iterable[str]) -> List[DocumentChunk]:
+        chunk_ids = list(chunk_ids)
+        placeholders = ",".join("?" for _ in chunk_ids)
+        rows = self._connect().execute(
+            "SELECT chunk_id, source, ordinal, text FROM chunks"
+            f" WHERE chunk_id IN ({placeholders})",
+            chunk_ids,
+        )
+        return [DocumentChunk(*row) for row in rows]
+
+
+# ----------------------------------------------------------------------
+# Chunking
+# ----------------------------------------------------------------------
+
+def chunk_id_for(source: str, text: str, occurrence: int = 0) -> str:
+    """Return a stable identifier for ``text`` within ``source``."""
+
+    digest = hashlib.sha256(f"{source}\0{occurrence}\0{text}".encode("utf-8"))
+    return digest.hexdigest()[:24]
+
+
+def split_text(
+    text: str,
+    chunk_size: int = 500,
+    chunk_overlap: int = 50,
+    separators: Sequence[str] = DEFAULT_SEPARATORS,
+) -> List[str]:
+    """Split ``text`` recursively on ``separators`` into overlapping chunks."""
+
+    pieces = _split_recursive(text, chunk_size, list(separators))
+    chunks: List[str] = []
+    current = ""
+    for piece in pieces:
+        if current and len(current) + len(piece) > chunk_size:
+            chunks.append(current.strip())
+            current = current[-chunk_overlap:] if chunk_overlap else ""
+        current += piece
+    if current.strip():
+        chunks.append(current.strip())
+    return [chunk for chunk in chunks if chunk]
+
+
+def _split_recursive(text: str, chunk_size: int, separators: List[str]) -> List[str]:
+    if len(text) <= chunk_size:
+        return [text]
+    separator = next((sep for sep in separators if sep and sep in text), "")
+    if not separator:
+        return [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+    remaining = separators[separators.index(separator) + 1 :]
+    parts = text.split(separator)
+    pieces: List[str] = []
+    for index, part in enumerate(parts):
+        if index < len(parts) - 1:
+            part += separator
+        if len(part) > chunk_size:
+            pieces.extend(_split_recursive(part, chunk_size, remaining))
+        elif part:
+            pieces.append(part)
+    return pieces
+
+
+# ----------------------------------------------------------------------
+# Loaders
+# ----------------------------------------------------------------------
+
+def _read_markdown(path: Path) -> str:
+    return path.read_text(encoding="utf-8")
+
+
+def _read_pdf(path: Path) -> str:
+    if PYPDF_IMPORT_ERROR is not None:
+        raise RuntimeError(
+            "pypdfのインポートに失敗しました。PDFを取り込むには"
+            " 'pypdf' パッケージをインストールしてください。"
+        ) from PYPDF_IMPORT_ERROR
+    reader = PdfReader(str(path))
+    return "\n\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+def _read_pptx(path: Path) -> str:
+    if PPTX_IMPORT_ERROR is not None:
+        raise RuntimeError(
+            "python-pptxのインポートに失敗しました。PPTXを取り込むには"
+            " 'python-pptx' パッケージをインストールしてください。"
+        ) from PPTX_IMPORT_ERROR
+    slides: List[str] = []
+    for slide in Presentation(str(path)).slides:
+        texts = [
+            shape.text_frame.text
+            for shape in slide.shapes
+            if shape.has_text_frame and shape.text_frame.text.strip()
+        ]
+        slides.append("\n".join(texts))
+    return "\n\n".join(slides)
+
+
+LOADERS: Dict[str, Callable[[Path], str]] = {
+    ".md": _read_markdown,
+    ".markdown": _read_markdown,
+    ".txt": _read_markdown,
+    ".pdf": _read_pdf,
+    ".pptx": _read_pptx,
+}
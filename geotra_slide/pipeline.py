@@ -0,0 +1,164 @@
+"""Headless planning → outline → content → render pipeline for one deck."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .pptx_renderer import SlideDeckRenderer
+from .slide_generation import (
+    GenerationContext,
+    PlanningContext,
+    ProgressCallback,
+    SlideContentGenerator,
+    SlideOutlineGenerator,
+    SlideStructurePlanner,
+)
+from .slide_library import SlideLibrary
+from .slide_models import SlideDocument
+from .stub_llm import StubStructuredOutputLLM
+
+PROVIDERS = ("stub", "openai", "claude", "gemini")
+
+
+@dataclass(slots=True)
+class JobSpec:
+    """Inputs for generating one deck."""
+
+    job_id: str
+    goal: str
+    conversation: str = ""
+    target_company: Optional[str] = None
+    notes: Optional[str] = None
+    external_research: Optional[str] = None
+    slide_structure: Optional[str] = None
+    perform_web_search: bool = False
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JobSpec":
+        goal = data.get("goal") or ""
+        if not goal:
+            raise ValueError("Job spec requires a 'goal'")
+        job_id = data.get("job_id") or hashlib.sha256(
+            json.dumps(data, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:12]
+        return cls(
+            job_id=str(job_id),
+            goal=goal,
+            conversation=data.get("conversation") or "",
+            target_company=data.get("target_company"),
+            notes=data.get("notes"),
+            external_research=data.get("external_research"),
+            slide_structure=data.get("slide_structure"),
+            perform_web_search=bool(data.get("perform_web_search", False)),
+        )
+
+
+@dataclass(slots=True)
+class JobResult:
+    job_id: str
+    document: SlideDocument
+    pptx: bytes
+    elapsed_s: float
+
+
+class ConcurrencyLimitedLLM:
+    """Proxy that holds ``semaphore`` for the duration of every LLM call.
+
+    ``semaphore`` may be a :mod:`threading` or :mod:`multiprocessing`
+    semaphore, so one limit can be shared by threads or worker processes.
+    """
+
+    _LIMITED = ("generate_content", "generate_structured_output", "web_search", "function_calling")
+
+    def __init__(self, client: Any, semaphore: Any) -> None:
+        self._client = client
+        self._semaphore = semaphore
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._client, name)
+        if name not in self._LIMITED:
+            return attribute
+
+        def limited(*args: Any, **kwargs: Any) -> Any:
+            with self._semaphore:
+                return attribute(*args, **kwargs)
+
+        return limited
+
+
+def create_llm_client(provider: str, slide_library: SlideLibrary, *, model_name: Optional[str] = None):
+    """Instantiate the LLM client for ``provider`` (one of :data:`PROVIDERS`)."""
+
+    if provider == "stub":
+        return StubStructuredOutputLLM(slide_library=slide_library)
+    kwargs = {"model_name": model_name} if model_name else {}
+    if provider == "openai":
+        from LLM_API.providers.openai import OpenAIModel
+
+        return OpenAIModel(**kwargs)
+    if provider == "claude":
+        from LLM_API.providers.claude import ClaudeModel
+
+        return ClaudeModel(**kwargs)
+    if provider == "gemini":
+        from LLM_API.providers.gemini import GeminiModel
+
+        return GeminiModel(**kwargs)
+    raise ValueError(f"Unknown provider: {provider}")
+
+
+def run_job(
+    job: JobSpec,
+    *,
+    slide_library: SlideLibrary,
+    renderer: SlideDeckRenderer,
+    llm_client: Any,
+    internal_document_path: Optional[Path] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> JobResult:
+    """Plan, outline, fill and render one deck.
+
+    ``progress`` is forwarded to
+    :meth:`~geotra_slide.slide_generation.SlideContentGenerator.generate_for_document`.
+    """
+
+    started = time.perf_counter()
+    structure = job.slide_structure
+    if not structure:
+        structure = SlideStructurePlanner(llm_client).build_structure(
+            PlanningContext(
+                conversation_history=job.conversation,
+                goal=job.goal,
+                target_company=job.target_company,
+                additional_requirements=job.notes,
+            )
+        )
+
+    context = GenerationContext(
+        user_request=job.goal,
+        target_company=job.target_company,
+        external_research=job.external_research,
+        additional_notes=job.notes,
+        perform_web_search=job.perform_web_search,
+    )
+    document = SlideOutlineGenerator(slide_library, llm_client=llm_client).generate_outline(
+        slide_structure=structure, context=context
+    )
+    document = SlideContentGenerator(
+        slide_library,
+        llm_client=llm_client,
+        internal_document_path=internal_document_path,
+    ).generate_for_document(document, context=context, progress=progress)
+    pptx = renderer.render_document(document).getvalue()
+    return JobResult(
+        job_id=job.job_id,
+        document=document,
+        pptx=pptx,
+        elapsed_s=time.perf_counter() - started,
+    )
+
@@ -5,8 +5,9 @@ from __future__ import annotations
 import io
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, Optional, Tuple
 
 try:  # pragma: no cover - import guard for optional dependency
     from pptx import Presentation
@@ -22,6 +23,8 @@ except ModuleNotFoundError as exc:  # pragma: no cover - depends on environment
 else:  # pragma: no cover - normal runtime branch
     PPTX_IMPORT_ERROR = None
 
+from LLM_API.tracing import span, traced_stage
+
 from .slide_library import SlideLibrary
 from .slide_models import SlideDocument, SlidePlaceholderContent
 
@@ -38,26 +41,43 @@ class SlideDeckRenderer:
 
         self.slide_library = slide_library
         self.master_template_path = self.slide_library.master_template_path()
+        # Parsed asset decks are only read while copying, so they are shared
+        # across renders (and threads); entries are keyed by file mtime.
+        self._cache_lock = threading.Lock()
+        self._master_snapshot: Optional[Tuple[int, bytes]] = None
+        self._source_cache: Dict[Tuple[str, int], Presentation] = {}
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
     def render_document(self, document: SlideDocument) -> io.BytesIO:
-        """Return a PPTX stream that represents ``document``."""
-
-        presentation = Presentation(self.master_template_path)
-        _clear_existing_slides(presentation)
-
-        for slide_page in document.slides:
-            asset = self.slide_library.get_asset(slide_page.asset_id)
-            source_path = self.slide_library.asset_file_path(asset.asset_id)
-            source_prs = Presentation(source_path)
-            template_slide = self._copy_slide(source_prs, presentation, 0)
-            self._write_placeholders(template_slide, slide_page)
-
-        buffer = io.BytesIO()
-        presentation.save(buffer)
-        buffer.seek(0)
+        """Return a PPTX stream that represents ``document``.
+
+        The per-slide timing breakdown is stored in
+        ``document.metadata["timings"]["render"]``.
+        """
+
+        with traced_stage(
+            document.metadata, "render", "render.document", slide_count=len(document.slides)
+        ):
+            presentation = Presentation(io.BytesIO(self._master_bytes()))
+            _clear_existing_slides(presentation)
+
+            for slide_page in document.slides:
+                with span(
+                    "render.slide", slide_id=slide_page.slide_id, asset_id=slide_page.asset_id
+                ):
+                    asset = self.slide_library.get_asset(slide_page.asset_id)
+                    source_path = self.slide_library.asset_file_path(asset.asset_id)
+                    with span("render.copy_slide", slide_id=slide_page.slide_id):
+                        source_prs = self._source_presentation(source_path)
+                        template_slide = self._copy_slide(source_prs, presentation, 0)
+                    self._write_placeholders(template_slide, slide_page)
+
+            buffer = io.BytesIO()
+            with span("render.save"):
+                presentation.save(buffer)
+            buffer.seek(0)
         return buffer
 
     def render_preview_image(
@@ -69,6 +89,14 @@ class SlideDeckRenderer:
     ) -> Optional[bytes]:
         """Generate a PNG preview for ``document`` if LibreOffice is available."""
 
+        with span("render.preview", slide_index=slide_index) as current:
+            preview = self._render_preview_image(document, slide_index, pptx_bytes)
+            current.set_attribute("rendered", preview is not None)
+        return preview
+
+    def _render_preview_image(
+        self, document: SlideDocument, slide_index: int, pptx_bytes: Optional[bytes]
+    ) -> Optional[bytes]:
         try:
             payload = pptx_bytes or self.render_document(document).getvalue()
             with tempfile.TemporaryDirectory() as tmpdir:
@@ -108,6 +136,29 @@ class SlideDeckRenderer:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _master_bytes(self) -> bytes:
+        path = Path(self.master_template_path)
+        mtime = path.stat().st_mtime_ns
+        with self._cache_lock:
+            snapshot = self._master_snapshot
+        if snapshot is None or snapshot[0] != mtime:
+            snapshot = (mtime, path.read_bytes())
+            with self._cache_lock:
+                self._master_snapshot = snapshot
+        return snapshot[1]
+
+    def _source_presentation(self, path: Path) -> Presentation:
+        key = (str(path), Path(path).stat().st_mtime_ns)
+        with self._cache_lock:
+            cached = self._source_cache.get(key)
+        if cached is None:
+            cached = Presentation(str(path))
+            with self._cache_lock:
+                for stale in [item for item in self._source_cache if item[0] == key[0]]:
+                    del self._source_cache[stale]
+                self._source_cache[key] = cached
+        return cached
+
     def _copy_slide(
         self, source_prs: Presentation, destination_prs: Presentation, slide_index: int
     ):
@@ -0,0 +1,324 @@
+"""HTTP service exposing the generation pipeline through a bounded job queue.
+
+Run it with an ASGI server, e.g.::
+
+    uvicorn --factory geotra_slide.service:create_app
+
+or ``python -m geotra_slide serve``. Endpoints:
+
+* ``POST /jobs`` – submit a :class:`~geotra_slide.pipeline.JobSpec` payload;
+  returns ``202`` with the job id, or ``429`` when the queue is full.
+* ``GET /jobs/{job_id}`` – job status, timings and token usage.
+* ``GET /jobs/{job_id}/events`` – server-sent progress events
+  (:class:`~geotra_slide.slide_generation.ProgressEvent`) until the job ends.
+* ``GET /jobs/{job_id}/pptx`` / ``GET /jobs/{job_id}/document`` – results.
+* ``GET /health`` – queue depth and worker count.
+
+The slide library, renderer (with its parsed asset cache) and LLM client
+are created once and shared by every job. The queueing logic lives in
+:class:`GenerationService`, which does not depend on the web framework.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:  # pragma: no cover - import guard for optional dependency
+    from starlette.applications import Starlette
+    from starlette.responses import JSONResponse, Response, StreamingResponse
+    from starlette.routing import Route
+except ModuleNotFoundError as exc:  # pragma: no cover - depends on environment
+    STARLETTE_IMPORT_ERROR = exc
+    Starlette = None  # type: ignore[assignment]
+else:  # pragma: no cover - normal runtime branch
+    STARLETTE_IMPORT_ERROR = None
+
+from .pipeline import JobResult, JobSpec, create_llm_client, run_job
+from .pptx_renderer import SlideDeckRenderer
+from .slide_codecs import encode_document
+from .slide_generation import ProgressEvent
+from .slide_library import SlideLibrary
+
+LOGGER = logging.getLogger(__name__)
+
+PPTX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+EVENT_POLL_INTERVAL = 0.2
+
+
+class QueueFullError(RuntimeError):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+@dataclass(slots=True)
+class Job:
+    spec: JobSpec
+    status: str = "queued"  # queued -> running -> done | failed
+    submitted_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    result: Optional[JobResult] = None
+    events: List[Dict[str, Any]] = field(default_factory=list)
+
+    def record(self, event: ProgressEvent) -> None:
+        self.events.append(event.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        done = [event for event in self.events if event["kind"] == "slide_done"]
+        payload: Dict[str, Any] = {
+            "job_id": self.spec.job_id,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            "slides_done": len(done),
+            "slides_total": max((event["total"] for event in self.events), default=None),
+        }
+        if self.result is not None:
+            metadata = self.result.document.metadata
+            payload.update(
+                slides=len(self.result.document.slides),
+                elapsed_s=round(self.result.elapsed_s, 3),
+                usage=metadata.get("usage", {}).get("deck"),
+                timings={stage: entry["total_ms"] for stage, entry in metadata.get("timings", {}).items()},
+            )
+        return payload
+
+
+class GenerationService:
+    """Run :func:`~geotra_slide.pipeline.run_job` on a bounded worker pool.
+
+    At most ``workers`` jobs run at once and at most ``max_queue`` wait;
+    :meth:`submit` raises :class:`QueueFullError` beyond that. Finished jobs
+    are kept for download until ``max_finished`` newer ones have completed.
+    """
+
+    def __init__(
+        self,
+        slide_library: SlideLibrary,
+        llm_client: Any,
+        *,
+        renderer: Optional[SlideDeckRenderer] = None,
+        workers: int = 2,
+        max_queue: int = 16,
+        max_finished: int = 256,
+        internal_document_path: Optional[Path] = None,
+    ) -> None:
+        self.slide_library = slide_library
+        self.renderer = renderer or SlideDeckRenderer(slide_library)
+        self.llm_client = llm_client
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self.max_finished = max_finished
+        self.internal_document_path = internal_document_path
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._active = 0  # queued + running
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="slide-job")
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def submit(self, spec: JobSpec) -> Job:
+        with self._lock:
+            existing = self._jobs.get(spec.job_id)
+            if existing is not None and existing.status in ("queued", "running"):
+                return existing
+            if self._active >= self.workers + self.max_queue:
+                raise QueueFullError(f"Job queue is full ({self.max_queue} waiting)")
+            job = Job(spec=spec, submitted_at=time.time())
+            self._jobs[spec.job_id] = job
+            self._jobs.move_to_end(spec.job_id)
+            self._active += 1
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            running = sum(1 for job in self._jobs.values() if job.status == "running")
+            return {
+                "workers": self.workers,
+                "queued": self._active - running,
+                "running": running,
+                "max_queue": self.max_queue,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _run(self, job: Job) -> None:
+        with self._lock:
+            job.status = "running"
+            job.started_at = time.time()
+        try:
+            result = run_job(
+                job.spec,
+                slide_library=self.slide_library,
+                renderer=self.renderer,
+                llm_client=self.llm_client,
+                internal_document_path=self.internal_document_path,
+                progress=job.record,
+            )
+        except Exception as exc:  # pragma: no cover - depends on provider/runtime
+            LOGGER.exception("Job %s failed", job.spec.job_id)
+            with self._lock:
+                job.status = "failed"
+                job.error = f"{type(exc).__name__}: {exc}"
+                job.finished_at = time.time()
+                self._active -= 1
+                self._evict_finished()
+            return
+        with self._lock:
+            job.result = result
+            job.status = "done"
+            job.finished_at = time.time()
+            self._active -= 1
+            self._evict_finished()
+
+    def _evict_finished(self) -> None:
+        finished = [key for key, job in self._jobs.items() if job.status in ("done", "failed")]
+        for key in finished[: max(0, len(finished) - self.max_finished)]:
+            del self._jobs[key]
+
+
+# ----------------------------------------------------------------------
+# ASGI application
+# ----------------------------------------------------------------------
+
+def create_app(
+    service: Optional[GenerationService] = None,
+    *,
+    assets_root: Path = Path("assets"),
+    provider: str = "stub",
+    workers: int = 2,
+    max_queue: int = 16,
+):
+    """Build the Starlette application around ``service``.
+
+    When ``service`` is omitted one is created from ``assets_root`` and
+    ``provider`` (see :data:`~geotra_slide.pipeline.PROVIDERS`).
+    """
+
+    if STARLETTE_IMPORT_ERROR is not None:
+        raise RuntimeError(
+            "starletteのインポートに失敗しました。HTTPサービスを利用するには"
+            " 'starlette' と 'uvicorn' パッケージをインストールしてください。"
+        ) from STARLETTE_IMPORT_ERROR
+
+    if service is None:
+        library = SlideLibrary(assets_root)
+        service = GenerationService(
+            library,
+            create_llm_client(provider, library),
+            workers=workers,
+            max_queue=max_queue,
+        )
+
+    async def submit(request):
+        try:
+            payload = await request.json()
+            if not isinstance(payload, dict):
+                raise ValueError("Job spec must be a JSON object")
+            spec = JobSpec.from_dict(payload)
+        except ValueError as exc:
+            return JSONResponse({"error": str(exc)}, status_code=400)
+        try:
+            job = service.submit(spec)
+        except QueueFullError as exc:
+            return JSONResponse({"error": str(exc)}, status_code=429, headers={"Retry-After": "5"})
+        return JSONResponse(job.to_dict(), status_code=202)
+
+    def _lookup(request) -> Optional[Job]:
+        return service.get(request.path_params["job_id"])
+
+    async def status(request):
+        job = _lookup(request)
+        if job is None:
+            return JSONResponse({"error": "unknown job"}, status_code=404)
+        return JSONResponse(job.to_dict())
+
+    async def events(request):
+        job = _lookup(request)
+        if job is None:
+            return JSONResponse({"error": "unknown job"}, status_code=404)
+
+        async def stream():
+            sent = 0
+            while True:
+                # Read the status first: events are complete once it is final.
+                finished = job.status in ("done", "failed")
+                for event in job.events[sent:]:
+                    sent += 1
+                    yield f"event: {event['kind']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+                if finished:
+                    yield f"event: {job.status}\ndata: {json.dumps(job.to_dict(), ensure_ascii=False)}\n\n"
+                    return
+                await asyncio.sleep(EVENT_POLL_INTERVAL)
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    def _finished(request):
+        job = _lookup(request)
+        if job is None:
+            return None, JSONResponse({"error": "unknown job"}, status_code=404)
+        if job.result is None:
+            return None, JSONResponse(job.to_dict(), status_code=409)
+        return job, None
+
+    async def download_pptx(request):
+        job, error = _finished(request)
+        if error is not None:
+            return error
+        return Response(
+            job.result.pptx,
+            media_type=PPTX_MEDIA_TYPE,
+            headers={"Content-Disposition": f'attachment; filename="{job.spec.job_id}.pptx"'},
+        )
+
+    async def download_document(request):
+        job, error = _finished(request)
+        if error is not None:
+            return error
+        return Response(encode_document(job.result.document, "json"), media_type="application/json")
+
+    async def health(request):
+        return JSONResponse(service.stats())
+
+    @asynccontextmanager
+    async def lifespan(app):
+        try:
+            yield
+        finally:
+            service.shutdown(wait=False)
+
+    app = Starlette(
+        routes=[
+            Route("/jobs", submit, methods=["POST"]),
+            Route("/jobs/{job_id}", status),
+            Route("/jobs/{job_id}/events", events),
+            Route("/jobs/{job_id}/pptx", download_pptx),
+            Route("/jobs/{job_id}/document", download_document),
+            Route("/health", health),
+        ],
+        lifespan=lifespan,
+    )
+    app.state.service = service
+    return app
@@ -0,0 +1,190 @@
+"""Serialisation codecs and schema migrations for slide documents."""
+
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+try:  # pragma: no cover - import guard for optional dependency
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - import guard for optional dependency
+    import msgpack
+except ModuleNotFoundError as exc:  # pragma: no cover - depends on environment
+    MSGPACK_IMPORT_ERROR = exc
+    msgpack = None  # type: ignore[assignment]
+else:  # pragma: no cover - normal runtime branch
+    MSGPACK_IMPORT_ERROR = None
+
+from .slide_models import SlideDocument
+
+# Bump whenever the on-disk layout changes and register a migration below.
+FORMAT_VERSION = 1
+
+Payload = Dict[str, Any]
+
+
+def _strip_bom(data: bytes) -> bytes:
+    """Drop a UTF-8 byte order mark, as written by some Windows editors."""
+
+    if data.startswith(codecs.BOM_UTF8):
+        return data[len(codecs.BOM_UTF8):]
+    return data
+
+
+class SlideDocumentCodec:
+    """Convert slide document payloads to and from bytes."""
+
+    name = ""
+    suffix = ""
+
+    def encode(self, payload: Payload) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, data: bytes) -> Payload:
+        raise NotImplementedError
+
+
+class JsonCodec(SlideDocumentCodec):
+    """Indented UTF-8 JSON intended for humans and diffs."""
+
+    name = "json"
+    suffix = ".json"
+
+    def __init__(self, *, indent: Optional[int] = 2) -> None:
+        self.indent = indent
+
+    def encode(self, payload: Payload) -> bytes:
+        return json.dumps(payload, ensure_ascii=False, indent=self.indent).encode("utf-8")
+
+    def decode(self, data: bytes) -> Payload:
+        data = _strip_bom(data)
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+
+class CompactJsonCodec(JsonCodec):
+    """Whitespace-free JSON, encoded with ``orjson`` when it is installed."""
+
+    name = "compact-json"
+
+    def __init__(self) -> None:
+        super().__init__(indent=None)
+
+    def encode(self, payload: Payload) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(payload)
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+
+class MsgpackCodec(SlideDocumentCodec):
+    """Binary MessagePack encoding (requires the ``msgpack`` package)."""
+
+    name = "msgpack"
+    suffix = ".msgpack"
+
+    def __init__(self) -> None:
+        if MSGPACK_IMPORT_ERROR is not None:
+            raise RuntimeError(
+                "msgpackのインポートに失敗しました。バイナリ形式で保存するには"
+                " 'msgpack' パッケージをインストールしてください。"
+            ) from MSGPACK_IMPORT_ERROR
+
+    def encode(self, payload: Payload) -> bytes:
+        return msgpack.packb(payload, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Payload:
+        return msgpack.unpackb(data, raw=False)
+
+
+_CODECS: Dict[str, Callable[[], SlideDocumentCodec]] = {
+    JsonCodec.name: JsonCodec,
+    CompactJsonCodec.name: CompactJsonCodec,
+    MsgpackCodec.name: MsgpackCodec,
+}
+
+
+def register_codec(name: str, factory: Callable[[], SlideDocumentCodec]) -> None:
+    """Make ``factory`` available under ``name`` for :func:`get_codec`."""
+
+    _CODECS[name] = factory
+
+
+def get_codec(codec: Union[str, SlideDocumentCodec, None] = None) -> SlideDocumentCodec:
+    """Return a codec instance for ``codec`` (defaults to pretty JSON)."""
+
+    if isinstance(codec, SlideDocumentCodec):
+        return codec
+    name = codec or JsonCodec.name
+    try:
+        factory = _CODECS[name]
+    except KeyError as exc:
+        raise KeyError(f"Unknown slide document codec: {name}") from exc
+    return factory()
+
+
+def codec_for_suffix(suffix: str) -> SlideDocumentCodec:
+    """Pick a codec from a file suffix, falling back to pretty JSON."""
+
+    if suffix.lower() == MsgpackCodec.suffix:
+        return MsgpackCodec()
+    return JsonCodec()
+
+
+def sniff_codec(data: bytes) -> SlideDocumentCodec:
+    """Guess the codec of ``data``; JSON documents always start with ``{``."""
+
+    if _strip_bom(data).lstrip()[:1] == b"{":
+        return JsonCodec()
+    return MsgpackCodec()
+
+
+# ----------------------------------------------------------------------
+# Schema versioning
+# ----------------------------------------------------------------------
+# Each entry upgrades a payload *from* the keyed version to the next one.
+_MIGRATIONS: Dict[int, Callable[[Payload], Payload]] = {
+    0: lambda payload: payload,  # unversioned slide.json files predate the field
+}
+
+
+def migrate_payload(payload: Payload) -> Payload:
+    """Upgrade ``payload`` in place to :data:`FORMAT_VERSION`."""
+
+    version = int(payload.get("format_version", 0))
+    if version > FORMAT_VERSION:
+        raise ValueError(
+            f"slide document format_version {version} is newer than supported "
+            f"version {FORMAT_VERSION}"
+        )
+    while version < FORMAT_VERSION:
+        payload = _MIGRATIONS[version](payload)
+        version += 1
+    payload["format_version"] = FORMAT_VERSION
+    return payload
+
+
+def encode_document(
+    document: SlideDocument, codec: Union[str, SlideDocumentCodec, None] = None
+) -> bytes:
+    """Serialise ``document`` with ``codec`` and stamp the format version."""
+
+    payload = document.to_dict()
+    payload["format_version"] = FORMAT_VERSION
+    return get_codec(codec).encode(payload)
+
+
+def decode_document(
+    data: bytes, codec: Union[str, SlideDocumentCodec, None] = None
+) -> SlideDocument:
+    """Deserialise ``data``; the codec is sniffed when not given."""
+
+    resolved = get_codec(codec) if codec is not None else sniff_codec(data)
+    payload = migrate_payload(resolved.decode(data))
+    return SlideDocument.from_dict(payload, copy=False)
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import re
 import textwrap
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence
 
 from LLM_API.data_classes import (
     BaseRequest,
@@ -17,6 +19,8 @@ from LLM_API.data_classes import (
     StructuredOutputResponse,
     WebSearchRequest,
 )
+from LLM_API.tracing import Span, current_span, span, traced_stage
+from LLM_API.usage import attribute_usage, metered, store_usage
 
 from .slide_library import SlideLibrary
 from .slide_models import (
@@ -27,6 +31,9 @@ from .slide_models import (
     SlidePlaceholderContent,
 )
 
+if TYPE_CHECKING:  # chunk_store pulls in numpy; it is imported on first use
+    from .chunk_store import ChunkStore, Embedder
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -52,6 +59,51 @@ class GenerationContext:
     perform_web_search: bool = False
 
 
+@dataclass
+class ProgressEvent:
+    """Progress notification emitted while slide content is generated.
+
+    ``kind`` is one of ``slide_started``, ``placeholder_filled``,
+    ``slide_done``, ``error`` or ``document_done``. ``index`` is the 1-based
+    slide position within the current run and ``total`` the number of slides.
+    """
+
+    kind: str
+    slide_id: Optional[str] = None
+    index: int = 0
+    total: int = 0
+    placeholder: Optional[str] = None
+    text: Optional[str] = None
+    elapsed_ms: Optional[float] = None
+    error: Optional[str] = None
+    slide: Optional[SlidePage] = field(default=None, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload = {
+            "kind": self.kind,
+            "slide_id": self.slide_id,
+            "index": self.index,
+            "total": self.total,
+            "placeholder": self.placeholder,
+            "text": self.text,
+            "elapsed_ms": self.elapsed_ms,
+            "error": self.error,
+        }
+        return {key: value for key, value in payload.items() if value is not None}
+
+
+ProgressCallback = Callable[[ProgressEvent], None]
+
+
+def _emit(progress: Optional[ProgressCallback], event: ProgressEvent) -> None:
+    if progress is None:
+        return
+    try:
+        progress(event)
+    except Exception as exc:  # pragma: no cover - a broken listener must not stop generation
+        LOGGER.warning("Progress callback failed for %s: %s", event.kind, exc)
+
+
 class SlideStructurePlanner:
     """Create a textual slide structure from a planning conversation."""
 
@@ -78,7 +130,8 @@ class SlideStructurePlanner:
 
         prompt = "\n".join(section for section in prompt_sections if section)
         request = BaseRequest(prompt=prompt)
-        response = self.llm_client.generate_content(request)
+        with span("plan.structure", prompt_chars=len(prompt)):
+            response = self.llm_client.generate_content(request)
         if getattr(response, "text", "").strip():
             return response.text.strip()
         raise RuntimeError("スライド構成の生成に失敗しました。")
@@ -99,16 +152,33 @@ class SlideOutlineGenerator:
     ) -> SlideDocument:
         """Return a ``SlideDocument`` with slide shells selected by the LLM."""
 
+        metadata: Dict[str, object] = {"slide_structure": slide_structure}
+        with metered() as meter, traced_stage(metadata, "outline", "outline.generate") as stage:
+            slides = self._select_slides(slide_structure, context, stage)
+        store_usage(metadata, "outline", meter)
+
+        document = SlideDocument(slides=slides, metadata=metadata)
+        if context.additional_notes:
+            document.metadata.setdefault("user_notes", context.additional_notes)
+        return document
+
+    # ------------------------------------------------------------------
+    # internal helpers
+    # ------------------------------------------------------------------
+    def _select_slides(
+        self, slide_structure: str, context: GenerationContext, stage: Span
+    ) -> List[SlidePage]:
         assets = list(self.slide_library.list_assets())
         if not assets:
             raise RuntimeError("スライドライブラリにアセットが存在しません。")
+        stage.set_attribute("asset_count", len(assets))
 
         if self.llm_client is None:
-            slides = self._fallback_outline(assets, slide_structure)
-            return SlideDocument(slides=slides, metadata={"slide_structure": slide_structure})
+            return self._fallback_outline(assets, slide_structure)
 
         schema = self._build_schema(assets)
         prompt = self._build_prompt(slide_structure, context, assets)
+        stage.set_attribute("prompt_chars", len(prompt))
         request = StructuredOutputRequest(
             prompt=prompt,
             schema=schema,
@@ -122,18 +192,9 @@ class SlideOutlineGenerator:
         response = self.llm_client.generate_structured_output(request)
         parsed = self._extract_parsed_output(response)
         if not parsed:
-            slides = self._fallback_outline(assets, slide_structure)
-        else:
-            slides = self._build_slides_from_parsed(parsed)
+            return self._fallback_outline(assets, slide_structure)
+        return self._build_slides_from_parsed(parsed)
 
-        document = SlideDocument(slides=slides, metadata={"slide_structure": slide_structure})
-        if context.additional_notes:
-            document.metadata.setdefault("user_notes", context.additional_notes)
-        return document
-
-    # ------------------------------------------------------------------
-    # internal helpers
-    # ------------------------------------------------------------------
     def _build_schema(self, assets: Sequence[SlideAsset]) -> Dict[str, object]:
         asset_enum = [asset.asset_id for asset in assets]
         return {
@@ -285,6 +346,10 @@ class SlideContentGenerator:
         llm_client=None,
         internal_document_path: Optional[Path] = None,
         max_internal_chars: int = 4000,
+        chunk_store: Optional[ChunkStore] = None,
+        embedder: Optional[Embedder] = None,
+        embedding_model: str = "",
+        chunk_cache_dir: Path = Path("output/chunks"),
     ) -> None:
         self.slide_library = slide_library
         self.llm_client = llm_client
@@ -294,7 +359,13 @@ class SlideContentGenerator:
             else Path("data/internal_report.md")
         )
         self.max_internal_chars = max_internal_chars
+        self.chunk_store = chunk_store
+        self.embedder = embedder
+        self.embedding_model = embedding_model
+        self.chunk_cache_dir = Path(chunk_cache_dir)
         self._cached_internal_document: Optional[str] = None
+        self._chunk_store_synced = False
+        self._deck_excerpts: Dict[str, Optional[str]] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -305,18 +376,31 @@ class SlideContentGenerator:
         slide_id: str,
         *,
         context: GenerationContext,
+        progress: Optional[ProgressCallback] = None,
     ) -> SlideDocument:
-        """Populate a slide within ``document`` using structured LLM output."""
+        """Populate a slide within ``document`` using structured LLM output.
+
+        ``progress`` receives a ``placeholder_filled`` event for each
+        placeholder as its text is set, and an ``error`` event when the LLM
+        call fails and the placeholders fall back to their descriptions.
+        """
 
         slide = document.get_slide(slide_id)
         if slide is None:
             raise KeyError(f"Slide '{slide_id}' not found in document")
 
-        asset = self.slide_library.get_asset(slide.asset_id)
-        research_snippet = self._maybe_perform_web_search(slide, context)
-        filled_placeholders = self._generate_content_for_asset(
-            slide, asset, context, research_snippet=research_snippet
-        )
+        with attribute_usage(slide.slide_id), span(
+            "content.slide", slide_id=slide.slide_id, asset_id=slide.asset_id
+        ):
+            asset = self.slide_library.get_asset(slide.asset_id)
+            research_snippet = self._maybe_perform_web_search(slide, context)
+            filled_placeholders = self._generate_content_for_asset(
+                slide,
+                asset,
+                context,
+                research_snippet=research_snippet,
+                progress=progress,
+            )
 
         slide.placeholders = filled_placeholders
         slide.notes.setdefault("citations", [])
@@ -330,14 +414,75 @@ class SlideContentGenerator:
         return document
 
     def generate_for_document(
-        self, document: SlideDocument, *, context: GenerationContext
+        self,
+        document: SlideDocument,
+        *,
+        context: GenerationContext,
+        progress: Optional[ProgressCallback] = None,
     ) -> SlideDocument:
-        """Populate every slide in ``document`` sequentially."""
-
-        for slide in list(document.slides):
-            document = self.generate_for_slide(
-                document, slide.slide_id, context=context
-            )
+        """Populate every slide in ``document`` sequentially.
+
+        The per-slide timing breakdown is stored in
+        ``document.metadata["timings"]["content"]`` and token usage, latency
+        and estimated cost in ``document.metadata["usage"]["content"]``.
+
+        ``progress`` is called with a :class:`ProgressEvent` as each slide
+        starts, for each filled placeholder, when the slide is done (carrying
+        the populated slide) and once the whole document is done, so callers
+        can show slides as soon as they complete.
+
+        Every slide's request starts with the same deck-level prompt prefix,
+        including one internal-document excerpt retrieved for the user
+        request, so providers can serve the prefix from their prompt cache.
+        """
+
+        slides = list(document.slides)
+        total = len(slides)
+        started = time.perf_counter()
+        with document.batch():
+            with metered() as meter, traced_stage(
+                document.metadata, "content", "content.document", slide_count=total
+            ):
+                for index, slide in enumerate(slides, start=1):
+                    _emit(progress, ProgressEvent("slide_started", slide.slide_id, index, total))
+                    slide_started = time.perf_counter()
+                    try:
+                        document = self.generate_for_slide(
+                            document,
+                            slide.slide_id,
+                            context=context,
+                            progress=_indexed(progress, index, total),
+                        )
+                    except Exception as exc:
+                        _emit(
+                            progress,
+                            ProgressEvent(
+                                "error", slide.slide_id, index, total, error=f"{type(exc).__name__}: {exc}"
+                            ),
+                        )
+                        raise
+                    filled = document.get_slide(slide.slide_id)
+                    _emit(
+                        progress,
+                        ProgressEvent(
+                            "slide_done",
+                            slide.slide_id,
+                            index,
+                            total,
+                            elapsed_ms=round((time.perf_counter() - slide_started) * 1000, 3),
+                            slide=filled,
+                        ),
+                    )
+            store_usage(document.metadata, "content", meter)
+        _emit(
+            progress,
+            ProgressEvent(
+                "document_done",
+                index=total,
+                total=total,
+                elapsed_ms=round((time.perf_counter() - started) * 1000, 3),
+            ),
+        )
         return document
 
     # ------------------------------------------------------------------
@@ -350,6 +495,7 @@ class SlideContentGenerator:
         context: GenerationContext,
         *,
         research_snippet: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
     ) -> List[SlidePlaceholderContent]:
         editable_specs = [
             ph for ph in asset.placeholders if ph.edit_policy.lower() == "generate"
@@ -360,19 +506,29 @@ class SlideContentGenerator:
         slide_citations: List[str] = []
 
         if editable_specs and self.llm_client is not None:
-            internal_document = (
-                context.internal_document or self._load_internal_document()
+            internal_document = context.internal_document or self._deck_internal_document(
+                context.user_request
             )
-            prompt = self._build_prompt(
+            prefix = self._build_prompt_prefix(context, internal_document)
+            prompt = prefix + self._build_prompt_suffix(
                 slide,
                 asset,
-                context,
-                internal_document,
-                research_snippet=research_snippet,
+                editable_specs,
+                # The deck-level research summary takes precedence.
+                research_snippet=None if context.external_research else research_snippet,
+                internal_snippet=(
+                    None
+                    if context.internal_document
+                    else self._slide_internal_excerpt(slide, asset, internal_document)
+                ),
             )
-            schema = self._build_schema(editable_specs)
+            schema = self._build_schema([spec.name for spec in editable_specs])
+            active = current_span()
+            if active is not None:
+                active.set_attributes(prompt_chars=len(prompt), prompt_prefix_chars=len(prefix))
             request = StructuredOutputRequest(
                 prompt=prompt,
+                cacheable_prefix_chars=len(prefix),
                 schema=schema,
                 schema_name="slide_content",
                 instructions=(
@@ -398,6 +554,10 @@ class SlideContentGenerator:
                     slide_citations = list(parsed.get("citations", []))
             except Exception as exc:  # pragma: no cover - safety net
                 LOGGER.warning("Structured output generation failed: %s", exc)
+                _emit(
+                    progress,
+                    ProgressEvent("error", slide.slide_id, error=f"{type(exc).__name__}: {exc}"),
+                )
 
         placeholders: List[SlidePlaceholderContent] = []
         target_company = context.target_company or _infer_target_entity(
@@ -420,13 +580,21 @@ class SlideContentGenerator:
                 text = spec.description
                 references = []
 
-            placeholders.append(
-                SlidePlaceholderContent(
-                    name=spec.name,
-                    text=text.strip(),
-                    policy=policy,
-                    references=references,
-                )
+            placeholder = SlidePlaceholderContent(
+                name=spec.name,
+                text=text.strip(),
+                policy=policy,
+                references=references,
+            )
+            placeholders.append(placeholder)
+            _emit(
+                progress,
+                ProgressEvent(
+                    "placeholder_filled",
+                    slide.slide_id,
+                    placeholder=placeholder.name,
+                    text=placeholder.text,
+                ),
             )
 
         if slide_summary:
@@ -436,24 +604,18 @@ class SlideContentGenerator:
 
         return placeholders
 
-    def _build_prompt(
-        self,
-        slide: SlidePage,
-        asset: SlideAsset,
-        context: GenerationContext,
-        internal_document: Optional[str],
-        *,
-        research_snippet: Optional[str] = None,
+    def _build_prompt_prefix(
+        self, context: GenerationContext, internal_document: Optional[str]
     ) -> str:
+        """Return the part of the prompt shared by every slide of the deck.
+
+        Providers cache prompts by prefix, so everything that does not depend
+        on the slide comes first and stays byte-identical across slides.
+        """
+
         target_company = context.target_company or _infer_target_entity(
             context.user_request
         )
-        placeholder_lines = []
-        for spec in asset.placeholders:
-            placeholder_lines.append(
-                f"- {spec.name} [{spec.edit_policy}]: {spec.description}"
-            )
-
         prompt_sections = [
             "あなたは日本語のプレゼンテーションライターです。",
             "テンプレートの説明とユーザーの要望を踏まえ、指定されたプレースホルダーに適切なテキストを生成してください。",
@@ -462,17 +624,10 @@ class SlideContentGenerator:
             "2. 断定は避け、必要に応じて出典番号を含める。",
             "3. プレースホルダーの説明に従う。",
             "",
-            f"[スライド情報]\nID: {slide.slide_id}\nページ番号: {slide.page_number}",
-            f"テンプレートファイル: {asset.file_name}\nカテゴリ: {asset.category or '不明'}",
-            f"用途: {asset.description}",
-            f"スライドタイトル: {slide.title or '未設定'}",
             f"想定読者(推定): {target_company or '未特定'}",
             "",
             "[ユーザーからのリクエスト]",
             context.user_request,
-            "",
-            "[プレースホルダー詳細]",
-            "\n".join(placeholder_lines),
         ]
 
         if context.external_research:
@@ -483,14 +638,6 @@ class SlideContentGenerator:
                     _truncate_text(context.external_research, 1500),
                 ]
             )
-        elif research_snippet:
-            prompt_sections.extend(
-                [
-                    "",
-                    "[自動Webリサーチ結果]",
-                    _truncate_text(research_snippet, 1500),
-                ]
-            )
 
         if internal_document:
             prompt_sections.extend(
@@ -510,8 +657,56 @@ class SlideContentGenerator:
                 ]
             )
 
+        return "\n".join(prompt_sections) + "\n\n"
+
+    def _build_prompt_suffix(
+        self,
+        slide: SlidePage,
+        asset: SlideAsset,
+        editable_specs: Sequence[PlaceholderSpec],
+        *,
+        research_snippet: Optional[str] = None,
+        internal_snippet: Optional[str] = None,
+    ) -> str:
+        """Return the slide-specific part of the prompt."""
+
+        placeholder_lines = []
+        for spec in asset.placeholders:
+            placeholder_lines.append(
+                f"- {spec.name} [{spec.edit_policy}]: {spec.description}"
+            )
+
+        prompt_sections = [
+            f"[スライド情報]\nID: {slide.slide_id}\nページ番号: {slide.page_number}",
+            f"テンプレートファイル: {asset.file_name}\nカテゴリ: {asset.category or '不明'}",
+            f"用途: {asset.description}",
+            f"スライドタイトル: {slide.title or '未設定'}",
+            "",
+            "[プレースホルダー詳細]",
+            "\n".join(placeholder_lines),
+            "生成対象: " + ", ".join(spec.name for spec in editable_specs),
+        ]
+
+        if internal_snippet:
+            prompt_sections.extend(
+                [
+                    "",
+                    "[このスライドに関連する内部ドキュメント抜粋]",
+                    internal_snippet,
+                ]
+            )
+
+        if research_snippet:
+            prompt_sections.extend(
+                [
+                    "",
+                    "[自動Webリサーチ結果]",
+                    _truncate_text(research_snippet, 1500),
+                ]
+            )
+
         prompt_sections.append(
-            "出力はJSONのみ。各プレースホルダーのcontentは200文字以内。"
+            "出力はJSONのみ。生成対象のプレースホルダーだけを含め、各プレースホルダーのcontentは200文字以内。"
         )
 
         return "\n".join(prompt_sections)
@@ -532,7 +727,8 @@ class SlideContentGenerator:
                 max_search_results=3,
                 model_name=getattr(self.llm_client, "model_name", None),
             )
-            response = self.llm_client.web_search(request)
+            with span("content.web_search", slide_id=slide.slide_id, prompt_chars=len(prompt)):
+                response = self.llm_client.web_search(request)
             if response is None:
                 return None
             if getattr(response, "text", None):
@@ -545,8 +741,8 @@ class SlideContentGenerator:
             LOGGER.debug("Web search skipped due to error: %s", exc)
         return None
 
-    def _build_schema(self, placeholders: Sequence[PlaceholderSpec]) -> Dict[str, object]:
-        placeholder_enum = [spec.name for spec in placeholders]
+    def _build_schema(self, placeholder_names: Sequence[str]) -> Dict[str, object]:
+        placeholder_enum = list(dict.fromkeys(placeholder_names))
         return {
             "type": "object",
             "properties": {
@@ -606,7 +802,9 @@ class SlideContentGenerator:
             LOGGER.warning("Validation error: %s", response.validation_error)
         return None
 
-    def _load_internal_document(self) -> Optional[str]:
+    def _load_internal_document(self, query: Optional[str] = None) -> Optional[str]:
+        if self.chunk_store is not None or self.internal_document_path.is_dir():
+            return self._load_internal_chunks(query)
         if self._cached_internal_document is not None:
             return self._cached_internal_document
         if not self.internal_document_path.exists():
@@ -617,6 +815,89 @@ class SlideContentGenerator:
         self._cached_internal_document = raw[: self.max_internal_chars]
         return self._cached_internal_document
 
+    def _load_internal_chunks(self, query: Optional[str]) -> Optional[str]:
+        """Return an excerpt of the chunked internal corpus.
+
+        The directory is ingested once per generator; only changed files are
+        re-chunked and re-embedded. With an embedder the excerpt is built from
+        the chunks most similar to ``query``, otherwise in reading order.
+        """
+
+        return _join_chunks(self._internal_chunks(query), self.max_internal_chars)
+
+    def _internal_chunks(self, query: Optional[str]) -> List[Any]:
+        if self.chunk_store is None:
+            self.chunk_store = self._default_chunk_store()
+        if not self._chunk_store_synced and self.internal_document_path.is_dir():
+            report = self.chunk_store.ingest(self.internal_document_path)
+            LOGGER.info(
+                "Ingested internal documents: %d added, %d updated, %d removed, %d embedded",
+                len(report.added),
+                len(report.updated),
+                len(report.removed),
+                report.embedded_chunks,
+            )
+            self._chunk_store_synced = True
+
+        if query and self.chunk_store.embedder is not None:
+            return self.chunk_store.search(query, top_k=8)
+        return self.chunk_store.chunks()
+
+    def _deck_internal_document(self, user_request: str) -> Optional[str]:
+        """Return the internal excerpt shared by every slide of a deck.
+
+        It is retrieved by the user request alone and memoised, so the deck
+        prompt prefix stays byte-identical across slides.
+        """
+
+        if user_request not in self._deck_excerpts:
+            with span(
+                "content.internal_document",
+                cache_hit=self._cached_internal_document is not None or self._chunk_store_synced,
+            ):
+                self._deck_excerpts[user_request] = self._load_internal_document(user_request)
+        return self._deck_excerpts[user_request]
+
+    def _slide_internal_excerpt(
+        self, slide: SlidePage, asset: SlideAsset, deck_excerpt: Optional[str]
+    ) -> Optional[str]:
+        """Return chunks relevant to this slide that the deck excerpt lacks.
+
+        Only available with an embedder; without one the chunks come in
+        reading order and the deck excerpt already starts with them.
+        """
+
+        if self.chunk_store is None or self.chunk_store.embedder is None:
+            return None
+        query = " ".join(filter(None, [slide.title, asset.description]))
+        if not query:
+            return None
+        chunks = [
+            chunk
+            for chunk in self._internal_chunks(query)
+            if chunk.text not in (deck_excerpt or "")
+        ]
+        return _join_chunks(chunks, self.max_internal_chars // 4)
+
+    def _default_chunk_store(self) -> ChunkStore:
+        """Open the chunk cache for the corpus under :attr:`chunk_cache_dir`.
+
+        The cache is kept out of the corpus directory (which may be read-only
+        or shared) and named after the corpus path, so each corpus gets its
+        own database.
+        """
+
+        from .chunk_store import ChunkStore
+
+        corpus = str(self.internal_document_path.resolve())
+        digest = hashlib.sha256(corpus.encode("utf-8")).hexdigest()[:16]
+        self.chunk_cache_dir.mkdir(parents=True, exist_ok=True)
+        return ChunkStore(
+            self.chunk_cache_dir / f"{digest}.sqlite3",
+            embedder=self.embedder,
+            embedding_model=self.embedding_model,
+        )
+
     def _accumulate_references(self, document: SlideDocument, citations: List[str]) -> None:
         if not citations:
             return
@@ -630,6 +911,30 @@ class SlideContentGenerator:
 # Helper functions
 # ---------------------------------------------------------------------------
 
+def _join_chunks(chunks: Sequence[Any], max_chars: int) -> Optional[str]:
+    excerpt: List[str] = []
+    used = 0
+    for chunk in chunks:
+        if used + len(chunk.text) > max_chars:
+            break
+        excerpt.append(chunk.text)
+        used += len(chunk.text) + 2
+    return "\n\n".join(excerpt) or None
+
+
+def _indexed(progress: Optional[ProgressCallback], index: int, total: int) -> Optional[ProgressCallback]:
+    """Fill in the slide position on events raised below :meth:`generate_for_slide`."""
+
+    if progress is None:
+        return None
+
+    def forward(event: ProgressEvent) -> None:
+        event.index, event.total = index, total
+        progress(event)
+
+    return forward
+
+
 def _normalize_fixed_text(description: str) -> str:
     text = description or ""
     text = re.sub(r"[「」]", "", text)
@@ -0,0 +1,363 @@
+"""Append-only edit journal for slide documents."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from .slide_codecs import SlideDocumentCodec, decode_document, encode_document
+from .slide_document import (
+    REVISION_KEY,
+    SlideDocumentConflictError,
+    SlideDocumentStore,
+    _atomic_write_bytes,
+)
+from .slide_models import SlideDocument, SlidePage, SlidePlaceholderContent
+
+LOGGER = logging.getLogger(__name__)
+
+JOURNAL_SEQ_KEY = "journal_seq"
+
+_SEQ_PATTERN = re.compile(rb'^\{"seq":(\d+),')
+
+
+class JournaledSlideDocumentStore(SlideDocumentStore):
+    """Store that records each edit as a small journal entry.
+
+    ``<path>.journal`` holds one JSON record per mutation and ``<path>``
+    holds the latest compacted snapshot (readable by a plain
+    :class:`SlideDocumentStore`). Loading replays the journal on top of the
+    snapshot, so a save costs as much as the edit rather than the deck.
+    The journal keeps full history unless compacted with ``prune=True``,
+    which makes :meth:`load` with ``at_seq`` and :meth:`undo` possible.
+    The journal sequence number doubles as the document revision.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        codec: Union[str, SlideDocumentCodec, None] = None,
+        snapshot_every: int = 50,
+    ) -> None:
+        super().__init__(path, codec=codec)
+        self.journal_path = self.path.with_name(self.path.name + ".journal")
+        self.snapshot_every = snapshot_every
+        self._snapshot_seq: Optional[int] = None
+        self._snapshot_stat: Optional[Tuple[int, int, int]] = None
+        # Slide ids as of ``_slide_ids_seq``, kept current by ``_append`` so
+        # edits can be validated without replaying the journal.
+        self._slide_ids: Set[str] = set()
+        self._slide_ids_seq: Optional[int] = None
+
+    # ------------------------------------------------------------------
+    # Store interface
+    # ------------------------------------------------------------------
+    def load(self, *, at_seq: Optional[int] = None) -> SlideDocument:
+        """Return the document as of ``at_seq`` (latest when ``None``)."""
+
+        snapshot = self._read_snapshot()
+        snapshot_seq = _pop_journal_seq(snapshot) if snapshot is not None else 0
+        if snapshot is not None and (at_seq is None or at_seq >= snapshot_seq):
+            document, start = snapshot, snapshot_seq
+        else:
+            document, start = SlideDocument(), 0
+
+        replayed = start
+        with document.batch():
+            for record in self._iter_records(after=start):
+                if at_seq is not None and record["seq"] > at_seq:
+                    break
+                if replayed == 0 and record["seq"] != 1:
+                    raise ValueError(
+                        f"Journal history before seq {record['seq']} was pruned"
+                    )
+                _apply_record(document, record)
+                replayed = record["seq"]
+
+        if at_seq is not None and replayed < min(at_seq, snapshot_seq):
+            raise ValueError(f"Journal history before seq {snapshot_seq} was pruned")
+        if replayed == 0 and snapshot is None and at_seq is None:
+            raise FileNotFoundError(f"slide.json not found at {self.path}")
+        document.metadata[REVISION_KEY] = replayed
+        if at_seq is None:
+            self._slide_ids = {slide.slide_id for slide in document.slides}
+            self._slide_ids_seq = replayed
+        return document
+
+    def save(
+        self, document: SlideDocument, *, expected_revision: Optional[int] = None
+    ) -> int:
+        """Record ``document`` as a full replacement and return the new seq."""
+
+        payload = document.to_dict()
+        payload["metadata"].pop(REVISION_KEY, None)
+        seq = self._append(
+            {"op": "replace_document", "document": payload},
+            expected_revision=expected_revision,
+        )
+        document.metadata[REVISION_KEY] = seq
+        return seq
+
+    def current_revision(self) -> int:
+        return self.last_seq()
+
+    # ------------------------------------------------------------------
+    # Incremental edits
+    # ------------------------------------------------------------------
+    def upsert_slide(
+        self, slide: SlidePage, *, expected_revision: Optional[int] = None
+    ) -> int:
+        return self._append(
+            {"op": "upsert_slide", "slide": slide.to_dict()},
+            expected_revision=expected_revision,
+        )
+
+    def set_placeholder_text(
+        self,
+        slide_id: str,
+        placeholder_name: str,
+        text: str,
+        *,
+        references: Optional[List[str]] = None,
+        expected_revision: Optional[int] = None,
+    ) -> int:
+        record: Dict[str, Any] = {
+            "op": "set_placeholder_text",
+            "slide_id": slide_id,
+            "placeholder_name": placeholder_name,
+            "text": text,
+        }
+        if references is not None:
+            record["references"] = list(references)
+
+        def require_slide(slide_ids: Set[str]) -> None:
+            if slide_id not in slide_ids:
+                raise KeyError(f"Slide '{slide_id}' not found in document")
+
+        return self._append(
+            record, expected_revision=expected_revision, validate=require_slide
+        )
+
+    def set_metadata(
+        self, key: str, value: Any, *, expected_revision: Optional[int] = None
+    ) -> int:
+        return self._append(
+            {"op": "set_metadata", "key": key, "value": value},
+            expected_revision=expected_revision,
+        )
+
+    def undo(self, steps: int = 1) -> SlideDocument:
+        """Revert the last ``steps`` journal entries by recording the old state."""
+
+        target = max(self.last_seq() - steps, 0)
+        document = self.load(at_seq=target)
+        self.save(document)
+        return document
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+    def compact(self, *, prune: bool = False) -> int:
+        """Write a snapshot of the latest state and return its seq.
+
+        With ``prune=True`` journal entries covered by the snapshot are
+        dropped, which also discards history for :meth:`undo`.
+        """
+
+        with self._locked():
+            return self._compact_locked(prune=prune)
+
+    def last_seq(self) -> int:
+        """Return the sequence number of the newest journal entry."""
+
+        return max(self._journal_tail_seq(), self._known_snapshot_seq())
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _journal_tail_seq(self) -> int:
+        if not self.journal_path.exists():
+            return 0
+        with open(self.journal_path, "rb") as handle:
+            position = handle.seek(0, os.SEEK_END)
+            buffer = b""
+            while position > 0:
+                step = min(4096, position)
+                position -= step
+                handle.seek(position)
+                buffer = handle.read(step) + buffer
+                # Ignore a torn trailing line left behind by a crash.
+                complete = buffer[: buffer.rfind(b"\n") + 1]
+                lines = complete.rstrip(b"\n").split(b"\n")
+                if len(lines) > 1 or (position == 0 and lines[-1]):
+                    return _record_seq(lines[-1])
+        return 0
+
+    def _append(
+        self,
+        record: Dict[str, Any],
+        *,
+        expected_revision: Optional[int] = None,
+        validate: Optional[Callable[[Set[str]], None]] = None,
+    ) -> int:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._locked():
+            current = self.last_seq()
+            if expected_revision is not None and expected_revision != current:
+                raise SlideDocumentConflictError(self.path, expected_revision, current)
+            if validate is not None:
+                # Checked against the slide ids under the lock so that a
+                # record which cannot be replayed is never written.
+                validate(self._slide_ids_at(current))
+            seq = current + 1
+            line = _encode_record({"seq": seq, **record})
+            self._truncate_torn_tail()
+            with open(self.journal_path, "ab") as handle:
+                handle.write(line)
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._track_slide_ids(record, previous_seq=current, seq=seq)
+            if seq - self._known_snapshot_seq() >= self.snapshot_every:
+                self._compact_locked(prune=False)
+        return seq
+
+    def _slide_ids_at(self, seq: int) -> Set[str]:
+        if self._slide_ids_seq != seq:
+            # Another writer appended since the ids were tracked; replay once.
+            self.load()
+        return self._slide_ids
+
+    def _track_slide_ids(
+        self, record: Dict[str, Any], *, previous_seq: int, seq: int
+    ) -> None:
+        if self._slide_ids_seq != previous_seq:
+            if record["op"] != "replace_document":
+                return
+            self._slide_ids = set()
+        if record["op"] == "replace_document":
+            self._slide_ids = {
+                item.get("slide_id", "") for item in record["document"].get("slides", [])
+            }
+        elif record["op"] == "upsert_slide":
+            self._slide_ids.add(record["slide"].get("slide_id", ""))
+        self._slide_ids_seq = seq
+
+    def _compact_locked(self, *, prune: bool) -> int:
+        document = self.load()
+        seq = int(document.metadata.pop(REVISION_KEY, 0))
+        document.metadata[JOURNAL_SEQ_KEY] = seq
+        _atomic_write_bytes(self.path, encode_document(document, self.codec))
+        self._snapshot_seq = seq
+        self._snapshot_stat = self._stat_snapshot()
+        if prune and self.journal_path.exists():
+            kept = [
+                line
+                for line in self.journal_path.read_bytes().splitlines(keepends=True)
+                if _record_seq(line) > seq
+            ]
+            _atomic_write_bytes(self.journal_path, b"".join(kept))
+        return seq
+
+    def _truncate_torn_tail(self) -> None:
+        if not self.journal_path.exists():
+            return
+        with open(self.journal_path, "r+b") as handle:
+            size = handle.seek(0, os.SEEK_END)
+            if size == 0:
+                return
+            handle.seek(size - 1)
+            if handle.read(1) == b"\n":
+                return
+            handle.seek(0)
+            data = handle.read()
+            handle.truncate(data.rfind(b"\n") + 1)
+
+    def _known_snapshot_seq(self) -> int:
+        # Another store instance (or process) may have compacted since the
+        # seq was cached; snapshots are replaced atomically, so a changed
+        # inode/mtime/size means the cached value is stale.
+        stat = self._stat_snapshot()
+        if self._snapshot_seq is None or stat != self._snapshot_stat:
+            snapshot = self._read_snapshot()
+            self._snapshot_seq = (
+                _pop_journal_seq(snapshot) if snapshot is not None else 0
+            )
+            self._snapshot_stat = stat
+        return self._snapshot_seq
+
+    def _read_snapshot(self) -> Optional[SlideDocument]:
+        if not self.path.exists():
+            return None
+        return decode_document(self.path.read_bytes(), self.codec)
+
+    def _iter_records(self, *, after: int) -> Iterator[Dict[str, Any]]:
+        if not self.journal_path.exists():
+            return
+        with open(self.journal_path, "rb") as handle:
+            for line in handle:
+                # Skip already-snapshotted entries without parsing them.
+                if _record_seq(line) <= after:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-append is ignored.
+                    return
+
+
+# ----------------------------------------------------------------------
+# Helper functions
+# ----------------------------------------------------------------------
+
+def _encode_record(record: Dict[str, Any]) -> bytes:
+    return (
+        json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+    ).encode("utf-8")
+
+
+def _record_seq(line: bytes) -> int:
+    match = _SEQ_PATTERN.match(line)
+    return int(match.group(1)) if match else 0
+
+
+def _pop_journal_seq(document: SlideDocument) -> int:
+    document.metadata.pop(REVISION_KEY, None)
+    return int(document.metadata.pop(JOURNAL_SEQ_KEY, 0))
+
+
+def _apply_record(document: SlideDocument, record: Dict[str, Any]) -> None:
+    op = record.get("op")
+    if op == "replace_document":
+        replacement = SlideDocument.from_dict(record["document"], copy=False)
+        document.slides = replacement.slides
+        document.metadata = replacement.metadata
+    elif op == "upsert_slide":
+        document.upsert_slide(SlidePage.from_dict(record["slide"], copy=False))
+    elif op == "set_placeholder_text":
+        slide = document.get_slide(record["slide_id"])
+        if slide is None:
+            # Journals written before edits were validated may hold such
+            # records; skipping keeps every later entry loadable.
+            LOGGER.warning(
+                "Skipping journal seq %s: slide '%s' not found",
+                record.get("seq"),
+                record["slide_id"],
+            )
+            return
+        name = record["placeholder_name"]
+        placeholder = next((ph for ph in slide.placeholders if ph.name == name), None)
+        if placeholder is None:
+            placeholder = SlidePlaceholderContent(name=name, text="", policy="generate")
+            slide.placeholders.append(placeholder)
+        placeholder.text = record["text"]
+        if "references" in record:
+            placeholder.references = list(record["references"])
+    elif op == "set_metadata":
+        document.metadata[record["key"]] = record["value"]
+    else:
+        raise ValueError(f"Unknown journal operation: {op}")
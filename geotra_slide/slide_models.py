@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 
 @dataclass(slots=True)
@@ -105,12 +106,15 @@ class SlidePlaceholderContent:
         }
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "SlidePlaceholderContent":
+    def from_dict(
+        cls, data: Dict[str, Any], *, copy: bool = True
+    ) -> "SlidePlaceholderContent":
+        references = data.get("references") or []
         return cls(
             name=data.get("placeholder_name", ""),
             text=data.get("content", ""),
             policy=data.get("policy", "generate"),
-            references=list(data.get("references", [])),
+            references=list(references) if copy else references,
         )
 
 
@@ -138,7 +142,8 @@ class SlidePage:
         }
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "SlidePage":
+    def from_dict(cls, data: Dict[str, Any], *, copy: bool = True) -> "SlidePage":
+        notes = data.get("notes") or {}
         return cls(
             slide_id=data.get("slide_id", ""),
             page_number=int(data.get("page", 1)),
@@ -146,19 +151,35 @@ class SlidePage:
             asset_file=data.get("asset_file", ""),
             title=data.get("title"),
             placeholders=[
-                SlidePlaceholderContent.from_dict(item)
+                SlidePlaceholderContent.from_dict(item, copy=copy)
                 for item in data.get("placeholders", [])
             ],
-            notes=dict(data.get("notes", {})),
+            notes=dict(notes) if copy else notes,
         )
 
 
 @dataclass(slots=True)
 class SlideDocument:
-    """Container for all slides that compose the current deck."""
+    """Container for all slides that compose the current deck.
+
+    Slides are kept ordered by ``page_number``. A ``slide_id`` → position
+    index is maintained alongside ``slides`` so lookups and upserts do not
+    scan the whole deck. The index is rebuilt lazily whenever ``slides`` is
+    replaced, resized or has its first or last slide id change from outside
+    the helpers below; a stale position found in the index also triggers a
+    rebuild.
+    """
 
     slides: List[SlidePage] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _index: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _index_key: Optional[Tuple[Any, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _ordered: bool = field(default=True, init=False, repr=False, compare=False)
+    _batch_depth: int = field(default=0, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -167,22 +188,111 @@ class SlideDocument:
         }
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "SlideDocument":
+    def from_dict(cls, data: Dict[str, Any], *, copy: bool = True) -> "SlideDocument":
+        """Build a document from ``data``.
+
+        Pass ``copy=False`` when ``data`` was freshly decoded and is not shared
+        with anyone else; nested ``notes``/``metadata`` dicts and reference
+        lists are then adopted as-is instead of being copied.
+        """
+
         slides = [
-            SlidePage.from_dict(item)
+            SlidePage.from_dict(item, copy=copy)
             for item in data.get("slides", [])
         ]
-        metadata = dict(data.get("metadata", {}))
-        return cls(slides=slides, metadata=metadata)
+        metadata = data.get("metadata") or {}
+        return cls(slides=slides, metadata=dict(metadata) if copy else metadata)
 
     def get_slide(self, slide_id: str) -> Optional[SlidePage]:
-        return next((slide for slide in self.slides if slide.slide_id == slide_id), None)
+        position = self._position(slide_id)
+        return self.slides[position] if position is not None else None
 
     def upsert_slide(self, slide: SlidePage) -> None:
-        for idx, existing in enumerate(self.slides):
-            if existing.slide_id == slide.slide_id:
-                self.slides[idx] = slide
-                break
-        else:
+        position = self._position(slide.slide_id)
+        if position is None:
+            position = len(self.slides)
             self.slides.append(slide)
+            self._index[slide.slide_id] = position
+        else:
+            self.slides[position] = slide
+        self._index_key = self._slides_key()
+        if self._ordered and not self._in_order_at(position):
+            self._ordered = False
+        if self._batch_depth == 0:
+            self._restore_order()
+
+    def upsert_many(self, slides: Iterable[SlidePage]) -> None:
+        """Upsert every slide in ``slides`` and sort the deck once."""
+
+        with self.batch():
+            for slide in slides:
+                self.upsert_slide(slide)
+
+    @contextmanager
+    def batch(self) -> Iterator["SlideDocument"]:
+        """Defer re-sorting ``slides`` until the outermost batch exits.
+
+        Lookups stay valid inside the batch because positions only change
+        when the deck is sorted on exit.
+        """
+
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._restore_order()
+
+    # ------------------------------------------------------------------
+    # index helpers
+    # ------------------------------------------------------------------
+    def _slides_key(self) -> Tuple[Any, ...]:
+        # The end slide ids catch same-length edits such as pop() + append().
+        if not self.slides:
+            return (id(self.slides), 0)
+        return (
+            id(self.slides),
+            len(self.slides),
+            self.slides[0].slide_id,
+            self.slides[-1].slide_id,
+        )
+
+    def _position(self, slide_id: str) -> Optional[int]:
+        if self._index_key != self._slides_key():
+            self._reindex()
+        position = self._index.get(slide_id)
+        if position is not None and self.slides[position].slide_id != slide_id:
+            # A slide in the middle was replaced in place; the entry is stale.
+            self._reindex()
+            position = self._index.get(slide_id)
+        return position
+
+    def _reindex(self) -> None:
+        self._index = {}
+        for position, slide in enumerate(self.slides):
+            self._index.setdefault(slide.slide_id, position)
+        self._index_key = self._slides_key()
+        self._ordered = all(
+            previous.page_number <= current.page_number
+            for previous, current in zip(self.slides, self.slides[1:])
+        )
+
+    def _in_order_at(self, position: int) -> bool:
+        page_number = self.slides[position].page_number
+        if position > 0 and self.slides[position - 1].page_number > page_number:
+            return False
+        if (
+            position + 1 < len(self.slides)
+            and self.slides[position + 1].page_number < page_number
+        ):
+            return False
+        return True
+
+    def _restore_order(self) -> None:
+        if self._index_key != self._slides_key():
+            self._reindex()
+        if self._ordered:
+            return
         self.slides.sort(key=lambda item: item.page_number)
+        self._reindex()
@@ -0,0 +1,334 @@
+"""SQLite-backed persistence for many slide documents."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .slide_document import REVISION_KEY, SlideDocumentConflictError
+from .slide_models import SlideDocument, SlidePage, SlidePlaceholderContent
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    document_id TEXT PRIMARY KEY,
+    revision INTEGER NOT NULL,
+    metadata TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS slides (
+    document_id TEXT NOT NULL REFERENCES documents(document_id) ON DELETE CASCADE,
+    slide_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    page_number INTEGER NOT NULL,
+    asset_id TEXT NOT NULL,
+    asset_file TEXT NOT NULL,
+    title TEXT,
+    notes TEXT NOT NULL,
+    PRIMARY KEY (document_id, slide_id)
+);
+CREATE INDEX IF NOT EXISTS slides_by_page ON slides (document_id, page_number, position);
+CREATE INDEX IF NOT EXISTS slides_by_asset ON slides (asset_id, document_id);
+CREATE TABLE IF NOT EXISTS placeholders (
+    document_id TEXT NOT NULL,
+    slide_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    content TEXT NOT NULL,
+    policy TEXT NOT NULL,
+    refs TEXT NOT NULL,
+    PRIMARY KEY (document_id, slide_id, position),
+    FOREIGN KEY (document_id, slide_id)
+        REFERENCES slides(document_id, slide_id) ON DELETE CASCADE
+);
+"""
+
+
+class SqliteSlideDocumentStore:
+    """Persist slide documents in a shared SQLite database.
+
+    Each store instance addresses one ``document_id`` inside ``path`` and
+    offers the same ``load``/``save`` interface as
+    :class:`~geotra_slide.slide_document.SlideDocumentStore`. Slides and
+    placeholders live in their own indexed tables, so single slides can be
+    read or updated without loading the whole deck. The database runs in
+    WAL mode so concurrent sessions can read while one writes.
+    """
+
+    def __init__(self, path: Path, document_id: str = "default", *, timeout: float = 30.0) -> None:
+        self.path = Path(path)
+        self.document_id = document_id
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def for_document(self, document_id: str) -> "SqliteSlideDocumentStore":
+        """Return a store for another document in the same database."""
+
+        return type(self)(self.path, document_id, timeout=self.timeout)
+
+    # ------------------------------------------------------------------
+    # Store interface
+    # ------------------------------------------------------------------
+    def load(self) -> SlideDocument:
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT revision, metadata FROM documents WHERE document_id = ?",
+            (self.document_id,),
+        ).fetchone()
+        if row is None:
+            raise FileNotFoundError(
+                f"Slide document '{self.document_id}' not found in {self.path}"
+            )
+        slides = self._select_slides("document_id = ?", (self.document_id,))
+        metadata = json.loads(row[1])
+        metadata[REVISION_KEY] = row[0]
+        return SlideDocument(slides=slides, metadata=metadata)
+
+    def save(
+        self, document: SlideDocument, *, expected_revision: Optional[int] = None
+    ) -> int:
+        """Replace the stored document and return its new revision."""
+
+        metadata = dict(document.metadata)
+        metadata.pop(REVISION_KEY, None)
+        with self._write(expected_revision) as (connection, revision):
+            connection.execute(
+                "UPDATE documents SET metadata = ? WHERE document_id = ?",
+                (_dumps(metadata), self.document_id),
+            )
+            connection.execute(
+                "DELETE FROM slides WHERE document_id = ?", (self.document_id,)
+            )
+            for position, slide in enumerate(document.slides):
+                self._insert_slide(connection, slide, position)
+        document.metadata[REVISION_KEY] = revision
+        return revision
+
+    def current_revision(self) -> int:
+        row = self._connection().execute(
+            "SELECT revision FROM documents WHERE document_id = ?", (self.document_id,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    # ------------------------------------------------------------------
+    # Per-slide access
+    # ------------------------------------------------------------------
+    def load_slide(self, slide_id: str) -> Optional[SlidePage]:
+        slides = self._select_slides(
+            "document_id = ? AND slide_id = ?", (self.document_id, slide_id)
+        )
+        return slides[0] if slides else None
+
+    def upsert_slide(
+        self, slide: SlidePage, *, expected_revision: Optional[int] = None
+    ) -> int:
+        with self._write(expected_revision) as (connection, revision):
+            row = connection.execute(
+                "SELECT position FROM slides WHERE document_id = ? AND slide_id = ?",
+                (self.document_id, slide.slide_id),
+            ).fetchone()
+            if row is None:
+                row = connection.execute(
+                    "SELECT COALESCE(MAX(position) + 1, 0) FROM slides WHERE document_id = ?",
+                    (self.document_id,),
+                ).fetchone()
+            else:
+                connection.execute(
+                    "DELETE FROM slides WHERE document_id = ? AND slide_id = ?",
+                    (self.document_id, slide.slide_id),
+                )
+            self._insert_slide(connection, slide, row[0])
+        return revision
+
+    def set_placeholder_text(
+        self,
+        slide_id: str,
+        placeholder_name: str,
+        text: str,
+        *,
+        references: Optional[List[str]] = None,
+        expected_revision: Optional[int] = None,
+    ) -> int:
+        with self._write(expected_revision) as (connection, revision):
+            if references is None:
+                cursor = connection.execute(
+                    "UPDATE placeholders SET content = ?"
+                    " WHERE document_id = ? AND slide_id = ? AND name = ?",
+                    (text, self.document_id, slide_id, placeholder_name),
+                )
+            else:
+                cursor = connection.execute(
+                    "UPDATE placeholders SET content = ?, refs = ?"
+                    " WHERE document_id = ? AND slide_id = ? AND name = ?",
+                    (text, _dumps(list(references)), self.document_id, slide_id, placeholder_name),
+                )
+            if cursor.rowcount == 0:
+                raise KeyError(
+                    f"Placeholder '{placeholder_name}' not found in slide '{slide_id}'"
+                )
+        return revision
+
+    def set_metadata(
+        self, key: str, value: Any, *, expected_revision: Optional[int] = None
+    ) -> int:
+        with self._write(expected_revision) as (connection, revision):
+            row = connection.execute(
+                "SELECT metadata FROM documents WHERE document_id = ?",
+                (self.document_id,),
+            ).fetchone()
+            metadata = json.loads(row[0])
+            metadata[key] = value
+            connection.execute(
+                "UPDATE documents SET metadata = ? WHERE document_id = ?",
+                (_dumps(metadata), self.document_id),
+            )
+        return revision
+
+    def delete(self) -> None:
+        with self._transaction() as connection:
+            connection.execute(
+                "DELETE FROM documents WHERE document_id = ?", (self.document_id,)
+            )
+
+    # ------------------------------------------------------------------
+    # Cross-document queries
+    # ------------------------------------------------------------------
+    def list_documents(self) -> List[str]:
+        rows = self._connection().execute(
+            "SELECT document_id FROM documents ORDER BY document_id"
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def documents_using_asset(self, asset_id: str) -> List[str]:
+        rows = self._connection().execute(
+            "SELECT DISTINCT document_id FROM slides WHERE asset_id = ? ORDER BY document_id",
+            (asset_id,),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            connection.executescript(_SCHEMA)
+            self._local.connection = connection
+        return connection
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    @contextmanager
+    def _write(
+        self, expected_revision: Optional[int]
+    ) -> Iterator[tuple[sqlite3.Connection, int]]:
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT revision FROM documents WHERE document_id = ?",
+                (self.document_id,),
+            ).fetchone()
+            current = row[0] if row else 0
+            if expected_revision is not None and expected_revision != current:
+                raise SlideDocumentConflictError(self.path, expected_revision, current)
+            revision = current + 1
+            if row is None:
+                connection.execute(
+                    "INSERT INTO documents (document_id, revision, metadata, updated_at)"
+                    " VALUES (?, ?, '{}', ?)",
+                    (self.document_id, revision, time.time()),
+                )
+            else:
+                connection.execute(
+                    "UPDATE documents SET revision = ?, updated_at = ? WHERE document_id = ?",
+                    (revision, time.time(), self.document_id),
+                )
+            yield connection, revision
+
+    def _insert_slide(
+        self, connection: sqlite3.Connection, slide: SlidePage, position: int
+    ) -> None:
+        connection.execute(
+            "INSERT INTO slides (document_id, slide_id, position, page_number,"
+            " asset_id, asset_file, title, notes) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                self.document_id,
+                slide.slide_id,
+                position,
+                slide.page_number,
+                slide.asset_id,
+                slide.asset_file,
+                slide.title,
+                _dumps(slide.notes),
+            ),
+        )
+        connection.executemany(
+            "INSERT INTO placeholders (document_id, slide_id, position, name,"
+            " content, policy, refs) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    self.document_id,
+                    slide.slide_id,
+                    index,
+                    placeholder.name,
+                    placeholder.text,
+                    placeholder.policy,
+                    _dumps(placeholder.references),
+                )
+                for index, placeholder in enumerate(slide.placeholders)
+            ],
+        )
+
+    def _select_slides(self, where: str, params: tuple) -> List[SlidePage]:
+        connection = self._connection()
+        slide_rows = connection.execute(
+            "SELECT slide_id, page_number, asset_id, asset_file, title, notes"
+            f" FROM slides WHERE {where} ORDER BY page_number, position",
+            params,
+        ).fetchall()
+        placeholders: Dict[str, List[SlidePlaceholderContent]] = {}
+        for slide_id, name, content, policy, refs in connection.execute(
+            "SELECT slide_id, name, content, policy, refs"
+            f" FROM placeholders WHERE {where} ORDER BY slide_id, position",
+            params,
+        ):
+            placeholders.setdefault(slide_id, []).append(
+                SlidePlaceholderContent(
+                    name=name, text=content, policy=policy, references=json.loads(refs)
+                )
+            )
+        return [
+            SlidePage(
+                slide_id=slide_id,
+                page_number=page_number,
+                asset_id=asset_id,
+                asset_file=asset_file,
+                title=title,
+                placeholders=placeholders.get(slide_id, []),
+                notes=json.loads(notes),
+            )
+            for slide_id, page_number, asset_id, asset_file, title, notes in slide_rows
+        ]
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
@@ -0,0 +1,211 @@
+"""Deterministic offline LLM stub for demos, batch dry runs and tests."""
+
+from __future__ import annotations
+
+import json
+import textwrap
+from typing import Any, Dict, Iterable, List, Optional
+
+from LLM_API.data_classes import (
+    BaseResponse,
+    StructuredOutputRequest,
+    StructuredOutputResponse,
+    WebSearchResponse,
+)
+
+from .slide_library import SlideLibrary
+
+
+def extract_request_excerpt(prompt: str, *, max_width: int = 80) -> str:
+    """Return a concise summary of the user request embedded in ``prompt``."""
+
+    if not prompt:
+        return "ユーザー入力なし"
+
+    marker = "[ユーザーからのリクエスト]"
+    if marker in prompt:
+        section = prompt.split(marker, 1)[1]
+        section = section.split("[", 1)[0]
+    else:
+        section = prompt
+    section = section.strip().replace("\n", " ")
+    if not section:
+        return "ユーザー入力なし"
+    return textwrap.shorten(section, width=max_width, placeholder="…")
+
+
+class StubStructuredOutputLLM:
+    """Simple stub that mimics structured output generation for demos/tests."""
+
+    def __init__(
+        self,
+        *,
+        summary: str = "スタブ生成によるスライド概要",
+        slide_library: Optional[SlideLibrary] = None,
+    ) -> None:
+        self.summary = summary
+        self.slide_library = slide_library
+
+    # ------------------------------------------------------------------
+    # LLM compatible interface
+    # ------------------------------------------------------------------
+    def generate_content(self, request) -> BaseResponse:
+        excerpt = extract_request_excerpt(getattr(request, "prompt", ""))
+        structure = (
+            f"{excerpt}を整理した2枚構成案です。"
+            " 表紙で目的を示し、続いて要点をまとめます。"
+        )
+        return BaseResponse(text=structure, model_used="stub-text")
+
+    def generate_structured_output(
+        self, request: StructuredOutputRequest
+    ) -> StructuredOutputResponse:
+        schema_props = request.schema.get("properties", {})
+        if "slides" in schema_props:
+            return self._generate_outline_response(request)
+        return self._generate_placeholder_response(request)
+
+    def web_search(self, request) -> WebSearchResponse:  # noqa: D401 - simple stub
+        return WebSearchResponse(
+            text="スタブによる簡易Web検索サマリー",
+            model_used="stub-web",
+            citations=[],
+        )
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _generate_outline_response(
+        self, request: StructuredOutputRequest
+    ) -> StructuredOutputResponse:
+        assets = list(self.slide_library.list_assets()) if self.slide_library else []
+        excerpt = extract_request_excerpt(request.prompt)
+        slides: List[Dict[str, Any]] = []
+        if assets:
+            for idx, asset in enumerate(assets[:2], start=1):
+                slides.append(
+                    {
+                        "slide_id": f"slide_{idx:02d}",
+                        "page_number": idx,
+                        "asset_id": asset.asset_id,
+                        "title": f"{excerpt} - {asset.description[:12]}",
+                        "notes": f"スタブで選定: {asset.asset_id}",
+                    }
+                )
+        else:
+            slides.append(
+                {
+                    "slide_id": "slide_01",
+                    "page_number": 1,
+                    "asset_id": "stub_asset",
+                    "title": f"{excerpt} - 概要",
+                    "notes": "スタブで生成",
+                }
+            )
+
+        payload = {"slides": slides}
+        return StructuredOutputResponse(
+            text=json.dumps(payload, ensure_ascii=False),
+            parsed_output=payload,
+            model_used="stub-structured",
+        )
+
+    def _generate_placeholder_response(
+        self, request: StructuredOutputRequest
+    ) -> StructuredOutputResponse:
+        placeholder_names: Iterable[str] = (
+            request.schema
+            .get("properties", {})
+            .get("placeholders", {})
+            .get("items", {})
+            .get("properties", {})
+            .get("placeholder_name", {})
+            .get("enum", [])
+        )
+        user_excerpt = extract_request_excerpt(request.prompt)
+        placeholders: List[Dict[str, object]] = []
+        for name in placeholder_names:
+            text = f"{user_excerpt}に基づき、{name}の内容を整理したドラフトです。"
+            placeholders.append(
+                {
+                    "placeholder_name": name,
+                    "text": text[:200],
+                    "references": ["internal_report.md"],
+                }
+            )
+
+        parsed = {
+            "slide_summary": self.summary,
+            "citations": ["internal_report.md"],
+            "placeholders": placeholders,
+        }
+        return StructuredOutputResponse(
+            text=json.dumps(parsed, ensure_ascii=False),
+            parsed_output=parsed,
+            model_used="stub-structured",
+        )
+
+
+class MultiStageStubLLM:
+    """LLM stub that returns predefined payloads for each pipeline stage.
+
+    Structured-output requests for placeholders consume
+    ``placeholder_payloads`` in order; every request is recorded so tests
+    and benchmarks can inspect the prompts that were sent.
+    """
+
+    model_name = "stub-multistage"
+
+    def __init__(
+        self,
+        *,
+        outline_payload: Dict[str, Any],
+        placeholder_payloads: Iterable[Dict[str, Any]],
+        structure_text: str = "構成案",
+        web_search_text: str = "stub web search summary",
+    ) -> None:
+        self.outline_payload = outline_payload
+        self.placeholder_payloads = list(placeholder_payloads)
+        self.structure_text = structure_text
+        self.web_search_text = web_search_text
+        self.outline_requests: List[Any] = []
+        self.placeholder_requests: List[Any] = []
+        self.structure_requests: List[Any] = []
+        self.web_search_requests: List[Any] = []
+
+    # ------------------------------------------------------------------
+    # Planner stage
+    # ------------------------------------------------------------------
+    def generate_content(self, request: Any) -> BaseResponse:
+        self.structure_requests.append(request)
+        return BaseResponse(text=self.structure_text, model_used="stub-text")
+
+    # ------------------------------------------------------------------
+    # Outline / placeholder generation
+    # ------------------------------------------------------------------
+    def generate_structured_output(self, request: Any) -> StructuredOutputResponse:
+        if getattr(request, "schema_name", None) == "slide_outline":
+            self.outline_requests.append(request)
+            return StructuredOutputResponse(
+                text=json.dumps(self.outline_payload, ensure_ascii=False),
+                parsed_output=self.outline_payload,
+                model_used="stub-structured",
+            )
+
+        if not self.placeholder_payloads:
+            raise AssertionError("No placeholder payloads left for structured output request")
+
+        payload = self.placeholder_payloads.pop(0)
+        self.placeholder_requests.append(request)
+        return StructuredOutputResponse(
+            text=json.dumps(payload, ensure_ascii=False),
+            parsed_output=payload,
+            model_used="stub-structured",
+        )
+
+    # ------------------------------------------------------------------
+    # Web search stage
+    # ------------------------------------------------------------------
+    def web_search(self, request: Any) -> WebSearchResponse:
+        self.web_search_requests.append(request)
+        return WebSearchResponse(text=self.web_search_text, model_used="stub-web")
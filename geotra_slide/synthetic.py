@@ -0,0 +1,354 @@
+"""Seeded generators for synthetic slide libraries and documents.
+
+The bundled library only has a handful of assets, which hides scaling
+problems in manifest loading, prompt building and rendering. The helpers in
+this module build libraries of arbitrary size from python-pptx's default
+template (no proprietary data involved) and decks of arbitrary length. The
+same seed always yields the same manifests, files and documents.
+
+Command line usage::
+
+    python -m geotra_slide.synthetic output/synthetic --assets 1000 --slides 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import random
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - import guard for optional dependency
+    from pptx import Presentation
+    from pptx.oxml import parse_xml
+    from pptx.oxml.ns import nsdecls
+    from pptx.util import Emu
+except ModuleNotFoundError as exc:  # pragma: no cover - depends on environment
+    PPTX_IMPORT_ERROR = exc
+    Presentation = None  # type: ignore[assignment]
+else:  # pragma: no cover - normal runtime branch
+    PPTX_IMPORT_ERROR = None
+
+from .slide_codecs import encode_document
+from .slide_library import SlideLibrary
+from .slide_models import SlideDocument, SlidePage, SlidePlaceholderContent
+
+MASTER_TEMPLATE_FILE = "master_template.pptx"
+# Extra body placeholders added to every layout start at this idx so they never
+# collide with the placeholders python-pptx's default layouts already define.
+EXTRA_PLACEHOLDER_BASE_IDX = 100
+
+_CATEGORIES = (
+    "表紙", "アジェンダ", "会社概要", "ロードマップ", "スケジュール",
+    "課題整理", "体制図", "実績報告", "提案内容", "まとめ",
+)
+_TAGS = (
+    "プロジェクト計画", "タイムライン", "進捗報告", "KPI", "組織",
+    "予算", "リスク", "品質", "顧客", "データ活用", "業務改善", "次回予定",
+)
+_WORDS = (
+    "進捗", "課題", "対応方針", "スケジュール", "成果", "体制", "品質",
+    "コスト", "リスク", "顧客", "施策", "効果", "分析", "計画", "実績",
+    "改善", "導入", "検証", "運用", "データ",
+)
+_POLICIES = ("generate", "generate", "generate", "generate", "populate", "fixed")
+
+
+# ----------------------------------------------------------------------
+# Library generation
+# ----------------------------------------------------------------------
+
+def generate_library(
+    destination: Path,
+    asset_count: int,
+    *,
+    seed: int = 0,
+    min_placeholders: int = 1,
+    max_placeholders: int = 12,
+    image_ratio: float = 0.3,
+) -> SlideLibrary:
+    """Write a synthetic assets root under ``destination`` and load it.
+
+    The layout mirrors ``assets/``: ``templates/`` holds the master template
+    and its manifest, ``slide_library/`` holds one PPTX per asset plus
+    ``slide_library_manifest.json``. Each asset picks a layout, a placeholder
+    count in ``[min_placeholders, max_placeholders]`` and, with probability
+    ``image_ratio``, a picture that the renderer has to clone.
+    """
+
+    if PPTX_IMPORT_ERROR is not None:
+        raise RuntimeError(
+            "python-pptxのインポートに失敗しました。合成ライブラリを生成するには"
+            " 'python-pptx' パッケージをインストールしてください。"
+        ) from PPTX_IMPORT_ERROR
+    if not 1 <= min_placeholders <= max_placeholders:
+        raise ValueError("Expected 1 <= min_placeholders <= max_placeholders")
+
+    rng = random.Random(seed)
+    destination = Path(destination)
+    templates_dir = destination / "templates"
+    library_dir = destination / "slide_library"
+    templates_dir.mkdir(parents=True, exist_ok=True)
+    library_dir.mkdir(parents=True, exist_ok=True)
+
+    master_path = templates_dir / MASTER_TEMPLATE_FILE
+    layouts = _write_master_template(master_path, max_placeholders)
+    _write_json(
+        templates_dir / "master_manifest.json",
+        {
+            "master_template_file": MASTER_TEMPLATE_FILE,
+            "description": "合成ライブラリ用のマスターテンプレート。",
+            "layouts": layouts,
+        },
+    )
+
+    entries: List[Dict[str, Any]] = []
+    width = len(str(asset_count))
+    for number in range(1, asset_count + 1):
+        asset_id = f"synthetic_{number:0{width}d}"
+        layout_index = rng.randrange(len(layouts))
+        placeholder_count = rng.randint(min_placeholders, max_placeholders)
+        with_image = rng.random() < image_ratio
+        placeholders = _write_asset(
+            master_path,
+            library_dir / f"{asset_id}.pptx",
+            layout_index=layout_index,
+            placeholder_count=placeholder_count,
+            image_color=_random_color(rng) if with_image else None,
+            rng=rng,
+        )
+        category = rng.choice(_CATEGORIES)
+        entries.append(
+            {
+                "id": asset_id,
+                "file_name": f"{asset_id}.pptx",
+                "description": f"{category}のスライド。{_sentence(rng, 4, 10)}",
+                "category": category,
+                "tags": rng.sample(_TAGS, rng.randint(2, 5)),
+                "placeholders": placeholders,
+            }
+        )
+
+    _write_json(library_dir / "slide_library_manifest.json", {"slide_assets": entries})
+    return SlideLibrary(destination)
+
+
+def _write_master_template(path: Path, extra_placeholders: int) -> List[Dict[str, Any]]:
+    presentation = Presentation()
+    width, height = presentation.slide_width, presentation.slide_height
+    columns = 3
+    rows = max(1, -(-extra_placeholders // columns))
+    margin = Emu(width // 20)
+    top = Emu(height // 4)
+    cell_width = (width - 2 * margin) // columns
+    cell_height = (height - top - margin) // rows
+
+    layouts: List[Dict[str, Any]] = []
+    for layout_index, layout in enumerate(presentation.slide_layouts):
+        tree = layout.shapes._spTree
+        next_id = max(int(value) for value in tree.xpath(".//p:cNvPr/@id")) + 1
+        for offset in range(extra_placeholders):
+            row, column = divmod(offset, columns)
+            tree.append(
+                _body_placeholder_xml(
+                    shape_id=next_id + offset,
+                    idx=EXTRA_PLACEHOLDER_BASE_IDX + offset,
+                    name=f"テキスト プレースホルダー {offset + 1}",
+                    box=(
+                        margin + column * cell_width,
+                        top + row * cell_height,
+                        cell_width,
+                        cell_height,
+                    ),
+                )
+            )
+        layouts.append(
+            {
+                "layout_index": layout_index,
+                "layout_name": layout.name,
+                "placeholders": [
+                    {
+                        "name": shape.name,
+                        "type": str(shape.placeholder_format.type),
+                        "idx": shape.placeholder_format.idx,
+                    }
+                    for shape in layout.placeholders
+                ],
+            }
+        )
+    presentation.save(path)
+    return layouts
+
+
+def _body_placeholder_xml(shape_id: int, idx: int, name: str, box: Tuple[int, int, int, int]):
+    left, top, width, height = box
+    return parse_xml(
+        f"<p:sp {nsdecls('p', 'a')}>"
+        f'<p:nvSpPr><p:cNvPr id="{shape_id}" name="{name}"/>'
+        '<p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr>'
+        f'<p:nvPr><p:ph type="body" sz="quarter" idx="{idx}"/></p:nvPr></p:nvSpPr>'
+        f'<p:spPr><a:xfrm><a:off x="{left}" y="{top}"/><a:ext cx="{width}" cy="{height}"/></a:xfrm></p:spPr>'
+        '<p:txBody><a:bodyPr/><a:lstStyle/><a:p><a:endParaRPr lang="ja-JP"/></a:p></p:txBody>'
+        "</p:sp>"
+    )
+
+
+def _write_asset(
+    master_path: Path,
+    path: Path,
+    *,
+    layout_index: int,
+    placeholder_count: int,
+    image_color: Optional[Tuple[int, int, int]],
+    rng: random.Random,
+) -> List[Dict[str, Any]]:
+    presentation = Presentation(master_path)
+    slide = presentation.slides.add_slide(presentation.slide_layouts[layout_index])
+
+    placeholders: List[Dict[str, Any]] = []
+    for shape in list(slide.placeholders):
+        if len(placeholders) >= placeholder_count:
+            shape._element.getparent().remove(shape._element)
+            continue
+        description = f"{_sentence(rng, 2, 5)}を{rng.randint(10, 80)}字以内で記載"
+        shape.text_frame.text = description
+        placeholders.append(
+            {
+                "name": shape.name,
+                "idx": shape.placeholder_format.idx,
+                "description": description,
+                "edit_policy": rng.choice(_POLICIES),
+            }
+        )
+
+    if image_color is not None:
+        width, height = presentation.slide_width, presentation.slide_height
+        slide.shapes.add_picture(
+            _png_stream(image_color),
+            Emu(width * 3 // 4),
+            Emu(height // 20),
+            Emu(width // 5),
+            Emu(height // 8),
+        )
+    presentation.save(path)
+    return placeholders
+
+
+# ----------------------------------------------------------------------
+# Document generation
+# ----------------------------------------------------------------------
+
+def generate_document(
+    library: SlideLibrary,
+    slide_count: int,
+    *,
+    seed: int = 0,
+    min_words: int = 3,
+    max_words: int = 20,
+) -> SlideDocument:
+    """Return a deck of ``slide_count`` slides drawn from ``library``.
+
+    Assets are sampled uniformly (in manifest order, so the result only
+    depends on ``seed`` and the manifest) and every placeholder receives
+    ``min_words`` to ``max_words`` words of filler text.
+    """
+
+    rng = random.Random(seed)
+    assets = list(library.list_assets())
+    if not assets:
+        raise ValueError("Slide library has no assets")
+
+    slides: List[SlidePage] = []
+    for number in range(1, slide_count + 1):
+        asset = rng.choice(assets)
+        slides.append(
+            SlidePage(
+                slide_id=f"slide_{number:03d}",
+                page_number=number,
+                asset_id=asset.asset_id,
+                asset_file=asset.file_name,
+                title=_sentence(rng, 2, 4),
+                placeholders=[
+                    SlidePlaceholderContent(
+                        name=spec.name,
+                        text=_sentence(rng, min_words, max_words),
+                        policy=spec.edit_policy,
+                        references=["synthetic.md"],
+                    )
+                    for spec in asset.placeholders
+                ],
+                notes={"summary": _sentence(rng, 3, 8), "citations": ["synthetic.md"]},
+            )
+        )
+    return SlideDocument(
+        slides=slides,
+        metadata={"slide_structure": "合成デッキ", "synthetic_seed": seed},
+    )
+
+
+# ----------------------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------------------
+
+def _sentence(rng: random.Random, min_words: int, max_words: int) -> str:
+    return "・".join(rng.choice(_WORDS) for _ in range(rng.randint(min_words, max_words)))
+
+
+def _random_color(rng: random.Random) -> Tuple[int, int, int]:
+    return rng.randrange(256), rng.randrange(256), rng.randrange(256)
+
+
+def _png_stream(color: Tuple[int, int, int], size: int = 8) -> io.BytesIO:
+    """Encode a solid ``size``x``size`` RGB PNG without an imaging library."""
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    row = b"\x00" + bytes(color) * size
+    payload = (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(row * size))
+        + chunk(b"IEND", b"")
+    )
+    return io.BytesIO(payload)
+
+
+def _write_json(path: Path, payload: Dict[str, Any]) -> None:
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic slide library and deck.")
+    parser.add_argument("destination", type=Path)
+    parser.add_argument("--assets", type=int, default=100)
+    parser.add_argument("--slides", type=int, default=0, help="also write deck.json with this many slides")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-placeholders", type=int, default=1)
+    parser.add_argument("--max-placeholders", type=int, default=12)
+    parser.add_argument("--image-ratio", type=float, default=0.3)
+    args = parser.parse_args(argv)
+
+    library = generate_library(
+        args.destination,
+        args.assets,
+        seed=args.seed,
+        min_placeholders=args.min_placeholders,
+        max_placeholders=args.max_placeholders,
+        image_ratio=args.image_ratio,
+    )
+    print(f"wrote {args.assets} assets to {library.slide_library_dir}")
+    if args.slides:
+        document = generate_document(library, args.slides, seed=args.seed)
+        deck_path = Path(args.destination) / "deck.json"
+        deck_path.write_bytes(encode_document(document, "json"))
+        print(f"wrote {args.slides} slides to {deck_path}")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution utility
+    raise SystemExit(main())
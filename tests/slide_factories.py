@@ -0,0 +1,45 @@
+"""Factories for slide models shared by the model, codec and store tests."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from geotra_slide.slide_models import SlideDocument, SlidePage, SlidePlaceholderContent
+
+
+def make_placeholders() -> List[SlidePlaceholderContent]:
+    """A generated placeholder with a reference followed by a populated one."""
+
+    return [
+        SlidePlaceholderContent(name="本文", text="初期", policy="generate", references=["a.md"]),
+        SlidePlaceholderContent(name="日付", text="2025.01", policy="populate"),
+    ]
+
+
+def make_slide(
+    slide_id: str = "slide_01",
+    page_number: int = 1,
+    *,
+    title: Optional[str] = None,
+    asset_id: str = "dummy",
+    placeholders: Optional[List[SlidePlaceholderContent]] = None,
+    notes: Optional[Dict[str, Any]] = None,
+) -> SlidePage:
+    return SlidePage(
+        slide_id=slide_id,
+        page_number=page_number,
+        asset_id=asset_id,
+        asset_file=f"{asset_id}.pptx",
+        title=slide_id if title is None else title,
+        placeholders=make_placeholders() if placeholders is None else placeholders,
+        notes={"summary": "要約"} if notes is None else notes,
+    )
+
+
+def make_document(*slides: SlidePage, metadata: Optional[Dict[str, Any]] = None) -> SlideDocument:
+    """A document holding ``slides`` (one default slide when none are given)."""
+
+    return SlideDocument(slides=list(slides) or [make_slide()], metadata=dict(metadata or {}))
+
+
+__all__ = ["make_document", "make_placeholders", "make_slide"]
@@ -0,0 +1,74 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from geotra_slide.__main__ import main
+from geotra_slide.batch import BatchSettings, load_jobs, run_batch
+from geotra_slide.pipeline import JobSpec
+
+ASSETS = Path(__file__).resolve().parents[1] / "assets"
+
+
+def _write_jobs(path: Path) -> Path:
+    jobs = [
+        {"job_id": "proposal", "goal": "新製品の提案", "target_company": "ACME"},
+        {"job_id": "report", "goal": "進捗報告", "slide_structure": "1. 概要\n2. 課題"},
+    ]
+    path.write_text("\n".join(json.dumps(job, ensure_ascii=False) for job in jobs), encoding="utf-8")
+    return path
+
+
+def test_load_jobs_rejects_duplicates_and_missing_goal(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    path.write_text('{"job_id": "a", "goal": "x"}\n{"job_id": "a", "goal": "y"}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="duplicate"):
+        load_jobs(path)
+
+    path.write_text('{"job_id": "a"}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match=":1:"):
+        load_jobs(path)
+
+    assert JobSpec.from_dict({"goal": "x"}).job_id == JobSpec.from_dict({"goal": "x"}).job_id
+
+
+@pytest.mark.parametrize("job_id", ["../x", "a/b", "/abs", "..", "a\\b", "C:x"])
+def test_load_jobs_rejects_ids_that_leave_the_output_directory(tmp_path, job_id):
+    path = tmp_path / "jobs.jsonl"
+    path.write_text(json.dumps({"job_id": job_id, "goal": "x"}) + "\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="single path component"):
+        load_jobs(path)
+
+
+def test_batch_writes_outputs_and_resumes(tmp_path):
+    jobs = load_jobs(_write_jobs(tmp_path / "jobs.jsonl"))
+    settings = BatchSettings(output_dir=tmp_path / "out", assets_root=ASSETS)
+
+    summary = run_batch(jobs, settings)
+    assert summary["completed"] == 2 and summary["failed"] == 0
+    assert summary["slides"] > 0
+    for job_id in ("proposal", "report"):
+        job_dir = settings.output_dir / job_id
+        assert (job_dir / "slide.pptx").stat().st_size > 0
+        assert json.loads((job_dir / "slide.json").read_text(encoding="utf-8"))["slides"]
+        assert json.loads((job_dir / "result.json").read_text(encoding="utf-8"))["status"] == "done"
+    assert json.loads((settings.output_dir / "summary.json").read_text(encoding="utf-8")) == summary
+
+    rerun = run_batch(jobs, settings)
+    assert rerun["skipped"] == 2 and rerun["completed"] == 0
+
+    (settings.output_dir / "report" / "result.json").unlink()
+    assert run_batch(jobs, settings)["completed"] == 1
+
+
+def test_cli_runs_jobs_in_worker_processes(tmp_path, capsys):
+    jobs = _write_jobs(tmp_path / "jobs.jsonl")
+    output = tmp_path / "out"
+
+    code = main(["batch", str(jobs), "-o", str(output), "--workers", "2", "--assets", str(ASSETS)])
+
+    assert code == 0
+    assert "2 completed" in capsys.readouterr().out
+    assert (output / "proposal" / "slide.pptx").exists()
+    assert (output / "report" / "slide.pptx").exists()
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+from benchmarks.cases import build_document, default_cases
+from benchmarks.harness import BenchmarkCase, compare, measure, run_cases
+from geotra_slide.slide_library import SlideLibrary
+
+
+def test_measure_runs_setup_once_and_reports_stats():
+    calls = {"setup": 0, "func": 0}
+
+    def setup():
+        calls["setup"] += 1
+        return 3
+
+    def func(state):
+        assert state == 3
+        calls["func"] += 1
+
+    stats = measure(BenchmarkCase("noop", func, setup=setup, repeat=4, warmup=2))
+
+    assert calls == {"setup": 1, "func": 6}
+    assert stats["runs"] == 4
+    assert stats["min"] <= stats["median"] <= stats["max"]
+
+
+def test_compare_flags_only_regressions_beyond_threshold():
+    baseline = {
+        "results": {
+            "a": {"median": 1.0},
+            "b": {"median": 1.0},
+            "gone": {"median": 1.0},
+            "instant": {"median": 0.0},
+        }
+    }
+    current = {
+        "results": {
+            "a": {"median": 1.1},
+            "b": {"median": 1.5},
+            "new": {"median": 9.0},
+            "instant": {"median": 1e-7},
+        }
+    }
+
+    regressions = compare(current, baseline, max_regression=0.2)
+
+    assert [r.name for r in regressions] == ["b"]
+    assert regressions[0].ratio == 1.5
+
+
+def test_default_cases_run_against_real_assets():
+    library = SlideLibrary(Path("assets"))
+    document = build_document(library, 25)
+    assert len(document.slides) == 25
+    assert len({slide.asset_id for slide in document.slides}) == len(library.list_assets())
+
+    cases = default_cases(
+        render_sizes=(1,), generate_sizes=(2,), codec_sizes=(2,), llm_latency_s=0.0
+    )
+    report = run_cases(cases, repeat=1)
+
+    assert set(report["results"]) >= {"library.load", "render.1", "generate.2", "codec.msgpack.2"}
+    assert report["meta"]["python"]
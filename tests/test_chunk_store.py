@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from geotra_slide.chunk_store import ChunkStore, split_text
+
+
+class CountingEmbedder:
+    def __init__(self) -> None:
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[text.count("AI") + 1.0, text.count("市場") + 1.0] for text in texts]
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    stat = path.stat()
+    # mtime の分解能に依存せず変更を検出させる
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_split_text_respects_chunk_size():
+    text = "。".join(f"文{i:03d}の内容です" for i in range(100))
+    chunks = split_text(text, chunk_size=120, chunk_overlap=20)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 140 for chunk in chunks)
+    assert chunks[0].startswith("文000")
+
+
+def test_reingest_only_embeds_changed_chunks(tmp_path):
+    corpus = tmp_path / "docs"
+    (corpus / "sub").mkdir(parents=True)
+    _write(corpus / "a.md", "AIの活用事例。\n\n" + "共通の段落です。" * 5)
+    _write(corpus / "sub" / "b.md", "市場は拡大しています。")
+    (corpus / "ignored.bin").write_bytes(b"\x00")
+    embedder = CountingEmbedder()
+    store = ChunkStore(tmp_path / "chunks.sqlite3", embedder=embedder, chunk_size=40, chunk_overlap=0)
+
+    first = store.ingest(corpus)
+    assert first.added == ["a.md", "sub/b.md"]
+    ids_before = {chunk.chunk_id for chunk in store.chunks("a.md")}
+
+    second = store.ingest(corpus)
+    assert not second.changed and second.embedded_chunks == 0
+
+    _write(corpus / "a.md", "AIの新しい活用事例。\n\n" + "共通の段落です。" * 5)
+    (corpus / "sub" / "b.md").unlink()
+    third = store.ingest(corpus)
+
+    assert third.updated == ["a.md"] and third.removed == ["sub/b.md"]
+    ids_after = {chunk.chunk_id for chunk in store.chunks("a.md")}
+    # 変更されなかった段落は同じIDのまま再埋め込みされない
+    assert ids_before & ids_after
+    assert third.embedded_chunks == len(ids_after - ids_before)
+    assert store.sources() == ["a.md"]
+
+
+def test_store_persists_and_searches(tmp_path):
+    corpus = tmp_path / "docs"
+    corpus.mkdir()
+    _write(corpus / "ai.md", "AIとAIの話。")
+    _write(corpus / "market.md", "市場と市場と市場の話。")
+    ChunkStore(tmp_path / "chunks.sqlite3", embedder=CountingEmbedder()).ingest(corpus)
+
+    embedder = CountingEmbedder()
+    reopened = ChunkStore(tmp_path / "chunks.sqlite3", embedder=embedder)
+    assert not reopened.ingest(corpus).changed
+    assert embedder.calls == []
+
+    hits = reopened.search("市場市場市場", top_k=1)
+    assert [hit.source for hit in hits] == ["market.md"]
+
+
+def test_changed_chunking_settings_rebuild_the_store(tmp_path):
+    corpus = tmp_path / "docs"
+    corpus.mkdir()
+    _write(corpus / "a.md", "AIの活用事例。")
+    ChunkStore(tmp_path / "chunks.sqlite3").ingest(corpus)
+
+    rebuilt = ChunkStore(tmp_path / "chunks.sqlite3", chunk_size=100).ingest(corpus)
+    assert rebuilt.added == ["a.md"]
+
+    with pytest.raises(RuntimeError):
+        ChunkStore(tmp_path / "chunks.sqlite3", chunk_size=100).search("AI")
@@ -0,0 +1,78 @@
+import threading
+
+import pytest
+
+from LLM_API import clients
+
+
+class _Client:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def _empty_registry():
+    clients.close_clients()
+    yield
+    clients.close_clients()
+
+
+def test_clients_are_shared_per_provider_key_and_base_url():
+    first = clients.get_client("openai", "key-a", _Client)
+
+    assert clients.get_client("openai", "key-a", _Client) is first
+    assert clients.get_client("openai", "key-b", _Client) is not first
+    assert clients.get_client("openai", "key-a", _Client, base_url="http://proxy") is not first
+    assert clients.get_client("anthropic", "key-a", _Client) is not first
+    assert clients.client_count() == 4
+    assert not any("key-a" in str(key) for key in clients._clients)
+
+
+def test_concurrent_lookups_create_one_client():
+    created = []
+    barrier = threading.Barrier(8)
+
+    def factory():
+        created.append(_Client())
+        return created[-1]
+
+    def lookup(results):
+        barrier.wait()
+        results.append(clients.get_client("gemini", "key", factory))
+
+    results = []
+    threads = [threading.Thread(target=lookup, args=(results,)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(result is created[0] for result in results)
+
+
+def test_close_clients_closes_and_forgets():
+    client = clients.get_client("openai", "key", _Client)
+
+    clients.close_clients()
+
+    assert client.closed
+    assert clients.client_count() == 0
+    assert clients.get_client("openai", "key", _Client) is not client
+
+
+def test_pooled_http_client_only_overrides_the_pool_limits():
+    httpx = pytest.importorskip("httpx")
+    received = {}
+
+    class SdkHttpxClient:
+        def __init__(self, **kwargs):
+            received.update(kwargs)
+
+    assert isinstance(clients.pooled_http_client(SdkHttpxClient), SdkHttpxClient)
+    assert list(received) == ["limits"]
+    assert isinstance(received["limits"], httpx.Limits)
+    assert received["limits"].max_connections == clients.MAX_CONNECTIONS
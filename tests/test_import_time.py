@@ -0,0 +1,55 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY_MODULES = ("pytest", "numpy", "pptx", "openai", "anthropic", "google.genai", "httpx")
+
+# Generous ceilings on the cumulative import time reported by -X importtime;
+# the packages themselves import in a few milliseconds once providers, the
+# test runner and the renderer are lazy.
+IMPORT_BUDGET_S = {"geotra_slide": 0.3, "LLM_API": 0.5}
+
+
+def _import_in_subprocess(module: str):
+    script = (
+        "import json, sys\n"
+        f"import {module}\n"
+        f"print(json.dumps(sorted(name for name in {HEAVY_MODULES!r} if name in sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_us = next(
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[2].strip() == module
+    )
+    return json.loads(result.stdout), cumulative_us / 1e6
+
+
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGET_S))
+def test_package_import_is_lazy_and_within_budget(module):
+    loaded, seconds = _import_in_subprocess(module)
+
+    assert loaded == []
+    assert seconds < IMPORT_BUDGET_S[module]
+
+
+def test_lazy_exports_resolve():
+    import geotra_slide
+    import LLM_API
+
+    assert geotra_slide.SlideLibrary.__name__ == "SlideLibrary"
+    assert geotra_slide.test_runner.run_default is geotra_slide.run_default
+    with pytest.raises(AttributeError):
+        geotra_slide.missing_name
+    # Providers whose SDK is not installed resolve to None instead of raising.
+    assert LLM_API.OpenAIModel is None or LLM_API.OpenAIModel.__name__ == "OpenAIModel"
@@ -0,0 +1,111 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from geotra_slide.pipeline import JobSpec
+from geotra_slide.service import GenerationService, QueueFullError
+from geotra_slide.slide_library import SlideLibrary
+from geotra_slide.stub_llm import StubStructuredOutputLLM
+
+ASSETS = Path(__file__).resolve().parents[1] / "assets"
+
+
+class _GatedLLM:
+    """Stub client whose structured calls wait until the gate opens."""
+
+    def __init__(self, client):
+        self._client = client
+        self.gate = threading.Event()
+        self.entered = threading.Event()
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def generate_structured_output(self, request):
+        self.entered.set()
+        assert self.gate.wait(10)
+        return self._client.generate_structured_output(request)
+
+
+def _spec(job_id):
+    return JobSpec.from_dict({"job_id": job_id, "goal": "進捗報告", "slide_structure": "1. 概要"})
+
+
+def _wait(service, job_id, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while service.get(job_id).status not in ("done", "failed"):
+        assert time.monotonic() < deadline, f"job {job_id} did not finish"
+        time.sleep(0.01)
+    return service.get(job_id)
+
+
+@pytest.fixture(scope="module")
+def library():
+    return SlideLibrary(ASSETS)
+
+
+def test_service_runs_jobs_and_keeps_results(library):
+    service = GenerationService(library, StubStructuredOutputLLM(slide_library=library), workers=2)
+    try:
+        for job_id in ("a", "b"):
+            service.submit(_spec(job_id))
+        for job_id in ("a", "b"):
+            job = _wait(service, job_id)
+            assert job.status == "done"
+            assert job.result.pptx[:2] == b"PK"
+            payload = job.to_dict()
+            assert payload["slides"] == len(job.result.document.slides)
+            assert payload["slides_done"] == payload["slides_total"] == payload["slides"]
+            assert job.events[-1]["kind"] == "document_done"
+            assert "render" in payload["timings"]
+        assert service.stats()["queued"] == 0
+    finally:
+        service.shutdown()
+
+
+def test_service_rejects_jobs_when_queue_is_full(library):
+    llm = _GatedLLM(StubStructuredOutputLLM(slide_library=library))
+    service = GenerationService(library, llm, workers=1, max_queue=1)
+    try:
+        service.submit(_spec("running"))
+        assert llm.entered.wait(10)
+        service.submit(_spec("waiting"))
+        assert service.stats() == {"workers": 1, "queued": 1, "running": 1, "max_queue": 1}
+
+        with pytest.raises(QueueFullError):
+            service.submit(_spec("rejected"))
+        # Resubmitting an active job is idempotent rather than rejected.
+        assert service.submit(_spec("waiting")).status == "queued"
+        assert service.get("rejected") is None
+
+        llm.gate.set()
+        assert _wait(service, "waiting").status == "done"
+        service.submit(_spec("later"))
+        assert _wait(service, "later").status == "done"
+    finally:
+        llm.gate.set()
+        service.shutdown()
+
+
+def test_http_endpoints(library):
+    pytest.importorskip("starlette")
+    testclient = pytest.importorskip("starlette.testclient")
+    from geotra_slide.service import create_app
+
+    service = GenerationService(library, StubStructuredOutputLLM(slide_library=library))
+    with testclient.TestClient(create_app(service)) as client:
+        response = client.post("/jobs", json={"job_id": "deck", "goal": "進捗報告"})
+        assert response.status_code == 202
+        assert client.post("/jobs", json={"job_id": "x"}).status_code == 400
+        assert client.get("/jobs/missing").status_code == 404
+
+        _wait(service, "deck")
+        assert client.get("/jobs/deck").json()["status"] == "done"
+        pptx = client.get("/jobs/deck/pptx")
+        assert pptx.status_code == 200 and pptx.content[:2] == b"PK"
+        assert client.get("/jobs/deck/document").json()["slides"]
+        stream = client.get("/jobs/deck/events").text
+        assert "event: slide_done" in stream and stream.rstrip().endswith("}")
+        assert "event: done" in stream
@@ -0,0 +1,64 @@
+import codecs
+import json
+
+import pytest
+
+from geotra_slide.slide_codecs import (
+    FORMAT_VERSION,
+    JsonCodec,
+    decode_document,
+    encode_document,
+    sniff_codec,
+)
+from geotra_slide.slide_document import SlideDocumentStore
+
+from tests.slide_factories import make_document, make_slide
+
+
+def _document():
+    return make_document(make_slide(title="テスト"), metadata={"references": ["a.md"]})
+
+
+@pytest.mark.parametrize("codec", ["json", "compact-json"])
+def test_json_codecs_roundtrip(codec):
+    document = _document()
+
+    payload = encode_document(document, codec)
+    loaded = decode_document(payload)
+
+    assert json.loads(payload)["format_version"] == FORMAT_VERSION
+    assert loaded.to_dict() == document.to_dict()
+
+
+def test_decode_accepts_utf8_bom():
+    document = _document()
+    data = codecs.BOM_UTF8 + encode_document(document, "json")
+
+    assert isinstance(sniff_codec(data), JsonCodec)
+    assert decode_document(data).to_dict() == document.to_dict()
+
+
+def test_msgpack_store_roundtrip(tmp_path):
+    pytest.importorskip("msgpack")
+    store = SlideDocumentStore(tmp_path / "slide.msgpack")
+    document = _document()
+    store.save(document)
+
+    assert store.load().to_dict() == document.to_dict()
+
+
+def test_store_loads_unversioned_json(tmp_path):
+    path = tmp_path / "slide.json"
+    path.write_text(json.dumps(_document().to_dict(), ensure_ascii=False), encoding="utf-8")
+
+    loaded = SlideDocumentStore(path).load()
+
+    assert loaded.get_slide("slide_01").notes["summary"] == "要約"
+
+
+def test_decode_rejects_newer_format_version():
+    payload = _document().to_dict()
+    payload["format_version"] = FORMAT_VERSION + 1
+
+    with pytest.raises(ValueError):
+        decode_document(json.dumps(payload).encode("utf-8"))
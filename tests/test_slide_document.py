@@ -0,0 +1,102 @@
+import threading
+
+import pytest
+
+from geotra_slide.slide_document import SlideDocumentConflictError, SlideDocumentStore
+
+from tests.slide_factories import make_document
+
+
+def test_save_increments_revision_and_leaves_no_temp_files(tmp_path):
+    store = SlideDocumentStore(tmp_path / "slide.json")
+
+    assert store.current_revision() == 0
+    assert store.save(make_document()) == 1
+    assert store.save(make_document()) == 2
+
+    assert store.load().metadata["revision"] == 2
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "slide.json",
+        "slide.json.lock",
+    ]
+
+
+def test_compare_and_swap_rejects_stale_revision(tmp_path):
+    store = SlideDocumentStore(tmp_path / "slide.json")
+    store.save(make_document(), expected_revision=0)
+
+    first = store.load()
+    second = store.load()
+    first.slides[0].title = "先勝ち"
+    store.save(first, expected_revision=first.metadata["revision"])
+
+    second.slides[0].title = "後負け"
+    with pytest.raises(SlideDocumentConflictError) as excinfo:
+        store.save(second, expected_revision=second.metadata["revision"])
+
+    assert excinfo.value.actual == 2
+    assert store.load().slides[0].title == "先勝ち"
+
+
+def test_concurrent_writers_do_not_lose_updates(tmp_path):
+    path = tmp_path / "slide.json"
+    document = make_document()
+    document.metadata["counter"] = 0
+    SlideDocumentStore(path).save(document)
+
+    def worker() -> None:
+        store = SlideDocumentStore(path)
+        for _ in range(10):
+            while True:
+                current = store.load()
+                current.metadata["counter"] += 1
+                try:
+                    store.save(current, expected_revision=current.metadata["revision"])
+                    break
+                except SlideDocumentConflictError:
+                    continue
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    final = SlideDocumentStore(path).load()
+    assert final.metadata["counter"] == 40
+    assert final.metadata["revision"] == 41
+
+
+def test_failed_write_keeps_the_document_revision(tmp_path, monkeypatch):
+    from geotra_slide import slide_document
+
+    store = SlideDocumentStore(tmp_path / "slide.json")
+    document = make_document()
+    store.save(document)
+
+    def failing_write(path, payload):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(slide_document, "_atomic_write_bytes", failing_write)
+    with pytest.raises(OSError):
+        store.save(document)
+
+    assert document.metadata["revision"] == 1
+    assert store.current_revision() == 1
+
+
+def test_current_revision_does_not_decode_the_store_s_own_writes(tmp_path, monkeypatch):
+    store = SlideDocumentStore(tmp_path / "slide.json")
+    store.save(make_document())
+    other = SlideDocumentStore(tmp_path / "slide.json")
+    other.save(make_document())
+
+    decoded = []
+    monkeypatch.setattr(store.codec, "decode", lambda data: decoded.append(data) or {})
+    assert store.current_revision() == 2
+    assert decoded == []
+
+    # A file written behind the store's back is decoded instead of trusted.
+    (tmp_path / "slide.json").write_text('{"metadata": {"revision": 7}}', encoding="utf-8")
+    monkeypatch.undo()
+    assert store.current_revision() == 7
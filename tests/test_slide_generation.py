@@ -12,6 +12,7 @@ from geotra_slide.slide_document import SlideDocumentStore
 from geotra_slide.slide_generation import (
     GenerationContext,
     PlanningContext,
+    ProgressEvent,
     SlideContentGenerator,
     SlideOutlineGenerator,
     SlideStructurePlanner,
@@ -119,6 +120,19 @@ def test_multi_slide_generation_workflow(slide_library):
         "internal_report.md",
     ]
 
+    # Both slide requests share a cacheable deck prefix; the schema stays per slide.
+    first, second = stub_llm.placeholder_requests
+    prefix_chars = first.cacheable_prefix_chars
+    assert prefix_chars and prefix_chars == second.cacheable_prefix_chars
+    assert first.prompt[:prefix_chars] == second.prompt[:prefix_chars]
+    assert "[ユーザーからのリクエスト]" in first.prompt[:prefix_chars]
+    assert "slide_01" not in first.prompt[:prefix_chars]
+    assert "slide_01" in first.prompt[prefix_chars:]
+    first_enum = first.schema["properties"]["placeholders"]["items"]["properties"]["placeholder_name"]["enum"]
+    second_enum = second.schema["properties"]["placeholders"]["items"]["properties"]["placeholder_name"]["enum"]
+    assert first_enum == ["テキスト プレースホルダー 3"]
+    assert "テキスト プレースホルダー 6" in second_enum
+
     slide1 = updated_document.get_slide("slide_01")
     assert slide1 is not None
     assert slide1.notes["summary"] == "JKA向け進捗概要"
@@ -219,3 +233,158 @@ def test_placeholder_generation_enables_pptx_rendering(slide_library):
         if getattr(shape, "has_text_frame", False)
     ]
     assert any("四半期概況" in text for text in texts)
+
+
+def test_internal_document_directory_is_chunked_and_cached(slide_library, tmp_path):
+    corpus = tmp_path / "internal"
+    corpus.mkdir()
+    (corpus / "report.md").write_text("# 社内レポート\n\nJKAの進捗は順調です。", encoding="utf-8")
+    (corpus / "notes.md").write_text("次回会議では予算を確認します。", encoding="utf-8")
+    payload = {
+        "placeholders": [{"placeholder_name": "テキスト プレースホルダー 3", "text": "進捗"}]
+    }
+    stub_llm = MultiStageStubLLM(outline_payload={"slides": []}, placeholder_payloads=[payload])
+    cache_dir = tmp_path / "cache"
+    generator = SlideContentGenerator(
+        slide_library,
+        llm_client=stub_llm,
+        internal_document_path=corpus,
+        chunk_cache_dir=cache_dir,
+    )
+
+    excerpt = generator._load_internal_document("進捗")
+
+    assert "JKAの進捗は順調です。" in excerpt
+    assert "次回会議では予算を確認します。" in excerpt
+    assert sorted(path.name for path in corpus.iterdir()) == ["notes.md", "report.md"]
+    assert len(list(cache_dir.glob("*.sqlite3"))) == 1
+    assert generator.chunk_store.sources() == ["notes.md", "report.md"]
+
+    def embedder(texts):
+        return [[float(len(text))] for text in texts]
+
+    embedding = SlideContentGenerator(
+        slide_library, internal_document_path=corpus, chunk_cache_dir=cache_dir, embedder=embedder
+    )
+    assert embedding._default_chunk_store().embedder is embedder
+
+
+def test_deck_prefix_is_identical_across_slides_with_a_chunk_store(slide_library, tmp_path):
+    from geotra_slide.slide_models import SlideDocument, SlidePage
+
+    corpus = tmp_path / "internal"
+    corpus.mkdir()
+    (corpus / "schedule.md").write_text("スケジュールは来月に確定します。", encoding="utf-8")
+    (corpus / "cover.md").write_text("定例報告の目的を共有します。", encoding="utf-8")
+
+    def embedder(texts):
+        return [[text.count("スケジュール") + 0.1, text.count("目的") + 0.1] for text in texts]
+
+    document = SlideDocument(
+        slides=[
+            SlidePage(
+                slide_id="slide_01",
+                page_number=1,
+                asset_id="cover_regular_001",
+                asset_file="cover_regular_001.pptx",
+                title="定例報告の目的",
+            ),
+            SlidePage(
+                slide_id="slide_02",
+                page_number=2,
+                asset_id="schedule_001",
+                asset_file="schedule_001.pptx",
+                title="主要スケジュール",
+            ),
+        ]
+    )
+    stub_llm = MultiStageStubLLM(outline_payload={"slides": []}, placeholder_payloads=[{"placeholders": []}] * 2)
+    generator = SlideContentGenerator(
+        slide_library,
+        llm_client=stub_llm,
+        internal_document_path=corpus,
+        chunk_cache_dir=tmp_path / "cache",
+        embedder=embedder,
+    )
+
+    generator.generate_for_document(document, context=GenerationContext(user_request="定例報告"))
+
+    first, second = stub_llm.placeholder_requests
+    prefix = first.prompt[: first.cacheable_prefix_chars]
+    assert second.prompt[: second.cacheable_prefix_chars] == prefix
+    assert "[内部ドキュメント抜粋]" in prefix
+
+
+def test_generate_for_document_reports_progress(slide_library):
+    from geotra_slide.slide_models import SlideDocument, SlidePage
+
+    document = SlideDocument(
+        slides=[
+            SlidePage(
+                slide_id=f"slide_0{index}",
+                page_number=index,
+                asset_id="cover_regular_001",
+                asset_file="cover_regular_001.pptx",
+                title=f"スライド{index}",
+            )
+            for index in (1, 2)
+        ]
+    )
+    payload = {
+        "placeholders": [{"placeholder_name": "テキスト プレースホルダー 3", "text": "一枚目の本文"}]
+    }
+    # Only one payload: the second slide's LLM call fails and falls back.
+    stub_llm = MultiStageStubLLM(outline_payload={"slides": []}, placeholder_payloads=[payload])
+    generator = SlideContentGenerator(
+        slide_library, llm_client=stub_llm, internal_document_path=Path("data/internal_report.md")
+    )
+    events: list[ProgressEvent] = []
+
+    generator.generate_for_document(
+        document, context=GenerationContext(user_request="提案", target_company="ACME"), progress=events.append
+    )
+
+    kinds = [(event.kind, event.slide_id, event.index) for event in events]
+    assert kinds[0] == ("slide_started", "slide_01", 1)
+    assert ("slide_done", "slide_01", 1) in kinds
+    assert kinds.index(("slide_done", "slide_01", 1)) < kinds.index(("slide_started", "slide_02", 2))
+    assert ("error", "slide_02", 2) in kinds
+    assert kinds[-1] == ("document_done", None, 2)
+
+    filled = [e for e in events if e.kind == "placeholder_filled" and e.slide_id == "slide_01"]
+    assert any(e.placeholder == "テキスト プレースホルダー 3" and e.text == "一枚目の本文" for e in filled)
+    done = next(e for e in events if e.kind == "slide_done" and e.slide_id == "slide_01")
+    assert done.slide is document.get_slide("slide_01")
+    assert done.elapsed_ms >= 0
+    assert all(event.total == 2 for event in events)
+
+
+def test_generate_for_slide_reports_each_placeholder(slide_library):
+    from geotra_slide.slide_models import SlideDocument, SlidePage
+
+    document = SlideDocument(
+        slides=[
+            SlidePage(
+                slide_id="slide_01",
+                page_number=1,
+                asset_id="cover_regular_001",
+                asset_file="cover_regular_001.pptx",
+                title="表紙",
+            )
+        ]
+    )
+    payload = {"placeholders": [{"placeholder_name": "テキスト プレースホルダー 3", "text": "本文"}]}
+    stub_llm = MultiStageStubLLM(outline_payload={"slides": []}, placeholder_payloads=[payload])
+    generator = SlideContentGenerator(
+        slide_library, llm_client=stub_llm, internal_document_path=Path("data/internal_report.md")
+    )
+    events: list[ProgressEvent] = []
+
+    generator.generate_for_slide(
+        document, "slide_01", context=GenerationContext(user_request="提案"), progress=events.append
+    )
+
+    asset = slide_library.get_asset("cover_regular_001")
+    assert [event.placeholder for event in events] == [spec.name for spec in asset.placeholders]
+    assert all(event.kind == "placeholder_filled" for event in events)
+    assert ("テキスト プレースホルダー 3", "本文") in [(event.placeholder, event.text) for event in events]
@@ -0,0 +1,145 @@
+import pytest
+
+from geotra_slide.slide_document import SlideDocumentConflictError, SlideDocumentStore
+from geotra_slide.slide_journal import JournaledSlideDocumentStore
+from geotra_slide.slide_models import SlideDocument
+
+from tests.slide_factories import make_slide
+
+
+def _store(tmp_path, **kwargs) -> JournaledSlideDocumentStore:
+    store = JournaledSlideDocumentStore(tmp_path / "slide.json", **kwargs)
+    store.save(SlideDocument(slides=[make_slide("slide_01", 1)]))
+    return store
+
+
+def test_edits_are_replayed_on_load(tmp_path):
+    store = _store(tmp_path)
+    store.upsert_slide(make_slide("slide_02", 2))
+    store.set_placeholder_text("slide_02", "本文", "更新", references=["a.md"])
+    store.set_metadata("slide_structure", "二部構成")
+
+    document = store.load()
+
+    assert [slide.slide_id for slide in document.slides] == ["slide_01", "slide_02"]
+    placeholder = document.get_slide("slide_02").placeholders[0]
+    assert (placeholder.text, placeholder.references) == ("更新", ["a.md"])
+    assert document.metadata["slide_structure"] == "二部構成"
+    assert document.metadata["revision"] == 4
+
+
+def test_time_travel_and_undo(tmp_path):
+    store = _store(tmp_path)
+    store.set_placeholder_text("slide_01", "本文", "一回目")
+    store.set_placeholder_text("slide_01", "本文", "二回目")
+
+    assert store.load(at_seq=2).slides[0].placeholders[0].text == "一回目"
+
+    undone = store.undo()
+
+    assert undone.slides[0].placeholders[0].text == "一回目"
+    assert store.load().slides[0].placeholders[0].text == "一回目"
+    assert store.last_seq() == 4
+
+
+def test_snapshots_are_readable_and_pruning_drops_history(tmp_path):
+    store = _store(tmp_path, snapshot_every=3)
+    store.set_metadata("a", 1)
+    store.set_metadata("b", 2)
+
+    snapshot = SlideDocumentStore(tmp_path / "slide.json").load()
+    assert snapshot.metadata["journal_seq"] == 3
+    assert snapshot.metadata["b"] == 2
+
+    store.set_metadata("c", 3)
+    store.compact(prune=True)
+
+    assert store.journal_path.read_bytes() == b""
+    assert store.load().metadata["c"] == 3
+    assert store.last_seq() == 4
+    with pytest.raises(ValueError):
+        store.load(at_seq=1)
+
+
+def test_torn_tail_is_ignored_and_repaired(tmp_path):
+    store = _store(tmp_path)
+    with open(store.journal_path, "ab") as handle:
+        handle.write(b'{"seq":2,"op":"set_meta')
+
+    assert store.last_seq() == 1
+    assert store.set_metadata("ok", True) == 2
+    assert store.load().metadata["ok"] is True
+
+
+def test_compare_and_swap_uses_journal_seq(tmp_path):
+    store = _store(tmp_path)
+
+    with pytest.raises(SlideDocumentConflictError):
+        store.set_metadata("x", 1, expected_revision=0)
+    assert store.set_metadata("x", 1, expected_revision=1) == 2
+
+
+def test_placeholder_edit_for_unknown_slide_is_rejected(tmp_path):
+    store = _store(tmp_path)
+
+    with pytest.raises(KeyError):
+        store.set_placeholder_text("missing", "本文", "x")
+
+    assert store.last_seq() == 1
+    assert store.set_metadata("after", True) == 2
+    assert store.load().metadata["after"] is True
+
+
+def test_replay_skips_unreplayable_records(tmp_path):
+    store = _store(tmp_path)
+    with open(store.journal_path, "ab") as handle:
+        handle.write(
+            b'{"seq":2,"op":"set_placeholder_text","slide_id":"missing",'
+            b'"placeholder_name":"x","text":"y"}\n'
+        )
+    store.set_metadata("after", True)
+
+    document = store.load()
+
+    assert document.metadata["after"] is True
+    assert document.metadata["revision"] == 3
+
+
+def test_seq_stays_monotonic_after_another_instance_prunes(tmp_path):
+    store = _store(tmp_path)
+    other = JournaledSlideDocumentStore(tmp_path / "slide.json")
+    store.set_metadata("a", 1)
+    assert store.last_seq() == 2
+
+    other.set_metadata("b", 2)
+    other.compact(prune=True)
+
+    assert store.set_metadata("c", 3) == 4
+    document = store.load()
+    assert (document.metadata["a"], document.metadata["b"], document.metadata["c"]) == (1, 2, 3)
+
+
+def test_placeholder_edits_validate_without_replaying(tmp_path, monkeypatch):
+    store = _store(tmp_path, snapshot_every=1000)
+    store.upsert_slide(make_slide("slide_02", 2))
+    other = JournaledSlideDocumentStore(tmp_path / "slide.json")
+    other.upsert_slide(make_slide("slide_03", 3))
+
+    loads = []
+    load = JournaledSlideDocumentStore.load
+
+    def counting_load(self, **kwargs):
+        loads.append(kwargs)
+        return load(self, **kwargs)
+
+    monkeypatch.setattr(JournaledSlideDocumentStore, "load", counting_load)
+    # The other writer's upsert is picked up with a single replay.
+    store.set_placeholder_text("slide_03", "本文", "a")
+    assert len(loads) == 1
+    for index in range(20):
+        store.set_placeholder_text("slide_02", "本文", str(index))
+    with pytest.raises(KeyError):
+        store.set_placeholder_text("missing", "本文", "x")
+
+    assert len(loads) == 1
+    assert store.load().get_slide("slide_02").placeholders[0].text == "19"
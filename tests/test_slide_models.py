@@ -0,0 +1,88 @@
+from geotra_slide.slide_models import SlideDocument
+
+from tests.slide_factories import make_slide
+
+
+def test_upsert_slide_replaces_and_keeps_page_order():
+    document = SlideDocument(slides=[make_slide("slide_02", 2), make_slide("slide_01", 1)])
+
+    document.upsert_slide(make_slide("slide_03", 3))
+    document.upsert_slide(make_slide("slide_02", 2, title="更新後"))
+
+    assert [slide.slide_id for slide in document.slides] == [
+        "slide_01",
+        "slide_02",
+        "slide_03",
+    ]
+    assert document.get_slide("slide_02").title == "更新後"
+    assert document.get_slide("missing") is None
+
+
+def test_batch_defers_sorting_until_exit():
+    document = SlideDocument()
+
+    with document.batch():
+        document.upsert_slide(make_slide("slide_03", 3))
+        document.upsert_slide(make_slide("slide_01", 1))
+        assert [slide.slide_id for slide in document.slides] == ["slide_03", "slide_01"]
+        assert document.get_slide("slide_01").page_number == 1
+
+    assert [slide.slide_id for slide in document.slides] == ["slide_01", "slide_03"]
+    assert document.get_slide("slide_03") is document.slides[1]
+
+
+def test_upsert_many_matches_repeated_upserts():
+    incoming = [make_slide(f"slide_{idx:03d}", page) for idx, page in enumerate([5, 1, 3, 1, 4])]
+    expected = SlideDocument()
+    for slide in incoming:
+        expected.upsert_slide(slide)
+
+    document = SlideDocument()
+    document.upsert_many(incoming)
+
+    assert document.to_dict() == expected.to_dict()
+
+
+def test_index_survives_external_list_mutation():
+    document = SlideDocument(slides=[make_slide("slide_01", 1)])
+    assert document.get_slide("slide_01") is not None
+
+    document.slides.append(make_slide("slide_02", 2))
+    document.slides[0] = make_slide("slide_00", 1)
+
+    assert document.get_slide("slide_02").page_number == 2
+    assert document.get_slide("slide_00") is document.slides[0]
+    assert document.get_slide("slide_01") is None
+
+
+def test_same_length_in_place_edit_is_not_reported_as_missing():
+    document = SlideDocument(slides=[make_slide("slide_01", 1), make_slide("slide_02", 2)])
+    assert document.get_slide("slide_02") is not None
+
+    document.slides.pop()
+    document.slides.append(make_slide("slide_03", 3))
+
+    assert document.get_slide("slide_03") is document.slides[1]
+    document.upsert_slide(make_slide("slide_03", 3, title="更新後"))
+    assert [slide.slide_id for slide in document.slides] == ["slide_01", "slide_03"]
+    assert document.get_slide("slide_03").title == "更新後"
+
+
+def test_upsert_many_does_not_rebuild_the_index_per_slide(monkeypatch):
+    rebuilds = []
+    reindex = SlideDocument._reindex
+
+    def counting_reindex(self):
+        rebuilds.append(len(self.slides))
+        reindex(self)
+
+    monkeypatch.setattr(SlideDocument, "_reindex", counting_reindex)
+    document = SlideDocument(slides=[make_slide(f"slide_{idx:04d}", idx) for idx in range(2000)])
+    document.get_slide("slide_0000")
+
+    document.upsert_many(
+        make_slide(f"slide_{idx:04d}", idx) for idx in range(1000, 3000)
+    )
+
+    assert len(document.slides) == 3000
+    assert len(rebuilds) <= 2
@@ -0,0 +1,77 @@
+import threading
+
+import pytest
+
+from geotra_slide.slide_document import SlideDocumentConflictError
+from geotra_slide.slide_models import SlideDocument
+from geotra_slide.slide_sqlite import SqliteSlideDocumentStore
+
+from tests.slide_factories import make_slide
+
+
+def test_roundtrip_and_revisions(tmp_path):
+    store = SqliteSlideDocumentStore(tmp_path / "slides.db", "deck-a")
+    document = SlideDocument(
+        slides=[make_slide("slide_01", 1), make_slide("slide_02", 2)],
+        metadata={"slide_structure": "構成"},
+    )
+
+    assert store.save(document) == 1
+    loaded = store.load()
+
+    assert loaded.to_dict() == document.to_dict()
+    assert store.save(loaded, expected_revision=1) == 2
+    with pytest.raises(SlideDocumentConflictError):
+        store.save(document, expected_revision=1)
+
+
+def test_per_slide_reads_and_writes(tmp_path):
+    store = SqliteSlideDocumentStore(tmp_path / "slides.db", "deck-a")
+    store.save(SlideDocument(slides=[make_slide("slide_01", 1)]))
+
+    store.upsert_slide(make_slide("slide_02", 2))
+    store.set_placeholder_text("slide_02", "本文", "更新", references=["b.md"])
+    store.set_metadata("references", ["b.md"])
+
+    slide = store.load_slide("slide_02")
+    assert slide.placeholders[0].text == "更新"
+    assert slide.placeholders[0].references == ["b.md"]
+    assert [ph.name for ph in slide.placeholders] == ["本文", "日付"]
+    assert store.load().metadata == {"references": ["b.md"], "revision": 4}
+    with pytest.raises(KeyError):
+        store.set_placeholder_text("slide_02", "存在しない", "x")
+
+
+def test_documents_are_isolated_and_queryable(tmp_path):
+    store_a = SqliteSlideDocumentStore(tmp_path / "slides.db", "deck-a")
+    store_b = store_a.for_document("deck-b")
+    store_a.save(SlideDocument(slides=[make_slide("slide_01", 1, asset_id="schedule_001")]))
+    store_b.save(SlideDocument(slides=[make_slide("slide_01", 1, asset_id="agenda_001")]))
+
+    assert store_a.list_documents() == ["deck-a", "deck-b"]
+    assert store_a.documents_using_asset("agenda_001") == ["deck-b"]
+    assert store_a.load().slides[0].asset_id == "schedule_001"
+
+    store_b.delete()
+    assert store_a.documents_using_asset("agenda_001") == []
+    with pytest.raises(FileNotFoundError):
+        store_b.load()
+
+
+def test_concurrent_sessions_write_without_conflicts(tmp_path):
+    path = tmp_path / "slides.db"
+
+    def worker(index: int) -> None:
+        store = SqliteSlideDocumentStore(path, f"deck-{index}")
+        for page in range(1, 6):
+            store.upsert_slide(make_slide(f"slide_{page:02d}", page))
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    store = SqliteSlideDocumentStore(path)
+    assert store.list_documents() == [f"deck-{index}" for index in range(4)]
+    assert store.for_document("deck-3").current_revision() == 5
@@ -0,0 +1,48 @@
+import json
+
+from pptx import Presentation
+
+from geotra_slide.pptx_renderer import SlideDeckRenderer
+from geotra_slide.synthetic import generate_document, generate_library
+
+
+def test_library_is_reproducible_and_respects_bounds(tmp_path):
+    library = generate_library(
+        tmp_path / "a", 12, seed=7, min_placeholders=2, max_placeholders=5, image_ratio=0.5
+    )
+    generate_library(
+        tmp_path / "b", 12, seed=7, min_placeholders=2, max_placeholders=5, image_ratio=0.5
+    )
+
+    manifest = "slide_library/slide_library_manifest.json"
+    assert (tmp_path / "a" / manifest).read_text(encoding="utf-8") == (
+        tmp_path / "b" / manifest
+    ).read_text(encoding="utf-8")
+
+    assets = list(library.list_assets())
+    assert len(assets) == 12
+    for asset in assets:
+        assert 2 <= len(asset.placeholders) <= 5
+        assert library.asset_file_path(asset.asset_id).exists()
+    layouts = json.loads(
+        (tmp_path / "a" / "templates" / "master_manifest.json").read_text(encoding="utf-8")
+    )["layouts"]
+    assert len(layouts) > 1
+
+
+def test_generated_deck_renders_every_placeholder(tmp_path):
+    library = generate_library(tmp_path, 6, seed=1, max_placeholders=4)
+    document = generate_document(library, 15, seed=3)
+
+    assert document.to_dict() == generate_document(library, 15, seed=3).to_dict()
+    assert len(document.slides) == 15
+
+    rendered = Presentation(SlideDeckRenderer(library).render_document(document))
+    assert len(rendered.slides) == 15
+    for page, slide in zip(document.slides, rendered.slides):
+        written = {shape.placeholder_format.idx: shape.text_frame.text for shape in slide.placeholders}
+        specs = library.get_asset(page.asset_id).placeholders
+        for spec, content in zip(specs, page.placeholders):
+            # The renderer overwrites the title placeholder with the slide title.
+            expected = page.title if spec.idx == 0 else content.text
+            assert written[spec.idx] == expected
@@ -0,0 +1,116 @@
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from LLM_API import tracing
+from LLM_API.base import CallModel
+from LLM_API.data_classes import BaseRequest, BaseResponse, ProviderConfig
+from LLM_API.tracing import collect_spans, configure_tracing, span, timing_breakdown
+from geotra_slide.pptx_renderer import SlideDeckRenderer
+from geotra_slide.slide_library import SlideLibrary
+from geotra_slide.slide_models import SlideDocument, SlidePage
+
+
+@pytest.fixture(autouse=True)
+def _no_exporter():
+    configure_tracing("none")
+    yield
+    configure_tracing("none")
+
+
+class _FakeProvider(CallModel):
+    def setup_client(self):
+        self.client = object()
+
+    def _get_provider_config(self):
+        return ProviderConfig(provider_name="Fake", model_name=self.model_name)
+
+    def generate_content(self, request):
+        raw = SimpleNamespace(
+            usage=SimpleNamespace(input_tokens=4, output_tokens=3, cache_read_input_tokens=8)
+        )
+        return BaseResponse(text="ok", raw_response=raw)
+
+    def generate_structured_output(self, request):
+        raise NotImplementedError
+
+    def web_search(self, request):
+        raise NotImplementedError
+
+    def function_calling(self, request):
+        raise NotImplementedError
+
+
+def test_spans_nest_and_are_collected():
+    with collect_spans() as spans:
+        with span("outer", slide_id=None) as outer:
+            with span("inner", slide_id="slide_01"):
+                pass
+            with pytest.raises(ValueError):
+                with span("failing"):
+                    raise ValueError("boom")
+
+    assert [item.name for item in spans] == ["inner", "failing", "outer"]
+    inner, failing, _ = spans
+    assert inner.parent_id == outer.span_id
+    assert inner.trace_id == outer.trace_id
+    assert failing.error == "ValueError: boom"
+    assert tracing.current_span() is None
+
+
+def test_timing_breakdown_groups_by_name_and_slide():
+    with collect_spans() as spans:
+        with span("deck") as root:
+            for slide_id in ("slide_01", "slide_02"):
+                with span("slide", slide_id=slide_id):
+                    with span("copy", slide_id=slide_id):
+                        pass
+
+    breakdown = timing_breakdown(root, spans)
+
+    assert breakdown["total_ms"] >= breakdown["spans"]["slide"]["total_ms"]
+    assert breakdown["spans"]["slide"]["count"] == 2
+    assert breakdown["spans"]["copy"]["count"] == 2
+    assert set(breakdown["slides"]) == {"slide_01", "slide_02"}
+    json.dumps(breakdown)
+
+
+def test_provider_calls_open_spans_with_usage(tmp_path):
+    configure_tracing("jsonl", path=tmp_path / "traces.jsonl")
+    provider = _FakeProvider(model_name="fake-1")
+
+    provider.generate_content(BaseRequest(prompt="こんにちは"))
+
+    record = json.loads((tmp_path / "traces.jsonl").read_text(encoding="utf-8"))
+    assert record["name"] == "llm.generate_content"
+    assert record["attributes"]["provider"] == "_FakeProvider"
+    assert record["attributes"]["prompt_chars"] == 5
+    assert record["attributes"]["tokens.prompt_tokens"] == 12
+    assert record["attributes"]["cache_hit"] is True
+
+
+def test_render_stores_per_slide_timings():
+    library = SlideLibrary(Path("assets"))
+    asset = next(iter(library.list_assets()))
+    document = SlideDocument(
+        slides=[
+            SlidePage(
+                slide_id=f"slide_{index:02d}",
+                page_number=index,
+                asset_id=asset.asset_id,
+                asset_file=asset.file_name,
+                title="タイトル",
+            )
+            for index in (1, 2)
+        ]
+    )
+
+    with collect_spans() as spans:
+        SlideDeckRenderer(library).render_document(document)
+
+    timings = document.metadata["timings"]["render"]
+    assert set(timings["slides"]) == {"slide_01", "slide_02"}
+    assert timings["spans"]["render.copy_slide"]["count"] == 2
+    assert spans[-1].name == "render.document"
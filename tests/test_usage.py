@@ -0,0 +1,140 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from LLM_API.base import CallModel
+from LLM_API.data_classes import ProviderConfig, StructuredOutputResponse
+from LLM_API.usage import estimate_cost, extract_usage, metered, process_usage
+from geotra_slide.slide_generation import GenerationContext, SlideContentGenerator
+from geotra_slide.slide_library import SlideLibrary
+from geotra_slide.slide_models import SlideDocument, SlidePage
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (  # Anthropic
+            SimpleNamespace(
+                usage=SimpleNamespace(
+                    input_tokens=100,
+                    output_tokens=20,
+                    cache_read_input_tokens=900,
+                    cache_creation_input_tokens=0,
+                )
+            ),
+            (1000, 20, 1020, 900),
+        ),
+        (  # OpenAI Responses
+            SimpleNamespace(
+                usage=SimpleNamespace(
+                    input_tokens=1000,
+                    output_tokens=20,
+                    total_tokens=1020,
+                    input_tokens_details=SimpleNamespace(cached_tokens=512),
+                )
+            ),
+            (1000, 20, 1020, 512),
+        ),
+        (  # OpenAI Chat Completions
+            SimpleNamespace(
+                usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+            ),
+            (10, 5, 15, 0),
+        ),
+        (  # Gemini
+            SimpleNamespace(
+                usage_metadata=SimpleNamespace(
+                    prompt_token_count=50,
+                    candidates_token_count=7,
+                    total_token_count=57,
+                    cached_content_token_count=None,
+                )
+            ),
+            (50, 7, 57, 0),
+        ),
+    ],
+)
+def test_extract_usage_normalises_providers(raw, expected):
+    usage = extract_usage(raw)
+    assert (
+        usage["prompt_tokens"],
+        usage["completion_tokens"],
+        usage["total_tokens"],
+        usage["cached_tokens"],
+    ) == expected
+
+
+def test_estimate_cost_prices_cached_tokens_separately():
+    usage = {"prompt_tokens": 1_000_000, "completion_tokens": 0, "cached_tokens": 1_000_000}
+    assert estimate_cost("claude-3-5-sonnet-20241022", usage) == pytest.approx(0.3)
+    assert estimate_cost("unknown-model", usage) is None
+
+
+class _MeteredProvider(CallModel):
+    def setup_client(self):
+        self.client = object()
+
+    def _get_provider_config(self):
+        return ProviderConfig(provider_name="Metered", model_name=self.model_name)
+
+    def generate_content(self, request):
+        raise NotImplementedError
+
+    def generate_structured_output(self, request):
+        raw = SimpleNamespace(
+            usage=SimpleNamespace(
+                input_tokens=1000, output_tokens=100, input_tokens_details=SimpleNamespace(cached_tokens=0)
+            )
+        )
+        return StructuredOutputResponse(parsed_output={"placeholders": []}, raw_response=raw)
+
+    def web_search(self, request):
+        raise NotImplementedError
+
+    def function_calling(self, request):
+        raise NotImplementedError
+
+
+def test_generation_stores_usage_per_slide_and_deck():
+    library = SlideLibrary(Path("assets"))
+    asset = library.get_asset("schedule_001")
+    document = SlideDocument(
+        slides=[
+            SlidePage(
+                slide_id=slide_id,
+                page_number=index,
+                asset_id=asset.asset_id,
+                asset_file=asset.file_name,
+            )
+            for index, slide_id in enumerate(["slide_01", "slide_02"], start=1)
+        ]
+    )
+    generator = SlideContentGenerator(library, llm_client=_MeteredProvider(model_name="gpt-5"))
+    before = process_usage()["total"]["requests"]
+
+    with metered() as outer:
+        generator.generate_for_document(
+            document, context=GenerationContext(user_request="報告資料", internal_document="内部資料")
+        )
+
+    usage = document.metadata["usage"]
+    assert set(usage["content"]["slides"]) == {"slide_01", "slide_02"}
+    assert usage["content"]["slides"]["slide_01"]["prompt_tokens"] == 1000
+    assert usage["deck"]["requests"] == 2
+    assert usage["deck"]["cost_usd"] == pytest.approx(2 * (1000 * 1.25 + 100 * 10) / 1e6)
+    assert outer.total["completion_tokens"] == 200
+    assert process_usage()["total"]["requests"] == before + 2
+
+
+def test_claude_marks_the_shared_prompt_prefix_as_cacheable():
+    pytest.importorskip("anthropic")
+    from LLM_API.data_classes import StructuredOutputRequest
+    from LLM_API.providers.claude import ClaudeModel
+
+    request = StructuredOutputRequest(prompt="shared prefix\n\nslide part", cacheable_prefix_chars=15)
+    blocks = ClaudeModel._user_content(None, request)
+
+    assert [block["text"] for block in blocks] == ["shared prefix\n\n", "slide part"]
+    assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+    assert ClaudeModel._user_content(None, StructuredOutputRequest(prompt="short")) == "short"